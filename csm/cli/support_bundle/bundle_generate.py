@@ -14,11 +14,14 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import os
-import threading
+import time
+import asyncio
 import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from csm.common import comm
-from csm.common.payload import Yaml, Tar
+from csm.common.payload import Yaml
 from csm.core.blogic import const
 from datetime import datetime
 from csm.common.process import SimpleProcess
@@ -28,6 +31,94 @@ from cortx.utils.log import Log
 ERROR = "error"
 INFO = "info"
 
+class BundleCollector:
+    """
+    Collects the bundles of the components on a bounded pool of workers.
+    Every component writes into its own directory under the bundle path.
+    The directory is added to the tar of the bundle and removed as soon as
+    the component is done, while the other components are still running.
+    """
+
+    def __init__(self, bundle_id: str, node_name: str, comment: str,
+                 bundle_path: str, workers: int, command_timeout: int):
+        """
+        :param bundle_id: Unique Bundle ID of the generation process. :type:str
+        :param node_name: Name of the Node where this is running :type:str
+        :param comment: User Comment :type:str
+        :param bundle_path: Directory the components write into :type:str
+        :param workers: Number of components collected at once :type:int
+        :param command_timeout: Seconds a command may run :type:int
+        """
+        self._bundle_id = bundle_id
+        self._node_name = node_name
+        self._comment = comment
+        self._bundle_path = bundle_path
+        self._command_timeout = command_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # tarfile is not thread safe, all the writes go through one thread
+        self._tar_executor = ThreadPoolExecutor(max_workers=1)
+
+    def _collect(self, component: str, commands: List):
+        path = os.path.join(self._bundle_path, component)
+        os.makedirs(path, exist_ok=True)
+        Log.debug(f"Collecting component -> {component}")
+        start = time.monotonic()
+        results = ComponentsBundle.exc_components_cmd(commands, self._bundle_id,
+            f"{path}{os.sep}", component, self._node_name, self._comment,
+            self._command_timeout)
+        return {
+            "Status": ERROR.capitalize() if any(result["Return Code"] != 0
+                                                for result in results) else "Success",
+            "Duration": round(time.monotonic() - start, 3),
+            "Commands": results
+        }
+
+    def _add_to_tar(self, tar, path: str):
+        """
+        Add the contents of the path to the bundle directory of the tar and
+        remove them.
+        """
+        for entry in sorted(os.listdir(path)):
+            tar.add(os.path.join(path, entry),
+                    arcname=os.path.join(self._bundle_id, entry), recursive=True)
+        shutil.rmtree(path, ignore_errors=True)
+
+    async def collect(self, components: Dict[str, List], tar):
+        """
+        Run the commands of the components and add their files to the tar.
+        :param components: Commands of every component :type:dict
+        :param tar: Opened tarfile of the bundle
+        :return: Summary of every component :type:dict
+        """
+        loop = asyncio.get_event_loop()
+        pending = {loop.run_in_executor(self._executor, self._collect, component,
+                                        commands): component
+                   for component, commands in components.items()}
+        summary = {}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    component = pending.pop(future)
+                    summary[component] = future.result()
+                    Log.debug(f"Component {component} collected in "
+                              f"{summary[component]['Duration']}s")
+                    await loop.run_in_executor(self._tar_executor, self._add_to_tar,
+                        tar, os.path.join(self._bundle_path, component))
+        finally:
+            for future in pending:
+                future.cancel()
+        return summary
+
+    async def add_file(self, tar, path: str):
+        """ Add a file to the bundle directory of the tar. """
+        await asyncio.get_event_loop().run_in_executor(self._tar_executor, tar.add,
+            path, os.path.join(self._bundle_id, os.path.basename(path)))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self._tar_executor.shutdown(wait=False)
+
 class ComponentsBundle:
     """
     This class handles generation for support bundles for different components.
@@ -61,7 +152,7 @@ class ComponentsBundle:
 
     @staticmethod
     def exc_components_cmd(commands: List, bundle_id: str, path: str,
-            component: str, node_name: str, comment: str):
+            component: str, node_name: str, comment: str, timeout=None):
         """
         Executes the Command for Bundle Generation of Every Component.
         :param commands: Command of the component :type:str
@@ -71,18 +162,29 @@ class ComponentsBundle:
         :param node_name:Name of Node where the Command is being Executed
         :type:str
         :param comment: :User Comment: type:str
-        :return:
+        :param timeout: Seconds a command may run before it is killed :type:int
+        :return: Summary of every command :type:list
         """
+        results = []
         for command in commands:
             Log.debug(f"Executing command -> {command} {bundle_id} {path}")
             cmd_proc = SimpleProcess(f"{command} {bundle_id} {path}")
-            output, err, return_code = cmd_proc.run()
+            start = time.monotonic()
+            output, err, return_code = cmd_proc.run(timeout=timeout)
+            duration = time.monotonic() - start
             Log.debug(f"Command Output -> {output} {err}, {return_code}")
             if return_code != 0:
                 Log.error(f"Command Output -> {output} {err}, {return_code}")
                 ComponentsBundle.publish_log(
                     f"Bundle generation failed for {component}", ERROR,
                     bundle_id, node_name, comment)
+            results.append({
+                "Command": command,
+                "Return Code": return_code,
+                "Timed Out": bool(return_code != 0 and timeout and duration >= timeout),
+                "Duration": round(duration, 3)
+            })
+        return results
 
 
     @staticmethod
@@ -153,8 +255,6 @@ class ComponentsBundle:
 
         bundle_path = os.path.join(path, bundle_id)
         os.makedirs(bundle_path)
-        # Start Execution for each Component Command.
-        threads = []
         command_files_info = support_bundle_config.get("COMMANDS")
         # OS Logs are specifically generated hence here Even When All is Selected O.S. Logs Will Be Skipped.
         if components:
@@ -165,46 +265,13 @@ class ComponentsBundle:
                 components_list.remove(const.SOS_COMP)
         Log.debug(
             f"Generating for {const.SB_COMPONENTS} {' '.join(components_list)}")
+        components_commands = {}
         for each_component in components_list:
-            components_commands = []
-            components_files = command_files_info[each_component]
-            for file_path in components_files:
+            for file_path in command_files_info[each_component]:
                 file_data = Yaml(file_path).load()
-                if file_data:
-                    components_commands = file_data.get(const.SUPPORT_BUNDLE.lower(), [])
-                if components_commands:
-                    thread_obj = threading.Thread(
-                        ComponentsBundle.exc_components_cmd(components_commands,
-                            bundle_id, f"{bundle_path}{os.sep}", each_component,
-                            node_name, comment))
-                    thread_obj.start()
-                    Log.debug(f"Started thread -> {thread_obj.ident}  Component -> {each_component}")
-                    threads.append(thread_obj)
-        directory_path = Conf.get(const.CSM_GLOBAL_INDEX,
-                                  f"{const.SUPPORT_BUNDLE}>{const.SB_BUNDLE_PATH}")
-        tar_file_name = os.path.join(directory_path,
-                                     f"{bundle_id}_{node_name}.tar.gz")
-        # Create Summary File for Tar.
-        summary_file_path = os.path.join(bundle_path, "summary.yaml")
-        Log.debug(f"Adding summary file at {summary_file_path}")
-        summary_data = {
-            const.SB_BUNDLE_ID: str(bundle_id),
-            const.SB_NODE_NAME: str(node_name),
-            const.SB_COMMENT: repr(comment),
-            "Generated Time": str(datetime.isoformat(datetime.now()))
-        }
-        try:
-            Yaml(summary_file_path).dump(summary_data)
-        except PermissionError as e:
-            ComponentsBundle.publish_log(f"Permission denied for creating summary file {e}",
-                                         ERROR, bundle_id, node_name, comment)
-            return None
-        except Exception as e:
-            ComponentsBundle.publish_log(f"{e}", ERROR, bundle_id, node_name,
-                comment)
-            return None
-
-        Log.debug(f'Summary file created')
+                if file_data and file_data.get(const.SUPPORT_BUNDLE.lower()):
+                    components_commands.setdefault(each_component, []).extend(
+                        file_data[const.SUPPORT_BUNDLE.lower()])
         symlink_path = Conf.get(const.CSM_GLOBAL_INDEX,
             f"{const.SUPPORT_BUNDLE}>{const.SB_SYMLINK_PATH}")
         if os.path.exists(symlink_path):
@@ -214,18 +281,51 @@ class ComponentsBundle:
                 Log.warn(const.PERMISSION_ERROR_MSG.format(path = symlink_path))
         os.makedirs(symlink_path, exist_ok = True)
 
-        # Wait Until all the Threads Execution is not Complete.
-        for each_thread in threads:
-            Log.debug(
-                f"Waiting for thread - {each_thread.ident} to complete process")
-            each_thread.join(timeout=1800)
+        directory_path = Conf.get(const.CSM_GLOBAL_INDEX,
+                                  f"{const.SUPPORT_BUNDLE}>{const.SB_BUNDLE_PATH}")
+        tar_file_name = os.path.join(directory_path,
+                                     f"{bundle_id}_{node_name}.tar.gz")
+        collector = BundleCollector(bundle_id, node_name, comment, bundle_path,
+            int(Conf.get(const.CSM_GLOBAL_INDEX,
+                         f"{const.SUPPORT_BUNDLE}>{const.SB_COLLECTION_WORKERS}",
+                         const.DEFAULT_SB_COLLECTION_WORKERS)),
+            int(Conf.get(const.CSM_GLOBAL_INDEX,
+                         f"{const.SUPPORT_BUNDLE}>{const.SB_COMMAND_TIMEOUT}",
+                         const.DEFAULT_SB_COMMAND_TIMEOUT)))
         try:
+            # The files of every component are added as soon as it is done.
             Log.debug(f"Generating tar.gz file on path {tar_file_name} from {bundle_path}")
-            Tar(tar_file_name).dump([bundle_path])
+            with tarfile.open(tar_file_name, "w:gz") as tar:
+                tar.add(bundle_path, arcname=bundle_id, recursive=False)
+                components_summary = await collector.collect(components_commands, tar)
+                # Create Summary File for Tar.
+                summary_file_path = os.path.join(bundle_path, "summary.yaml")
+                Log.debug(f"Adding summary file at {summary_file_path}")
+                summary_data = {
+                    const.SB_BUNDLE_ID: str(bundle_id),
+                    const.SB_NODE_NAME: str(node_name),
+                    const.SB_COMMENT: repr(comment),
+                    "Generated Time": str(datetime.isoformat(datetime.now())),
+                    "Components": components_summary
+                }
+                try:
+                    Yaml(summary_file_path).dump(summary_data)
+                except PermissionError as e:
+                    ComponentsBundle.publish_log(f"Permission denied for creating summary file {e}",
+                                                 ERROR, bundle_id, node_name, comment)
+                    return None
+                except Exception as e:
+                    ComponentsBundle.publish_log(f"{e}", ERROR, bundle_id, node_name,
+                        comment)
+                    return None
+                Log.debug(f'Summary file created')
+                await collector.add_file(tar, summary_file_path)
         except Exception as e:
             ComponentsBundle.publish_log(f"Could not generate tar file {e}", ERROR, bundle_id,
                                          node_name, comment)
             return None
+        finally:
+            collector.close()
         try:
             Log.debug("Create soft-link for generated tar.")
             os.symlink(tar_file_name, os.path.join(symlink_path,
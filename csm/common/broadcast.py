@@ -0,0 +1,158 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import json
+from aiohttp import WSCloseCode
+from cortx.utils.log import Log
+
+
+class BroadcastClient:
+    """
+    Websocket client of WebSocketBroadcaster with its own bounded send queue.
+    """
+
+    def __init__(self, ws, topics, queue_size):
+        """
+        :param ws: Prepared aiohttp WebSocketResponse
+        :param topics: Set of topics the client receives, None for all of them
+        :param queue_size: Maximum number of messages waiting to be sent
+        """
+        self.ws = ws
+        self.topics = topics
+        self.queue = asyncio.Queue(queue_size)
+        self.sent = 0
+        self.dropped = 0
+        self.task = None
+
+    def wants(self, topic):
+        return self.topics is None or topic in self.topics
+
+
+class WebSocketBroadcaster:
+    """
+    Fans messages out to the connected websocket clients.
+
+    A message is serialized once and put into the send queue of every client
+    subscribed to its topic. The queues are drained by a task per client, so
+    a slow client only delays its own messages. When the queue of a client
+    is full, the oldest message is dropped or, with the disconnect policy,
+    the client is disconnected.
+    """
+
+    POLICY_DROP = 'drop'
+    POLICY_DISCONNECT = 'disconnect'
+
+    def __init__(self, queue_size=256, policy=POLICY_DROP, serializer=json.dumps):
+        """
+        :param queue_size: Maximum number of messages queued per client
+        :param policy: What to do with a client whose queue is full, drop or disconnect
+        :param serializer: Function that converts a message to a string
+        """
+        if policy not in (self.POLICY_DROP, self.POLICY_DISCONNECT):
+            raise ValueError(f"Invalid slow client policy: {policy}")
+        self._queue_size = queue_size
+        self._policy = policy
+        self._serializer = serializer
+        self._clients = set()
+        self._dropped = 0
+        self._disconnected = 0
+
+    def __len__(self):
+        return len(self._clients)
+
+    def add_client(self, ws, topics=None) -> BroadcastClient:
+        """
+        Start sending the broadcast messages to the websocket.
+        :param ws: Prepared aiohttp WebSocketResponse
+        :param topics: Iterable of topics the client receives, all of them if omitted
+        :returns: Client to be passed to remove_client()
+        """
+        client = BroadcastClient(ws, set(topics) if topics else None, self._queue_size)
+        client.task = asyncio.ensure_future(self._drain(client))
+        self._clients.add(client)
+        return client
+
+    async def remove_client(self, client: BroadcastClient):
+        """
+        Stop sending the broadcast messages to the client.
+        """
+        if client not in self._clients:
+            return
+        self._clients.discard(client)
+        client.task.cancel()
+        Log.debug(f"Websocket client removed, sent: {client.sent}, "
+                  f"dropped: {client.dropped}")
+
+    def broadcast(self, msg, topic):
+        """
+        Queue the message for sending to the clients subscribed to the topic.
+        :param msg: Message to be serialized
+        :param topic: Topic of the message
+        """
+        data = None
+        for client in list(self._clients):
+            if not client.wants(topic):
+                continue
+            if data is None:
+                data = self._serializer(msg)
+            if client.queue.full():
+                client.dropped += 1
+                self._dropped += 1
+                if self._policy == self.POLICY_DISCONNECT:
+                    asyncio.ensure_future(self._disconnect(client))
+                    continue
+                client.queue.get_nowait()
+            client.queue.put_nowait(data)
+
+    async def _disconnect(self, client):
+        if client not in self._clients:
+            return
+        Log.warn(f"Websocket client is too slow, disconnecting. "
+                 f"Queued messages: {client.queue.qsize()}")
+        self._disconnected += 1
+        await self.remove_client(client)
+        await client.ws.close(code=WSCloseCode.TRY_AGAIN_LATER,
+                              message=b'Client is too slow')
+
+    async def _drain(self, client):
+        while True:
+            data = await client.queue.get()
+            try:
+                await client.ws.send_str(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Log.debug(f"Websocket send error: {e}")
+                self._clients.discard(client)
+                return
+            client.sent += 1
+
+    def stats(self) -> dict:
+        """
+        :returns: Number of clients, queued messages and dropped messages
+        """
+        depths = [client.queue.qsize() for client in self._clients]
+        return {
+            "clients": len(depths),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped": self._dropped,
+            "disconnected": self._disconnected
+        }
+
+    async def close(self):
+        for client in list(self._clients):
+            await self.remove_client(client)
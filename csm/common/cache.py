@@ -0,0 +1,72 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import time
+from collections import OrderedDict
+
+
+class TtlCache:
+    """
+    Dictionary-like cache whose entries expire ttl seconds after they are put.
+    At most max_size entries are kept, the least recently used ones are
+    dropped first.
+    """
+
+    def __init__(self, ttl, max_size=1024):
+        """
+        :param ttl: Time in seconds an entry is kept, 0 disables the cache
+        :param max_size: Maximum number of entries
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        # key -> (value, expiry time), least recently used first
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Get the cached value of the key.
+        :return: The value or default if there is none or it has expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        if self._ttl <= 0:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, match=None):
+        """
+        Drop cached entries, all of them if match is omitted.
+        :param match: Predicate called with a key, the entry is dropped if it returns True
+        :return: None
+        """
+        if match is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if match(key)]:
+            del self._entries[key]
@@ -20,6 +20,8 @@ import getpass
 import time
 import shutil
 import errno
+import subprocess
+import tempfile
 from paramiko.ssh_exception import SSHException
 from csm.common.payload import *
 from cortx.utils.log import Log
@@ -28,13 +30,22 @@ from csm.core.blogic import const
 from csm.common.errors import CsmError
 import pika
 import json
+from pika.adapters.asyncio_connection import AsyncioConnection
 from pika.exceptions import AMQPConnectionError, AMQPError, ChannelClosedByBroker, \
     ChannelWrongStateError
+import asyncio
 from abc import ABC, ABCMeta, abstractmethod
 from functools import partial
 import random
 from cortx.utils.message_bus import MessageBus, MessageProducer, MessageConsumer
 
+# Bytes read at once from the output of a command streamed over a channel
+STREAM_CHUNK_SIZE = 64 * 1024
+# Header counting how many times a message was returned to its queue
+RETRY_HEADER = 'x-retry'
+# Seconds recv_stream waits for output before it reads the error output
+STREAM_POLL_TIMEOUT = 0.1
+
 class Channel(metaclass=ABCMeta):
     """ Abstract class to represent a comm channel to a node """
 
@@ -66,6 +77,9 @@ class Channel(metaclass=ABCMeta):
     def recv_file(self, remote_file, local_file):
         raise Exception('recv_file not implemented in Channel class') 
     
+    def recv_stream(self, command, stream, callback=None):
+        raise Exception('recv_stream not implemented for Channel class')
+
     def acknowledge(self, delivery_tag=None):
         raise Exception('acknowledge not implemented for Channel class')
 
@@ -165,9 +179,138 @@ class SSHChannel(Channel):
             Log.exception(e)
             raise CsmError(-1, '%s' %e)
 
+    def recv_stream(self, command, stream, callback=None):
+        """
+        Execute the command at node and write its output to the stream while
+        it is received, e.g. 'tar czf - <files>' into a local file.
+        :param command: Command to execute at node
+        :param stream: Binary file object the output is written to
+        :param callback: Called with the number of bytes of every chunk written
+        :return: Exit status and error output of the command
+        """
+        try:
+            channel = self._ssh.get_transport().open_session()
+            # Error output is read while waiting for the output, so a command
+            # writing a lot of it can not stall on a full channel window
+            channel.settimeout(STREAM_POLL_TIMEOUT)
+            channel.exec_command(command)
+            errors = []
+            while True:
+                while channel.recv_stderr_ready():
+                    errors.append(channel.recv_stderr(STREAM_CHUNK_SIZE))
+                try:
+                    data = channel.recv(STREAM_CHUNK_SIZE)
+                except socket.timeout:
+                    continue
+                if not data:
+                    break
+                stream.write(data)
+                if callback: callback(len(data))
+            channel.settimeout(None)
+            while True:
+                data = channel.recv_stderr(STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                errors.append(data)
+            rc = channel.recv_exit_status()
+            error = b''.join(errors)
+            channel.close()
+            Log.debug('$ %s\nrc=%s %s' %(command, rc, error))
+        except IOError as e:
+            Log.exception(e)
+            raise CsmError(errno.EIO, '%s' %e)
+        except Exception as e:
+            Log.exception(e)
+            raise CsmError(-1, '%s' %e)
+        return rc, error.decode('utf-8', 'replace')
+
     def acknowledge(self, delivery_tag=None):
         raise Exception('acknowledge not implemented for SSH Channel')
 
+class LoopbackChannel(Channel):
+    """
+    Channel to the local node with the interface of SSHChannel.
+    Commands are run by the local shell, so the node CSM runs on can be
+    handled like the remote ones without a SSH connection to itself.
+    """
+    def __init__(self, node='localhost', user=None, **args):
+        super(LoopbackChannel, self).__init__()
+        self._node = node
+        self._user = user or getpass.getuser()
+
+    def init(self):
+        raise Exception('init not implemented for Loopback Channel')
+
+    def connect(self):
+        Log.debug('node=%s user=%s (loopback)' %(self._node, self._user))
+        return 0
+
+    def disconnect(self):
+        pass
+
+    def execute(self, command, **kwargs):
+        """ Execute the command at local node """
+        try:
+            proc = subprocess.run(command, shell=True, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, timeout=kwargs.get("timeout", None))
+        except Exception as e:
+            Log.exception(e)
+            raise CsmError(-1, '%s' %e)
+        rc = proc.returncode
+        output = proc.stdout if rc == 0 else proc.stderr.decode('utf-8', 'replace')
+        Log.debug('$ %s\n%s' %(command, output))
+        return rc, output
+
+    def send(self, message):
+        raise Exception('send not implemented for Loopback Channel')
+
+    def recv(self, message=None):
+        raise Exception('recv not implemented for Loopback Channel')
+
+    def recv_file(self, remote_file, local_file):
+        """ Get a file from node """
+        try:
+            shutil.copyfile(remote_file, local_file)
+        except Exception as e:
+            Log.exception(e)
+            raise CsmError(-1, '%s' %e)
+
+    def send_file(self, local_file, remote_file):
+        """ Put a file in node """
+        try:
+            shutil.copyfile(local_file, remote_file)
+        except Exception as e:
+            Log.exception(e)
+            raise CsmError(-1, '%s' %e)
+
+    def recv_stream(self, command, stream, callback=None):
+        """
+        Execute the command at local node and write its output to the stream
+        while it is produced, same as SSHChannel.recv_stream.
+        """
+        try:
+            # Error output goes to a file, so a full pipe can not stall the command
+            with tempfile.TemporaryFile() as stderr, \
+                    subprocess.Popen(command, shell=True, stdout=subprocess.PIPE,
+                                     stderr=stderr) as proc:
+                while True:
+                    data = proc.stdout.read1(STREAM_CHUNK_SIZE)
+                    if not data:
+                        break
+                    stream.write(data)
+                    if callback: callback(len(data))
+                rc = proc.wait()
+                stderr.seek(0)
+                error = stderr.read()
+            Log.debug('$ %s\nrc=%s %s' %(command, rc, error))
+        except Exception as e:
+            Log.exception(e)
+            raise CsmError(-1, '%s' %e)
+        return rc, error.decode('utf-8', 'replace')
+
+    def acknowledge(self, delivery_tag=None):
+        raise Exception('acknowledge not implemented for Loopback Channel')
+
 class AmqpChannel(Channel):
     """
     Represents Amqp channel to a node for communication
@@ -277,15 +420,22 @@ class AmqpChannel(Channel):
                 Log.exception(err)
                 raise CsmError(-1, f'{err}')
 
+    def _get_parameters(self):
+        """
+        Connection parameters of all the RMQ hosts in random order.
+        """
+        ampq_hosts = [f'amqp://{self.username}:{self.password}@{host}/{self.virtual_host}'\
+            for host in self.hosts]
+        ampq_hosts = [pika.URLParameters(host) for host in ampq_hosts]
+        random.shuffle(ampq_hosts)
+        return ampq_hosts
+
     def connect(self):
         """
         Initiate the connection with RMQ and open the necessary communication channel.
         """
         try:
-            ampq_hosts = [f'amqp://{self.username}:{self.password}@{host}/{self.virtual_host}'\
-                for host in self.hosts]
-            ampq_hosts = [pika.URLParameters(host) for host in ampq_hosts]
-            random.shuffle(ampq_hosts)
+            ampq_hosts = self._get_parameters()
             self._connection = pika.BlockingConnection(ampq_hosts)
             self._channel = self._connection.channel()
         except self.connection_exceptions as e:
@@ -341,13 +491,204 @@ class AmqpChannel(Channel):
     def send_file(self, local_file, remote_file):
         raise Exception('send_file not implemented for AMQP Channel')
 
-    def acknowledge(self, delivery_tag=None):
+    def acknowledge(self, delivery_tag=None, multiple=False):
         try:
-            self._channel.basic_ack(delivery_tag=delivery_tag)
+            self._channel.basic_ack(delivery_tag=delivery_tag, multiple=multiple)
         except self.connection_exceptions as e:
             Log.error(self.connection_error_msg.format(repr(e)))
             self.init()
-            self.acknowledge(delivery_tag)
+            self.acknowledge(delivery_tag, multiple)
+
+    def reject(self, delivery_tag=None, multiple=False, requeue=True):
+        """
+        Negatively acknowledge the message(s) and return them to the queue.
+        With requeue=False they are dropped, or dead-lettered if the queue
+        has a dead letter exchange.
+        """
+        try:
+            self._channel.basic_nack(delivery_tag=delivery_tag, multiple=multiple,
+                                     requeue=requeue)
+        except self.connection_exceptions as e:
+            Log.error(self.connection_error_msg.format(repr(e)))
+
+    def retry(self, delivery_tag, body, properties, retries):
+        """
+        Publish the message again to the tail of the queue with the number
+        of retries in its RETRY_HEADER, then acknowledge the delivery.
+        If publishing fails the delivery stays unacknowledged and is delivered
+        again after reconnecting.
+        """
+        headers = dict(getattr(properties, 'headers', None) or {})
+        headers[RETRY_HEADER] = retries
+        try:
+            self._channel.basic_publish(exchange='', routing_key=self.exchange_queue,
+                body=body, properties=pika.BasicProperties(headers=headers,
+                    delivery_mode=getattr(properties, 'delivery_mode', None)))
+            self._channel.basic_ack(delivery_tag=delivery_tag)
+        except self.connection_exceptions as e:
+            Log.error(self.connection_error_msg.format(repr(e)))
+
+    @staticmethod
+    def retries(properties):
+        """
+        Number of times the delivered message was published again by retry().
+        """
+        headers = getattr(properties, 'headers', None) or {}
+        return int(headers.get(RETRY_HEADER, 0))
+
+class AsyncAmqpChannel(AmqpChannel):
+    """
+    Amqp channel driven by the asyncio event loop.
+    The connection is opened with pika's AsyncioConnection, so deliveries and
+    acknowledgements are handled on the loop itself without blocking it.
+    """
+
+    def __init__(self, **kwargs):
+        AmqpChannel.__init__(self, **kwargs)
+        self._loop = None
+        self._closed = None
+        self._pending = set()
+
+    async def init_async(self, loop):
+        """
+        Asyncio counterpart of init.
+        Establish connection with Rabbit-MQ server on the given loop.
+        """
+        self._loop = loop
+        self._connection = None
+        self._channel = None
+        retry_count = 0
+        while not(self._connection and self._channel) and \
+            int(self.retry_counter) > retry_count:
+            await self._connect_async()
+            if not (self._connection and self._channel):
+                Log.warn(f"RMQ Connection Failed. Retry Attempt: {retry_count+1}" \
+                    f" in {2**retry_count} seconds")
+                await asyncio.sleep(2**retry_count)
+                retry_count += 1
+            else:
+                Log.debug(f"RMQ connection is Initialized. Attempts:{retry_count+1}")
+        if self._connection and self._channel:
+            try:
+                await self._declare_exchange_and_queue_async()
+            except AMQPError as err:
+                Log.error(f'CSM Fails to initialize the queue. Details: {err}')
+                self.disconnect()
+                raise CsmError(-1, f'{err}')
+
+    def _call(self, method, *args, callback_name='callback', **kwargs):
+        """
+        Calls an asynchronous pika method and returns a future resolved by its
+        completion callback. The future fails if the connection is closed in
+        the meantime.
+        """
+        future = self._loop.create_future()
+        def on_done(result):
+            self._pending.discard(future)
+            if not future.done():
+                future.set_result(result)
+        kwargs[callback_name] = on_done
+        method(*args, **kwargs)
+        self._pending.add(future)
+        return future
+
+    async def _connect_async(self):
+        """
+        Asyncio counterpart of connect. The hosts are tried one by one.
+        """
+        for parameters in self._get_parameters():
+            self._closed = self._loop.create_future()
+            opened = self._loop.create_future()
+            def on_open(connection, opened=opened):
+                if not opened.done():
+                    opened.set_result(connection)
+            def on_open_error(connection, err, opened=opened):
+                if not opened.done():
+                    opened.set_exception(AMQPConnectionError(err))
+            try:
+                AsyncioConnection(parameters, on_open_callback=on_open,
+                                  on_open_error_callback=on_open_error,
+                                  on_close_callback=self._on_connection_closed,
+                                  custom_ioloop=self._loop)
+                self._connection = await opened
+                self._channel = await self._call(self._connection.channel,
+                                                 callback_name='on_open_callback')
+                self._channel.add_on_close_callback(self._on_channel_closed)
+                return
+            except self.connection_exceptions as e:
+                Log.error(self.connection_error_msg.format(repr(e)))
+                self._connection = None
+                self._channel = None
+
+    def _on_connection_closed(self, connection, reason):
+        self._channel = None
+        self._connection = None
+        for future in self._pending:
+            if not future.done():
+                future.set_exception(AMQPConnectionError(reason))
+        self._pending.clear()
+        if self._closed and not self._closed.done():
+            self._closed.set_result(reason)
+
+    def _on_channel_closed(self, channel, reason):
+        """
+        Channel is closed by the broker (e.g. on a failed declaration).
+        The connection is closed as well, so that consumers see a single event.
+        """
+        if self._connection and not (self._connection.is_closing or \
+                self._connection.is_closed):
+            self._connection.close()
+
+    async def _declare_exchange_and_queue_async(self):
+        await self._call(self._channel.exchange_declare, exchange=self.exchange,
+                         exchange_type=self.exchange_type, durable=self.durable)
+        await self._call(self._channel.queue_declare, queue=self.exchange_queue,
+                         exclusive=self.exclusive, durable=self.durable)
+        await self._call(self._channel.queue_bind, exchange=self.exchange,
+                         queue=self.exchange_queue, routing_key=self.routing_key)
+        Log.info(f'Initialized Exchange: {self.exchange}, '
+                f'Queue: {self.exchange_queue}, routing_key: {self.routing_key}')
+
+    async def consume_async(self, on_message, prefetch_count):
+        """
+        Start consuming the queue.
+        :param on_message: Called on the loop with delivery tag, body and
+        properties of each message.
+        :param prefetch_count: Maximum number of unacknowledged messages.
+        """
+        await self._call(self._channel.basic_qos, prefetch_count=prefetch_count)
+        await self._call(self._channel.basic_consume, self.exchange_queue,
+                         lambda ch, method, properties, body: \
+                            on_message(method.delivery_tag, body, properties),
+                         consumer_tag=const.CONSUMER_TAG)
+
+    async def wait_closed(self):
+        """
+        Waits until the connection is closed and returns the reason.
+        """
+        return await self._closed
+
+    def disconnect(self):
+        """
+        Disconnect the connection, closing is completed by the loop.
+        """
+        try:
+            if self._connection and not self._loop.is_closed() and \
+                    not (self._connection.is_closing or self._connection.is_closed):
+                Log.info("Closing AsyncAmqpChannel's RabbitMQ connection.")
+                self._connection.close()
+        except Exception as e:
+            Log.error(f"Error closing RabbitMQ connection. {e}")
+
+    def acknowledge(self, delivery_tag=None, multiple=False):
+        """
+        Unacknowledged messages are delivered again after reconnecting, so
+        connection errors are only logged here.
+        """
+        try:
+            self._channel.basic_ack(delivery_tag=delivery_tag, multiple=multiple)
+        except self.connection_exceptions as e:
+            Log.error(self.connection_error_msg.format(repr(e)))
 
 class FILEChannel(Channel):
     def __init__(self, *args, **kwargs):
@@ -476,6 +817,11 @@ class Comm(metaclass=ABCMeta):
         raise Exception('acknowledge not implemented in Comm class') 
 
 class AmqpComm(Comm):
+    # Seconds a message that could not be stored waits before it is returned
+    # to the queue by recv_async, and how many times it is returned at most.
+    REQUEUE_DELAY = 1
+    MAX_REQUEUES = 5
+
     def __init__(self):
         Comm.__init__(self)
         self._inChannel = AmqpChannel()
@@ -483,6 +829,11 @@ class AmqpComm(Comm):
         self.plugin_callback = None
         self.delivery_tag = None
         self._is_disconnect = False
+        self._batch = []
+        self._batch_size = 1
+        self._flush_interval = 0
+        self._flush_timer = None
+        self._asyncInChannel = None
 
     def init(self):
         self._inChannel.init()
@@ -506,8 +857,71 @@ class AmqpComm(Comm):
         self.delivery_tag = method.delivery_tag
         self.plugin_callback(body)
 
-    def acknowledge(self):
-        self._inChannel.acknowledge(self.delivery_tag)
+    def _batch_callback(self, ct, ch, method, properties, body):
+        """
+        Callback used by recv_batch. Collects the received messages and hands
+        them over to the plugin either when batch_size messages are collected
+        or when flush_interval seconds elapse since the first one arrived.
+        """
+        self._batch.append((method.delivery_tag, body, properties))
+        if len(self._batch) >= self._batch_size:
+            self._flush_batch()
+        elif self._flush_timer is None:
+            self._flush_timer = self._inChannel.connection().call_later(
+                self._flush_interval, self._on_flush_timer)
+
+    def _on_flush_timer(self):
+        self._flush_timer = None
+        self._flush_batch()
+
+    def _flush_batch(self):
+        """
+        Passes the collected messages to the plugin. It runs on the consumer
+        thread, so no new message is delivered until the batch is settled.
+        """
+        if self._flush_timer is not None:
+            self._inChannel.connection().remove_timeout(self._flush_timer)
+            self._flush_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            results = self.plugin_callback([body for _, body, _ in batch])
+            self._settle_batch(batch, results)
+
+    def _settle_batch(self, batch, results):
+        """
+        Acknowledges the messages the plugin is done with, one at a time
+        unless the whole batch is. The others are returned to the queue after
+        REQUEUE_DELAY seconds, at most MAX_REQUEUES times, like in recv_async.
+        """
+        if all(results):
+            self._inChannel.acknowledge(batch[-1][0], multiple=True)
+            return
+        failed = []
+        for (delivery_tag, body, properties), done in zip(batch, results):
+            if done:
+                self._inChannel.acknowledge(delivery_tag)
+                continue
+            retries = AmqpChannel.retries(properties) + 1
+            if retries > self.MAX_REQUEUES:
+                Log.error(f"Dropping message not processed after {self.MAX_REQUEUES} "
+                          f"redeliveries")
+                self._inChannel.reject(delivery_tag, requeue=False)
+            else:
+                failed.append((delivery_tag, body, properties, retries))
+        if failed:
+            Log.warn(f"Returning {len(failed)} messages to the queue.")
+            # RabbitMQ delivers a returned message again right away.
+            time.sleep(self.REQUEUE_DELAY)
+            for delivery_tag, body, properties, retries in failed:
+                self._inChannel.retry(delivery_tag, body, properties, retries)
+
+    def acknowledge(self, multiple=False):
+        """
+        Acknowledge the last received message.
+        :param multiple: If True, all the messages received up to the last one
+        are acknowledged at once.
+        """
+        self._inChannel.acknowledge(self.delivery_tag, multiple)
 
     def stop(self):
         self.disconnect()
@@ -537,12 +951,114 @@ class AmqpComm(Comm):
                 self.init()
                 self.recv(callback_fn)
 
+    def recv_batch(self, callback_fn, batch_size, flush_interval):
+        """
+        Start consuming the queue messages in micro-batches.
+        :param callback_fn: Called with the list of received messages. Returns
+        a list telling for each message whether it is done with, see
+        _settle_batch. Messages it could not store are False.
+        :param batch_size: Maximum number of messages in a batch.
+        :param flush_interval: Maximum time in seconds a message waits for
+        the batch to be filled.
+        """
+        try:
+            consumer_tag = const.CONSUMER_TAG
+            self.plugin_callback = callback_fn
+            self._batch = []
+            self._flush_timer = None
+            self._batch_size = batch_size
+            self._flush_interval = flush_interval
+            if self._inChannel.channel():
+                self._inChannel.channel().basic_consume(self._inChannel.exchange_queue,\
+                        partial(self._batch_callback, consumer_tag), consumer_tag=consumer_tag)
+                self._inChannel.channel().start_consuming()
+        except self._inChannel.connection_exceptions as e:
+            if not self._is_disconnect:
+                Log.error(self._inChannel.connection_error_msg.format(repr(e)))
+                self.init()
+                self.recv_batch(callback_fn, batch_size, flush_interval)
+
+    async def recv_async(self, callback_fn, prefetch_count, consumers):
+        """
+        Asyncio counterpart of recv. It has to be run as a task of the event
+        loop. Messages are delivered by the loop straight into an asyncio.Queue
+        and processed by a pool of consumer tasks, so no thread is involved.
+        :param callback_fn: Coroutine function called with each message. The
+        message is acknowledged if it returns True. If it returns False, the
+        message is returned to the queue after REQUEUE_DELAY seconds, at most
+        MAX_REQUEUES times. The count travels with the message in its
+        RETRY_HEADER, see AmqpChannel.retry. A message it raises on is dropped.
+        :param prefetch_count: Maximum number of unacknowledged messages
+        delivered by RabbitMQ, i.e. maximum number of queued messages.
+        :param consumers: Number of concurrent consumer tasks.
+        """
+        loop = asyncio.get_event_loop()
+        self._asyncInChannel = AsyncAmqpChannel()
+        try:
+            while not self._is_disconnect:
+                await self._asyncInChannel.init_async(loop)
+                if not self._asyncInChannel.channel():
+                    break
+                queue = asyncio.Queue()
+                await self._asyncInChannel.consume_async(
+                    lambda *delivery: queue.put_nowait(delivery),
+                    prefetch_count)
+                tasks = [loop.create_task(self._consume_queue(queue, callback_fn))
+                         for _ in range(consumers)]
+                reason = await self._asyncInChannel.wait_closed()
+                """
+                Queued messages can not be acknowledged any more, they are
+                delivered again after reconnecting. Consumers finish the message
+                in hand and stop.
+                """
+                while not queue.empty():
+                    queue.get_nowait()
+                for _ in tasks:
+                    queue.put_nowait((None, None, None))
+                await asyncio.gather(*tasks)
+                if not self._is_disconnect:
+                    Log.error(self._asyncInChannel.connection_error_msg.format(repr(reason)))
+        finally:
+            self._asyncInChannel.disconnect()
+
+    async def _consume_queue(self, queue, callback_fn):
+        """
+        Consumer task of recv_async.
+        """
+        while True:
+            delivery_tag, body, properties = await queue.get()
+            if delivery_tag is None:
+                break
+            try:
+                status = await callback_fn(body)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The message would fail the same way on every delivery.
+                Log.warn(f"Dropping message, error occured during processing: {e}")
+                self._asyncInChannel.reject(delivery_tag, requeue=False)
+                continue
+            if status:
+                self._asyncInChannel.acknowledge(delivery_tag)
+                continue
+            retries = AmqpChannel.retries(properties) + 1
+            if retries > self.MAX_REQUEUES:
+                Log.error(f"Dropping message not processed after {self.MAX_REQUEUES} "
+                          f"redeliveries")
+                self._asyncInChannel.reject(delivery_tag, requeue=False)
+                continue
+            # RabbitMQ delivers a returned message again right away.
+            await asyncio.sleep(self.REQUEUE_DELAY)
+            self._asyncInChannel.retry(delivery_tag, body, properties, retries)
+
     def disconnect(self):
         try:
             Log.info("Start : Calling AMQP's disconnect method")
             self._is_disconnect = True
             self._outChannel.disconnect()
             self._inChannel.disconnect()
+            if self._asyncInChannel:
+                self._asyncInChannel.disconnect()
             Log.info("End : Calling AMQP's disconnect method")
         except Exception as e:
             Log.exception(e)
@@ -613,6 +1129,7 @@ class MessageBusComm(Comm):
         self.consumer_message_types = None
         self.producer = None
         self.consumer = None
+        self._is_stopped = False
 
 
     def init(self, **kwargs):
@@ -705,6 +1222,51 @@ class MessageBusComm(Comm):
         else:
             Log.error("Message Bus Consumer not initialized.")
 
+    async def recv_async(self, callback_fn, prefetch_count, consumers):
+        """
+        Asyncio counterpart of recv. It has to be run as a task of the event
+        loop. The message bus client is blocking, so messages are received in
+        the default executor and handed over to a pool of consumer tasks
+        through an asyncio.Queue of at most prefetch_count messages.
+        :param callback_fn: Coroutine function called with each message. As
+        for recv, it is responsible for acknowledging the messages.
+        :param prefetch_count: Maximum number of queued messages.
+        :param consumers: Number of concurrent consumer tasks.
+        """
+        if not self.consumer:
+            Log.error("Message Bus Consumer not initialized.")
+            return
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=prefetch_count)
+        tasks = [loop.create_task(self._consume_queue(queue, callback_fn))
+                 for _ in range(consumers)]
+        try:
+            while not self._is_stopped:
+                message = await loop.run_in_executor(None, self.consumer.receive)
+                if message is not None:
+                    await queue.put(message.decode('utf-8'))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _consume_queue(self, queue, callback_fn):
+        """
+        Consumer task of recv_async.
+        """
+        while True:
+            message = await queue.get()
+            Log.debug(f"Received Message: {message}")
+            try:
+                await callback_fn(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Log.warn(f"Error occured during processing message: {e}")
+
+    def stop(self):
+        """ Stop receiving messages in recv_async. """
+        self._is_stopped = True
+
     def acknowledge(self):
         """ Acknowledge the read messages. """
         if self.consumer:
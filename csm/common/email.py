@@ -15,6 +15,7 @@
 
 import asyncio
 import ssl
+import time
 from email.message import Message as EmailMessage
 from email.headerregistry import Address
 from email.mime.text import MIMEText
@@ -86,12 +87,18 @@ class EmailSender:
     """
 
     SEND_MAIL_ATTEMPTS = 1
+    # Delay before the next reconnection attempt, doubled after each failure
+    RECONNECT_DELAY = 0.5
+    MAX_RECONNECT_DELAY = 8
     
-    def __init__(self, config: SmtpServerConfiguration):
+    def __init__(self, config: SmtpServerConfiguration, send_attempts=SEND_MAIL_ATTEMPTS):
         self._config = config
+        self._send_attempts = send_attempts
         self._smtp_obj = None
         self._is_connected = False
+        self._reconnect_delay = 0
         self._executor = ThreadPoolExecutor(max_workers=1)
+        self.last_used = time.monotonic()
 
     def _create_smtp_object(self):
         """ Helper method that generates SMTP management objects from the configuration """
@@ -105,6 +112,9 @@ class EmailSender:
         
     def _reconnect(self):
         for attempt in range(1, self._config.reconnect_attempts + 1):
+            if self._reconnect_delay:
+                # The previous attempt of this connection failed, back off
+                time.sleep(self._reconnect_delay)
             try:
                 self._close()
 
@@ -121,8 +131,11 @@ class EmailSender:
 
                 if self._config.smtp_login:
                     self._smtp_obj.login(self._config.smtp_login, self._config.smtp_password)
+                self._reconnect_delay = 0
                 return  # Success
             except (SMTPServerDisconnected, SMTPHeloError, ConnectionRefusedError) as e:
+                self._reconnect_delay = min(self.MAX_RECONNECT_DELAY,
+                    2 * self._reconnect_delay or self.RECONNECT_DELAY)
                 continue  # Try again
             except SMTPAuthenticationError as e:
                 raise InvalidCredentialsError("Authentication failed") from None
@@ -135,24 +148,25 @@ class EmailSender:
             self._smtp_obj.close()
             self._is_connected = False
 
-    def _send(self, message: EmailMessage):
-        for attempt in range(1, self.SEND_MAIL_ATTEMPTS + 1):
+    def _send(self, message: EmailMessage, to_addrs=None):
+        for attempt in range(1, self._send_attempts + 1):
             if not self._is_connected:
                 self._reconnect()
 
             try:
-                return self._smtp_obj.send_message(message)
-            except (SMTPHeloError, SMTPServerDisconnected) as e:
+                return self._smtp_obj.send_message(message, to_addrs=to_addrs)
+            except (SMTPHeloError, SMTPServerDisconnected, ConnectionError) as e:
                 self._close()
             except (SMTPRecipientsRefused, SMTPSenderRefused) as e:
                 raise BadEmailMessageError(e.smtp_error.decode('utf-8')) from None
 
         raise OutOfAttemptsEmailError("Failed to send the message")
     
-    async def send_message(self, message: EmailMessage):
+    async def send_message(self, message: EmailMessage, to_addrs=None):
         """
         Method for sending email messages.
         :param message: Instance of EmailMessage to be sent
+        :param to_addrs: Envelope recipients, taken from the message headers if omitted
         :returns: A dictionary that describes failed recipients
         :raise InvalidCredentialsError: The exception is raised when the provided login/password are not correct
         :raise OutOfAttemptsEmailError:
@@ -162,8 +176,17 @@ class EmailSender:
         loop = asyncio.get_event_loop()
 
         def _send():
-            return self._send(message)
-        return await loop.run_in_executor(self._executor, _send)
+            return self._send(message, to_addrs)
+        try:
+            return await loop.run_in_executor(self._executor, _send)
+        finally:
+            self.last_used = time.monotonic()
+
+    async def close(self):
+        """ Closes the connection to the server, the sender can't be used afterwards """
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=False)
 
     @staticmethod
     def make_multipart(from_address=None, to_address=None, subject=None, html_text=None,
@@ -195,3 +218,62 @@ class EmailSender:
         """ Method for multipart email message sending """
         msg = EmailSender.make_multipart(from_address, to_address, subject, html_text, plain_text)
         return await self.send_message(msg)
+
+
+class SmtpConnectionPool:
+    """
+    Pool of kept-alive connections to one SMTP server.
+
+    Each connection is an EmailSender with its own reconnection/backoff state,
+    so consecutive messages are sent without a new handshake and login.
+    Connections that stayed unused for idle_timeout seconds are closed instead
+    of being reused, as the server is likely to have dropped them already.
+    """
+
+    # A kept-alive connection might still be dropped by the server,
+    # in this case the message is sent again over a new one
+    SEND_MAIL_ATTEMPTS = 2
+
+    def __init__(self, config: SmtpServerConfiguration, max_size=4, idle_timeout=60):
+        self._config = config
+        self._idle_timeout = idle_timeout
+        self._idle = []
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    def __len__(self):
+        return len(self._idle)
+
+    async def _acquire(self):
+        now = time.monotonic()
+        while self._idle:
+            sender = self._idle.pop()
+            if now - sender.last_used < self._idle_timeout:
+                return sender
+            await sender.close()
+        return EmailSender(self._config, send_attempts=self.SEND_MAIL_ATTEMPTS)
+
+    async def send_message(self, message: EmailMessage, to_addrs=None):
+        """
+        Sends the message over one of the pooled connections.
+        The arguments and the exceptions are the same as of EmailSender.send_message
+        """
+        async with self._semaphore:
+            sender = await self._acquire()
+            try:
+                return await sender.send_message(message, to_addrs)
+            finally:
+                self._idle.append(sender)
+
+    async def close_idle(self):
+        """ Closes the connections unused for idle_timeout seconds """
+        now = time.monotonic()
+        expired = [s for s in self._idle if now - s.last_used >= self._idle_timeout]
+        self._idle = [s for s in self._idle if s not in expired]
+        for sender in expired:
+            await sender.close()
+
+    async def close(self):
+        """ Closes all the idle connections """
+        idle, self._idle = self._idle, []
+        for sender in idle:
+            await sender.close()
@@ -0,0 +1,108 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import re
+import time
+
+from cortx.utils.log import Log
+from cortx.utils.product_features import unsupported_features
+
+
+class FeatureEndpointMap:
+    """
+    Compiled form of the feature endpoint mapping schema.
+
+    Keys of the schema are endpoint paths where "*" matches a single path
+    segment (or a part of it). Paths without wildcards are looked up in a
+    dictionary, wildcard paths are compiled once and grouped by the number
+    of path segments, as a wildcard never matches "/". When several keys
+    match a path, the one that comes first in the schema wins.
+    """
+
+    _REGEX_CHARS = set('.^$*+?{}[]\\|()')
+
+    def __init__(self, feature_endpoint_map):
+        """
+        :param feature_endpoint_map: Loaded feature endpoint mapping schema :type: Dict
+        """
+        self._exact = {}
+        self._patterns = {}
+        for order, (key, value) in enumerate(feature_endpoint_map.items()):
+            if self._REGEX_CHARS.isdisjoint(key):
+                self._exact.setdefault(key, (order, value))
+            else:
+                pattern = re.compile(f'^{key}$'.replace("*", r"[\w\d]*"))
+                self._patterns.setdefault(key.count('/'), []).append(
+                    (order, pattern, value))
+
+    def __len__(self):
+        return len(self._exact) + sum(len(v) for v in self._patterns.values())
+
+    def get(self, path):
+        """
+        Find the feature entry of the endpoint.
+        :param path: Request path :type: str
+        :return: Feature entry of the schema or None
+        """
+        order, endpoint = self._exact.get(path, (None, None))
+        for pattern_order, pattern, value in self._patterns.get(path.count('/'), ()):
+            if order is not None and pattern_order > order:
+                break
+            if pattern.search(path):
+                return value
+        return endpoint
+
+
+class FeatureSupportCache:
+    """
+    Caches the verdicts of UnsupportedFeaturesDB per component and feature.
+
+    The unsupported features are only written during the setup of CSM, by
+    another process, so the verdicts are kept for ttl seconds instead of
+    reading the database on every request. A change is seen once the
+    verdicts expire.
+    """
+
+    def __init__(self, ttl, features_db=None):
+        """
+        :param ttl: Time in seconds a verdict is kept, 0 disables the cache
+        :param features_db: UnsupportedFeaturesDB instance, created on first use if omitted
+        """
+        self._ttl = ttl
+        self._features_db = features_db
+        self._verdicts = {}
+
+    def _get_features_db(self):
+        if self._features_db is None:
+            self._features_db = unsupported_features.UnsupportedFeaturesDB()
+        return self._features_db
+
+    async def is_feature_supported(self, component, feature):
+        """
+        Check whether the feature is supported by the component.
+        :param component: Component name :type: str
+        :param feature: Feature name :type: str
+        :return: bool
+        """
+        key = (component, feature)
+        verdict = self._verdicts.get(key)
+        now = time.monotonic()
+        if verdict is not None and verdict[1] > now:
+            return verdict[0]
+        supported = await self._get_features_db().is_feature_supported(component, feature)
+        if self._ttl > 0:
+            self._verdicts[key] = (supported, now + self._ttl)
+        Log.debug(f"Feature {feature} supported by {component}: {supported}")
+        return supported
@@ -14,15 +14,19 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import os
+import time
 import shutil
 import subprocess
 import getpass
 import errno
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from csm.common.comm import SSHChannel
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from csm.common.errors import CsmError
+from cortx.utils.conf_store.conf_store import Conf
 
 class FileCollector(object):
     """ Base class of File collector. """
@@ -161,12 +165,19 @@ class LocalFileCollector(FileCollector):
 class RemoteFileCollector(FileCollector):
     """ Collects files from the Remote machine """
 
-    def __init__(self, collection_rules, node, user, target_path):
+    def __init__(self, collection_rules, node, user, target_path, channel=None,
+                 progress=None):
+        """
+        :param channel: Channel to the node, a SSHChannel if omitted
+        :param progress: Called with the component and the number of bytes of
+                         every chunk of files received from the node
+        """
         super(RemoteFileCollector, self).__init__(collection_rules, target_path)
-        self._channel = SSHChannel(node, user, True)
+        self._channel = channel or SSHChannel(node, user)
         self._tmp_file = 'files.tgz'
         self._node = node
         self._user = user
+        self._progress = progress
 
     def _startup(self):
         """ Initialization before the data is collected """
@@ -182,6 +193,8 @@ class RemoteFileCollector(FileCollector):
                 try:
                     summary.write('\n$ %s\n' % action)
                     rc, output = self._channel.execute(action)
+                    if isinstance(output, bytes):
+                        output = output.decode('utf-8', 'replace')
                     summary.write('%s\n' %output)
 
                 except OSError as e:
@@ -197,25 +210,33 @@ class RemoteFileCollector(FileCollector):
                     raise CsmError(-1, '%s' %e)
 
     def _expand_file_spec(self, file_spec):
-        cmd = 'ls %s' %file_spec
-        rc, output = self._channel.execute(cmd)
-        return output.split('\n')
+        # Wild-cards are expanded by the shell of the node running tar
+        return [file_spec]
 
     def _collect_files(self, file_list, out_dir):
-        """ Collect files from remote nodes and copy it to bucket """
-
+        """
+        Collect files from remote nodes and copy it to bucket.
+        The tar archive is streamed over the channel into the local file,
+        nothing is written on the node.
+        """
+        if not file_list:
+            return
         local_file = os.path.join(out_dir, self._tmp_file)
-        remote_file = os.path.join('/tmp', self._tmp_file)
+        comp_name = os.path.basename(out_dir)
+        callback = None
+        if self._progress:
+            callback = lambda received: self._progress(comp_name, received)
 
         files = ' '.join(file_list)
-        tar_cmd = 'tar czvf %s %s' % (remote_file, files)
+        tar_cmd = 'tar czf - --ignore-failed-read %s' % files
 
         try:
-            Log.debug('cmd: %s' %tar_cmd)
-            output, error = self._channel.execute(tar_cmd)
-            Log.debug('Copy remote:%s local:%s' %(remote_file, local_file))
-            self._channel.recv_file(remote_file, local_file)
-            self._channel.execute('rm -f %s' %remote_file)
+            Log.debug('cmd: %s > %s:%s' %(tar_cmd, self._node, local_file))
+            with open(local_file, 'wb') as stream:
+                rc, error = self._channel.recv_stream(tar_cmd, stream, callback)
+            if rc != 0:
+                Log.error('Files of %s on %s not collected completely. %s'
+                          %(comp_name, self._node, error))
 
         except CsmError:
             raise
@@ -235,3 +256,97 @@ class RemoteFileCollector(FileCollector):
     def _cleanup(self):
         """ Clean all the temp files and the directory """
         self._channel.disconnect()
+
+
+class MultiNodeFileCollector(object):
+    """
+    Collects files from several nodes at once.
+    Every node is collected by a RemoteFileCollector into
+    <target_path>/<node>, at most max_nodes nodes at a time. A node that
+    fails does not stop the others, its error is kept in the progress.
+    """
+
+    PENDING = 'pending'
+    COLLECTING = 'collecting'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, collection_rules, target_path, user=None, max_nodes=None,
+                 channel_factory=None, progress=None):
+        """
+        :param collection_rules: Collection rules, see FileCollector
+        :param target_path: Directory the nodes are collected into
+        :param user: User to connect to the nodes with
+        :param max_nodes: Number of nodes collected at once, from the config if omitted
+        :param channel_factory: Called with node and user to create the channel
+                                to a node, SSHChannel if omitted
+        :param progress: Called with the node and its progress on every change
+        """
+        if collection_rules == None:
+            raise CsmError(errno.EINVAL, 'invalid component spec. Check configuration')
+
+        self._collection_rules = collection_rules
+        self._target = target_path
+        self._user = user
+        self._max_nodes = max_nodes or int(Conf.get(const.CSM_GLOBAL_INDEX,
+            f"{const.SUPPORT_BUNDLE}>{const.SB_MAX_NODES}", const.DEFAULT_SB_MAX_NODES))
+        self._channel_factory = channel_factory or SSHChannel
+        self._progress_callback = progress
+        self._nodes = {}
+        self._lock = threading.Lock()
+
+    def progress(self):
+        """
+        Progress of every node: status, component being collected, bytes
+        of files received, duration and error.
+        """
+        with self._lock:
+            return {node: dict(state) for node, state in self._nodes.items()}
+
+    def _update(self, node, received=0, **state):
+        with self._lock:
+            self._nodes[node].update(state)
+            self._nodes[node]['bytes'] += received
+            snapshot = dict(self._nodes[node])
+        if self._progress_callback:
+            self._progress_callback(node, snapshot)
+
+    def _collect_node(self, node, comp_name_list):
+        start = time.monotonic()
+        self._update(node, status=self.COLLECTING)
+        channel = None
+        try:
+            channel = self._channel_factory(node, self._user)
+            collector = RemoteFileCollector(self._collection_rules, node, self._user,
+                os.path.join(self._target, node), channel=channel,
+                progress=lambda comp_name, received: self._update(
+                    node, received, component=comp_name))
+            collector.collect(comp_name_list)
+        except Exception as e:
+            Log.error('Collection from %s failed. %s' %(node, e))
+            # collect() disconnects only when it succeeds
+            if channel is not None:
+                channel.disconnect()
+            self._update(node, status=self.FAILED, error=str(e),
+                         duration=round(time.monotonic() - start, 3))
+            return
+        self._update(node, status=self.DONE, component=None,
+                     duration=round(time.monotonic() - start, 3))
+
+    def collect(self, nodes, comp_name_list):
+        """
+        Collect the components from all the nodes.
+        :param nodes: Names of the nodes
+        :param comp_name_list: Components to collect from every node
+        :return: Progress of every node once all of them are done
+        """
+        with self._lock:
+            self._nodes = {node: {'status': self.PENDING, 'component': None,
+                                  'bytes': 0, 'duration': 0, 'error': None}
+                           for node in nodes}
+        if not nodes:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self._max_nodes, len(nodes))) as executor:
+            for node in nodes:
+                executor.submit(self._collect_node, node, comp_name_list)
+        return self.progress()
@@ -34,3 +34,14 @@ class Observable:
                 asyncio.run_coroutine_threadsafe(observer(*args, **kwargs), loop=loop)
             else:
                 observer(*args, **kwargs)
+
+    def _notify_listeners_from_loop(self, *args, **kwargs):
+        """
+        Same as _notify_listeners, to be called from the event loop itself.
+        Coroutine listeners are scheduled on the running loop directly.
+        """
+        for observer in self._observers:
+            if inspect.iscoroutinefunction(observer):
+                asyncio.ensure_future(observer(*args, **kwargs))
+            else:
+                observer(*args, **kwargs)
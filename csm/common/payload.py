@@ -245,6 +245,49 @@ class Payload:
     def data(self):
         return self._data
 
+class PayloadMap:
+    """
+    Precompiled form of the mapping dictionaries used by Payload.convert.
+    Keys of the mappings are split once here, so converting a message only
+    walks the prepared paths of an already loaded dictionary.
+    """
+
+    def __init__(self, *maps):
+        """
+        :param maps: Mapping dictionaries, applied in the given order :type: Dict
+        """
+        self._plan = tuple((tuple(src.split('.')), tuple(dst.split('.')))
+                           for map in maps if map for src, dst in map.items())
+
+    @staticmethod
+    def _get(path, data):
+        for key in path:
+            if not isinstance(data, dict) or key not in data:
+                return None
+            data = data[key]
+        return data
+
+    @staticmethod
+    def _set(path, val, data):
+        for key in path[:-1]:
+            if type(data.get(key)) != dict:
+                data[key] = {}
+            data = data[key]
+        data[path[-1]] = val
+
+    def convert(self, data, result=None):
+        """
+        Converts 1 Schema to 2nd Schema, same as Payload.convert.
+        :param data: Loaded input message :type: Dict
+        :param result: Dictionary to update, a new one is created if omitted
+        :return: :type: Dict
+        """
+        if result is None:
+            result = {}
+        for src, dst in self._plan:
+            self._set(dst, self._get(src, data), result)
+        return result
+
 class CommonPayload:
     """
     Implements a common payload to represent Json, Toml, Yaml, Ini Doc.
@@ -22,20 +22,20 @@ import traceback
 import ssl
 from concurrent.futures import CancelledError as ConcurrentCancelledError
 from asyncio import CancelledError as AsyncioCancelledError
-from weakref import WeakSet
-from aiohttp import web, web_exceptions
+from aiohttp import web, web_exceptions, hdrs
 from abc import ABC
 from ipaddress import ip_address
 from secure import SecureHeaders
 from csm.core.providers.provider_factory import ProviderFactory
 from csm.core.providers.providers import Request, Response
+from csm.common.broadcast import WebSocketBroadcaster
 from csm.common.observer import Observable
 from csm.common.payload import *
 from cortx.utils.conf_store.conf_store import Conf
 from csm.common.conf import  ConfSection, DebugConf
 from cortx.utils.log import Log
-from cortx.utils.product_features import unsupported_features
 from csm.common.payload import Json
+from csm.common.features import FeatureEndpointMap, FeatureSupportCache
 from csm.common.services import Service
 from csm.core.blogic import const
 from csm.common.cluster import Cluster
@@ -48,7 +48,6 @@ from csm.core.services.usl import UslService
 from csm.core.services.file_transfer import DownloadFileEntity
 from csm.core.controllers.view import CsmView, CsmResponse, CsmAuth
 from csm.core.controllers import CsmRoutes
-import re
 
 
 class CsmApi(ABC):
@@ -95,12 +94,25 @@ class CsmApi(ABC):
 class CsmRestApi(CsmApi, ABC):
     """ REST Interface to communicate with CSM """
 
+    # Public flag and required permissions of a route, per method
+    ATTR_ROUTE_AUTH = '_csm_route_auth_'
+
     @staticmethod
     def init(alerts_service):
         CsmApi.init()
         CsmRestApi._queue = asyncio.Queue()
         CsmRestApi._bgtasks = []
-        CsmRestApi._wsclients = WeakSet()
+        CsmRestApi._broadcaster = WebSocketBroadcaster(
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.WEBSOCKET_CLIENT_QUEUE_SIZE,
+                         const.DEFAULT_WEBSOCKET_CLIENT_QUEUE_SIZE)),
+            Conf.get(const.CSM_GLOBAL_INDEX, const.WEBSOCKET_SLOW_CLIENT_POLICY,
+                     const.DEFAULT_WEBSOCKET_SLOW_CLIENT_POLICY),
+            CsmRestApi.json_serializer)
+        CsmRestApi._feature_endpoints = FeatureEndpointMap(
+            Json(const.FEATURE_ENDPOINT_MAPPING_SCHEMA).load())
+        CsmRestApi._feature_support = FeatureSupportCache(
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.FEATURE_SUPPORT_CACHE_TTL,
+                           const.DEFAULT_FEATURE_SUPPORT_CACHE_TTL)))
 
         CsmRestApi._app = web.Application(
             middlewares=[CsmRestApi.set_secure_headers,
@@ -122,9 +134,8 @@ class CsmRestApi(CsmApi, ABC):
         # Remove lyve_pilot permission if it is not supported
         try:
             roles = Json(const.ROLES_MANAGEMENT).load()
-            unsupported_feature_instance = unsupported_features.UnsupportedFeaturesDB()
             feature_supported = CsmRestApi._app._loop.run_until_complete(
-                unsupported_feature_instance.is_feature_supported(
+                CsmRestApi._feature_support.is_feature_supported(
                     const.CSM_COMPONENT_NAME, const.LYVE_PILOT))
 
             if not feature_supported:
@@ -219,42 +230,58 @@ class CsmRestApi(CsmApi, ABC):
         raise web.HTTPUnauthorized(headers=CsmAuth.UNAUTH)
 
     @staticmethod
-    async def _resolve_handler(request):
-        match_info = await request.app.router.resolve(request)
-        return match_info.handler
+    def _get_handler_auth(handler, method):
+        return (CsmView.is_public(handler, method),
+                CsmView.get_permissions(handler, method))
+
+    @classmethod
+    def _set_routes_auth(cls, app):
+        """
+        Store the public flag and the required permissions of every method
+        of every route on the route itself, so that requests do not have to
+        introspect the handlers.
+        """
+        for route in app.router.routes():
+            methods = hdrs.METH_ALL if route.method == hdrs.METH_ANY else (route.method,)
+            setattr(route, cls.ATTR_ROUTE_AUTH,
+                    {method: cls._get_handler_auth(route.handler, method) for method in methods})
 
     @classmethod
-    async def _is_public(cls, request):
-        handler = await cls._resolve_handler(request)
-        return CsmView.is_public(handler, request.method)
+    def _get_route_auth(cls, request):
+        # The route has already been resolved by aiohttp before the middlewares are run
+        match_info = request.match_info
+        route_auth = getattr(match_info.route, cls.ATTR_ROUTE_AUTH, {})
+        auth = route_auth.get(request.method)
+        if auth is None:
+            auth = cls._get_handler_auth(match_info.handler, request.method)
+        return auth
 
     @classmethod
-    async def _get_permissions(cls, request):
-        handler = await cls._resolve_handler(request)
-        return CsmView.get_permissions(handler, request.method)
+    def _is_public(cls, request):
+        is_public, _ = cls._get_route_auth(request)
+        return is_public
+
+    @classmethod
+    def _get_permissions(cls, request):
+        _, permissions = cls._get_route_auth(request)
+        return permissions
 
     @staticmethod
     async def check_for_unsupported_endpoint(request):
         """
         Check whether the endpoint is supported. If not, send proper error
         reponse.
+        The mapping is compiled and the verdicts are cached, see CsmRestApi.init.
         """
-        def getMatchingEndpoint(endpoint_map, path):
-            for key,value in endpoint_map.items():
-                map_re = f'^{key}$'.replace("*", "[\w\d]*")
-                if re.search(rf"{map_re}", path):
-                    return value
-
-        feature_endpoint_map = Json(const.FEATURE_ENDPOINT_MAPPING_SCHEMA).load()
-        endpoint = getMatchingEndpoint(feature_endpoint_map, request.path)
+        endpoint = CsmRestApi._feature_endpoints.get(request.path)
         if endpoint:
-            unsupported_feature_instance = unsupported_features.UnsupportedFeaturesDB()
+            feature_support = CsmRestApi._feature_support
             if endpoint[const.DEPENDENT_ON]:
                 for component in endpoint[const.DEPENDENT_ON]:
-                    if not await unsupported_feature_instance.is_feature_supported(component,endpoint[const.FEATURE_NAME]):
+                    if not await feature_support.is_feature_supported(component,endpoint[const.FEATURE_NAME]):
                         Log.debug(f"The request {request.path} of feature {endpoint[const.FEATURE_NAME]} is not supported by {component}")
                         raise InvalidRequest("This feature is not supported on this environment.")
-            if not await unsupported_feature_instance.is_feature_supported(const.CSM_COMPONENT_NAME, endpoint[const.FEATURE_NAME]):
+            if not await feature_support.is_feature_supported(const.CSM_COMPONENT_NAME, endpoint[const.FEATURE_NAME]):
                 Log.debug(f"The request {request.path} of feature {endpoint[const.FEATURE_NAME]} is not supported by {const.CSM_COMPONENT_NAME}")
                 raise InvalidRequest("This feature is not supported on this environment.")
         else:
@@ -264,7 +291,7 @@ class CsmRestApi(CsmApi, ABC):
     @web.middleware
     async def session_middleware(cls, request, handler):
         session = None
-        is_public = await cls._is_public(request)
+        is_public = cls._is_public(request)
         if not is_public:
             hdr = request.headers.get(CsmAuth.HDR)
             if not hdr:
@@ -293,8 +320,8 @@ class CsmRestApi(CsmApi, ABC):
     async def permission_middleware(cls, request, handler):
         if request.session is not None:
             # Check user permissions
-            required = await cls._get_permissions(request)
-            verdict = (request.session.permissions & required) == required
+            required = cls._get_permissions(request)
+            verdict = required.issubset(request.session.permissions)
             Log.debug(f'Required permissions: {required}')
             Log.debug(f'User permissions: {request.session.permissions}')
             Log.debug(f'Allow access: {verdict}')
@@ -415,11 +442,17 @@ class CsmRestApi(CsmApi, ABC):
         scheme should be designed for this case.
         For the time being the handler is marked as 'public'
         to disable authentication for websockets completely.
+
+        The "topics" query parameter is a comma separated list of
+        the topics the client is subscribed to. Without it the client gets
+        the alerts only, as before the health topic was added.
         """
+        topics = [topic for topic in request.rel_url.query.get('topics', '').split(',')
+                  if topic] or [const.WEBSOCKET_TOPIC_ALERTS]
         ws = web.WebSocketResponse()
         await ws.prepare(request)
         Log.debug('REST API websock connection opened')
-        CsmRestApi._wsclients.add(ws)
+        client = CsmRestApi._broadcaster.add_client(ws, topics)
 
         try:
             async for msg in ws:
@@ -430,43 +463,63 @@ class CsmRestApi(CsmApi, ABC):
             Log.debug('REST API websock connection closed')
             await ws.close()
         finally:
-            CsmRestApi._wsclients.discard(ws)
+            await CsmRestApi._broadcaster.remove_client(client)
         return ws
 
     @staticmethod
     async def _on_startup(app):
         Log.debug('REST API startup')
+        CsmRestApi._set_routes_auth(app)
         CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._websock_bg()))
+        CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._websock_stats_bg(
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.WEBSOCKET_STATS_INTERVAL,
+                           const.DEFAULT_WEBSOCKET_STATS_INTERVAL)))))
         CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._ssl_cert_check_bg()))
+        uploads = app.get(const.UPLOAD_SERVICE)
+        if uploads is not None:
+            CsmRestApi._bgtasks.append(app.loop.create_task(uploads.run_sweeper()))
 
     @staticmethod
     async def _on_shutdown(app):
         Log.debug('REST API shutdown')
         for task in CsmRestApi._bgtasks:
             task.cancel()
+        await CsmRestApi._broadcaster.close()
 
     @staticmethod
     async def _websock_bg():
         Log.debug('REST API websock background task started')
         try:
             while True:
-                msg = await CsmRestApi._queue.get()
-                await CsmRestApi._websock_broadcast(msg)
+                msg, topic = await CsmRestApi._queue.get()
+                CsmRestApi._websock_broadcast(msg, topic)
         except AsyncioCancelledError:
             Log.debug('REST API websock background task canceled')
 
         Log.debug('REST API websock background task done')
 
     @staticmethod
-    async def _websock_broadcast(msg):
-        # do explicit copy because the list can change asynchronously
-        clients = CsmRestApi._wsclients.copy()
+    async def _websock_stats_bg(interval):
+        """
+        Log the websocket broadcast stats every interval seconds when they changed.
+        """
+        last = None
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                stats = CsmRestApi._broadcaster.stats()
+                if stats != last:
+                    Log.info(f'REST API websock stats: {stats}')
+                    last = stats
+        except AsyncioCancelledError:
+            Log.debug('REST API websock stats background task canceled')
+
+    @staticmethod
+    def _websock_broadcast(msg, topic):
         try:
-            for ws in clients:
-                json_msg = CsmRestApi.json_serializer(msg)
-                await ws.send_str(json_msg)
-        except:
-            Log.debug('REST API websock broadcast error')
+            CsmRestApi._broadcaster.broadcast(msg, topic)
+        except Exception as e:
+            Log.debug(f'REST API websock broadcast error: {e}')
 
     @classmethod
     async def _ssl_cert_check_bg(cls):
@@ -480,13 +533,26 @@ class CsmRestApi(CsmApi, ABC):
         Log.debug('SSL certificate expiry check background task done')
 
     @staticmethod
-    async def _async_push(msg):
-        return await CsmRestApi._queue.put(msg)
+    async def _async_push(msg, topic):
+        return await CsmRestApi._queue.put((msg, topic))
+
+    @staticmethod
+    def push_health_delta(delta):
+        return CsmRestApi.push(delta, const.WEBSOCKET_TOPIC_HEALTH)
 
     @staticmethod
-    def push(alert):
-        coro = CsmRestApi._async_push(alert)
-        asyncio.run_coroutine_threadsafe(coro, CsmRestApi._app.loop)
+    def push(alert, topic=const.WEBSOCKET_TOPIC_ALERTS):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except (RuntimeError, AttributeError):
+            # No loop runs in this thread. Python 3.6 has no get_running_loop,
+            # run_coroutine_threadsafe is then used, it works from any thread.
+            running_loop = None
+        if running_loop is CsmRestApi._app.loop:
+            CsmRestApi._queue.put_nowait((alert, topic))
+        else:
+            coro = CsmRestApi._async_push(alert, topic)
+            asyncio.run_coroutine_threadsafe(coro, CsmRestApi._app.loop)
         return True
 
 
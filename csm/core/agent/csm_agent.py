@@ -73,7 +73,8 @@ class CsmAgent:
             os.remove(f)
 
         # Alert configuration
-        alerts_repository = AlertRepository(db)
+        alerts_repository = AlertRepository(db, int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_INDEX_SIZE, const.DEFAULT_ALERT_INDEX_SIZE)))
         alerts_service = AlertsAppService(alerts_repository)
         CsmRestApi.init(alerts_service)
 
@@ -90,7 +91,9 @@ class CsmAgent:
         health_plugin = import_plugin_module(const.HEALTH_PLUGIN)
         health_plugin_obj = health_plugin.HealthPlugin()
         health_service = HealthAppService(health_repository, alerts_repository, \
-            health_plugin_obj)
+            health_plugin_obj, float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.HEALTH_DELTA_WINDOW, const.DEFAULT_HEALTH_DELTA_WINDOW)))
+        health_service.delta_stream.add_listener(CsmRestApi.push_health_delta)
         CsmAgent.health_monitor = HealthMonitorService(\
                 health_plugin_obj, health_service)
         CsmRestApi._app[const.HEALTH_SERVICE] = health_service
@@ -100,14 +103,26 @@ class CsmAgent:
         CsmAgent.alert_monitor = AlertMonitorService(alerts_repository,\
                 pm.AlertPlugin(), CsmAgent.health_monitor.health_plugin, \
                 http_notifications)
-        email_queue = EmailSenderQueue()
+        email_queue = EmailSenderQueue(
+            workers=int(Conf.get(const.CSM_GLOBAL_INDEX, const.EMAIL_QUEUE_WORKERS,
+                                 const.DEFAULT_EMAIL_QUEUE_WORKERS)),
+            pool_size=int(Conf.get(const.CSM_GLOBAL_INDEX, const.EMAIL_CONNECTION_POOL_SIZE,
+                                   const.DEFAULT_EMAIL_CONNECTION_POOL_SIZE)),
+            idle_timeout=float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.EMAIL_CONNECTION_IDLE_TIMEOUT, const.DEFAULT_EMAIL_CONNECTION_IDLE_TIMEOUT)))
         email_queue.start_worker_sync()
 
         CsmAgent.alert_monitor.add_listener(http_notifications.handle_alert)
+        CsmAgent.alert_monitor.add_listener(health_service.delta_stream.alert_changed)
         CsmRestApi._app["alerts_service"] = alerts_service
 
        # Network file manager registration
         CsmRestApi._app["download_service"] = DownloadFileManager()
+        CsmRestApi._app[const.UPLOAD_SERVICE] = UploadSessionManager(
+            session_timeout=float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.UPLOAD_SESSION_TIMEOUT, const.DEFAULT_UPLOAD_SESSION_TIMEOUT)),
+            sweep_interval=float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.UPLOAD_SWEEP_INTERVAL, const.DEFAULT_UPLOAD_SWEEP_INTERVAL)))
 
         # Stats service creation
         time_series_provider = TimelionProvider(const.AGGREGATION_RULE)
@@ -117,9 +132,18 @@ class CsmAgent:
         # User/Role/Session management services
         roles = Json(const.ROLES_MANAGEMENT).load()
         auth_service = AuthService()
-        user_manager = UserManager(db)
+        user_manager = UserManager(db, float(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.USER_CACHE_TTL, const.DEFAULT_USER_CACHE_TTL)))
         role_manager = RoleManager(roles)
-        session_manager = SessionManager()
+        if Conf.get(const.CSM_GLOBAL_INDEX, const.SESSION_BACKEND,
+                    const.SESSION_BACKEND_MEMORY) == const.SESSION_BACKEND_DB:
+            cluster_id = Conf.get(const.CSM_GLOBAL_INDEX, const.CLUSTER_ID_KEY)
+            session_manager = SessionManager(DbSessionStorage(db,
+                Cipher.generate_key(str(cluster_id), const.SESSION_CIPHER_KEY)))
+        else:
+            session_manager = SessionManager()
+        session_manager.start_sweeper(float(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.SESSION_SWEEP_INTERVAL, const.DEFAULT_SESSION_SWEEP_INTERVAL)))
         CsmRestApi._app.login_service = LoginService(auth_service,
                                                      user_manager,
                                                      role_manager,
@@ -137,7 +161,17 @@ class CsmAgent:
 
         email_notifier = AlertEmailNotifier(email_queue, system_config_mgr,
             Template.from_file(const.CSM_ALERT_EMAIL_NOTIFICATION_TEMPLATE_REL),
-            user_manager)
+            user_manager,
+            digest_template=Template.from_file(const.CSM_ALERT_EMAIL_DIGEST_TEMPLATE_REL),
+            digest_window=float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.ALERT_EMAIL_DIGEST_WINDOW, const.DEFAULT_ALERT_EMAIL_DIGEST_WINDOW)),
+            immediate_severities=Conf.get(const.CSM_GLOBAL_INDEX,
+                const.ALERT_EMAIL_IMMEDIATE_SEVERITIES,
+                const.DEFAULT_ALERT_EMAIL_IMMEDIATE_SEVERITIES),
+            config_ttl=float(Conf.get(const.CSM_GLOBAL_INDEX,
+                const.ALERT_EMAIL_CONFIG_TTL, const.DEFAULT_ALERT_EMAIL_CONFIG_TTL)))
+        system_config_mgr.add_listener(email_notifier.invalidate)
+        user_manager.add_listener(email_notifier.invalidate)
         CsmAgent.alert_monitor.add_listener(email_notifier.handle_alert)
 
         CsmRestApi._app["onboarding_config_service"] = OnboardingConfigService(db)
@@ -159,7 +193,8 @@ class CsmAgent:
         s3 = import_plugin_module(const.S3_PLUGIN).S3Plugin()
         CsmRestApi._app[const.S3_IAM_USERS_SERVICE] = IamUsersService(s3)
         CsmRestApi._app[const.S3_ACCOUNT_SERVICE] = S3AccountService(s3)
-        CsmRestApi._app[const.S3_BUCKET_SERVICE] = S3BucketService(s3)
+        s3_bucket_service = S3BucketService(s3)
+        CsmRestApi._app[const.S3_BUCKET_SERVICE] = s3_bucket_service
         CsmRestApi._app[const.S3_ACCESS_KEYS_SERVICE] = S3AccessKeysService(s3)
         CsmRestApi._app[const.S3_SERVER_INFO_SERVICE] = S3ServerInfoService()
 
@@ -173,14 +208,22 @@ class CsmAgent:
                 Conf.get(const.CSM_GLOBAL_INDEX, 'UPDATE>firmware_store_path'), update_repo)
         CsmRestApi._app[const.SYSTEM_CONFIG_SERVICE] = SystemConfigAppService(db, provisioner,
             security_service, system_config_mgr, Template.from_file(const.CSM_SMTP_TEST_EMAIL_TEMPLATE_REL))
-        CsmRestApi._app[const.STORAGE_CAPACITY_SERVICE] = StorageCapacityService(provisioner)
+        storage_capacity_service = StorageCapacityService(provisioner,
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_SAMPLE_PERIOD,
+                           const.DEFAULT_CAPACITY_SAMPLE_PERIOD)),
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_HISTORY_SIZE,
+                         const.DEFAULT_CAPACITY_HISTORY_SIZE)))
+        storage_capacity_service.start_sampler()
+        CsmRestApi._app[const.STORAGE_CAPACITY_SERVICE] = storage_capacity_service
 
         CsmRestApi._app[const.SECURITY_SERVICE] = security_service
         CsmRestApi._app[const.PRODUCT_VERSION_SERVICE] = ProductVersionService(provisioner)
 
         CsmRestApi._app[const.APPLIANCE_INFO_SERVICE] = ApplianceInfoService()
         # USL Service
-        CsmRestApi._app[const.USL_SERVICE] = UslService(s3, db, provisioner)
+        usl_service = UslService(s3, db, provisioner, storage_capacity_service)
+        s3_bucket_service.add_listener(usl_service.invalidate_volumes)
+        CsmRestApi._app[const.USL_SERVICE] = usl_service
 
         # Plugin for Maintenance
         # TODO : Replace PcsHAFramework with hare utility
@@ -257,7 +300,8 @@ if __name__ == '__main__':
     from csm.core.services.usl import UslService
     from csm.core.services.users import CsmUserService, UserManager
     from csm.core.services.roles import RoleManagementService, RoleManager
-    from csm.core.services.sessions import SessionManager, LoginService, AuthService
+    from csm.core.services.sessions import (SessionManager, LoginService, AuthService,
+                                            DbSessionStorage)
     from csm.core.services.security import SecurityService
     from csm.core.services.hotfix_update import HotfixApplicationService
     from csm.core.repositories.update_status import UpdateStatusRepository
@@ -275,7 +319,7 @@ if __name__ == '__main__':
     from csm.core.services.storage_capacity import StorageCapacityService
     from csm.core.services.system_config import SystemConfigAppService, SystemConfigManager
     from csm.core.services.audit_log import  AuditLogManager, AuditService
-    from csm.core.services.file_transfer import DownloadFileManager
+    from csm.core.services.file_transfer import DownloadFileManager, UploadSessionManager
     from csm.core.services.firmware_update import FirmwareUpdateService
     from csm.common.errors import CsmError
     from cortx.utils.security.cipher import Cipher, CipherInvalidToken
@@ -134,6 +134,7 @@ CORTXCLI_CONF = '/etc/cli/cortxcli.conf'
 CORTXCLI_SECTION = 'CORTXCLI'
 CSM_CLUSTER_CONF = '/etc/csm/cluster.conf'
 CSM_TMP_FILE_CACHE_DIR = '/tmp/csm/file_cache/transfer'
+CSM_TMP_UPLOAD_DIR = '/tmp/csm/file_cache/uploads'
 COMPONENTS_CONF = '/etc/csm/components.yaml'
 DATABASE_CONF = '/etc/csm/database.yaml'
 DATABASE_CLI_CONF = '/etc/cli/database_cli.yaml'
@@ -311,6 +312,12 @@ SB_NODE_NAME = "node_name"
 SB_BUNDLE_ID = "bundle_id"
 SB_BUNDLE_PATH = "bundle_path"
 SB_SYMLINK_PATH = "symlink_path"
+SB_COMMAND_TIMEOUT = "command_timeout"
+DEFAULT_SB_COMMAND_TIMEOUT = 1800
+SB_COLLECTION_WORKERS = "collection_workers"
+DEFAULT_SB_COLLECTION_WORKERS = 4
+SB_MAX_NODES = "max_nodes"
+DEFAULT_SB_MAX_NODES = 4
 ROOT_PRIVILEGES_MSG = "Command requires root privileges"
 PERMISSION_ERROR_MSG = "Failed to cleanup {path} due to insufficient permissions"
 
@@ -359,6 +366,9 @@ UDS_NATIVE_CERTIFICATE_FILENAME = 'native.crt'
 UDS_DOMAIN_PRIVATE_KEY_FILENAME = 'domain.key'
 UDS_DOMAIN_CERTIFICATE_FILENAME = 'domain.crt'
 
+USL_VOLUMES_CACHE_TTL = 'UDS>volumes_cache_ttl'
+DEFAULT_USL_VOLUMES_CACHE_TTL = 30  # seconds
+
 # USL S3 configuration (CES2020 only!)
 USL_S3_CONF = '/etc/uds/uds_s3.toml'
 # IAM User Related
@@ -387,9 +397,33 @@ REPLACE_NODE_ID = 'replace_node'
 # Email configuration
 CSM_SMTP_SEND_TIMEOUT_SEC = 30
 CSM_SMTP_RECONNECT_ATTEMPTS = 2
+WEBSOCKET_TOPIC_ALERTS = 'alerts'
+WEBSOCKET_TOPIC_HEALTH = 'health'
+WEBSOCKET_CLIENT_QUEUE_SIZE = "CSM_SERVICE>CSM_AGENT>websocket_client_queue_size"
+DEFAULT_WEBSOCKET_CLIENT_QUEUE_SIZE = 256
+WEBSOCKET_SLOW_CLIENT_POLICY = "CSM_SERVICE>CSM_AGENT>websocket_slow_client_policy"
+DEFAULT_WEBSOCKET_SLOW_CLIENT_POLICY = 'drop'
+WEBSOCKET_STATS_INTERVAL = "CSM_SERVICE>CSM_AGENT>websocket_stats_interval"
+DEFAULT_WEBSOCKET_STATS_INTERVAL = 300  # seconds
+HEALTH_DELTA_WINDOW = "CSM_SERVICE>CSM_AGENT>health_delta_window"
+DEFAULT_HEALTH_DELTA_WINDOW = 0.25  # seconds
+EMAIL_QUEUE_WORKERS = "CSM_SERVICE>CSM_AGENT>email_workers"
+DEFAULT_EMAIL_QUEUE_WORKERS = 4
+EMAIL_CONNECTION_POOL_SIZE = "CSM_SERVICE>CSM_AGENT>email_connection_pool_size"
+DEFAULT_EMAIL_CONNECTION_POOL_SIZE = 4
+EMAIL_CONNECTION_IDLE_TIMEOUT = "CSM_SERVICE>CSM_AGENT>email_connection_idle_timeout"
+DEFAULT_EMAIL_CONNECTION_IDLE_TIMEOUT = 60  # seconds
 CSM_ALERT_EMAIL_NOTIFICATION_TEMPLATE_REL = '{}/templates/alert_notification_email.html'.format(
     CSM_PATH)
 CSM_ALERT_EMAIL_NOTIFICATION_SUBJECT = 'Alert notification'
+CSM_ALERT_EMAIL_DIGEST_TEMPLATE_REL = '{}/templates/alert_notification_digest_email.html'.format(
+    CSM_PATH)
+ALERT_EMAIL_DIGEST_WINDOW = "CSM_SERVICE>CSM_AGENT>alert_email_digest_window"
+DEFAULT_ALERT_EMAIL_DIGEST_WINDOW = 60  # seconds
+ALERT_EMAIL_IMMEDIATE_SEVERITIES = "CSM_SERVICE>CSM_AGENT>alert_email_immediate_severities"
+DEFAULT_ALERT_EMAIL_IMMEDIATE_SEVERITIES = [CRITICAL]
+ALERT_EMAIL_CONFIG_TTL = "CSM_SERVICE>CSM_AGENT>alert_email_config_ttl"
+DEFAULT_ALERT_EMAIL_CONFIG_TTL = 300  # seconds
 CSM_ALERT_NOTIFICATION_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 CSM_SMTP_TEST_EMAIL_ATTEMPTS = 1
 CSM_SMTP_TEST_EMAIL_TIMEOUT = 15
@@ -408,8 +442,9 @@ NTP_SERVER_ADDRESS = 'ntp_server_address'
 NTP_TIMEZONE_OFFSET = 'ntp_timezone_offset'
 
 # Audit Log
-AUDIT_LOG = "/tmp/auditlogs/"
 MAX_RESULT_WINDOW = 10000
+AUDIT_LOG_PAGE_SIZE = "Log>audit_log_page_size"
+DEFAULT_AUDIT_LOG_PAGE_SIZE = 1000
 
 # Syslog constants
 LOG_LEVEL = "INFO"
@@ -485,6 +520,13 @@ CSM_LOGROTATE_DEST = "{0}/csm_agent_log.conf".format(LOGROTATE_DIR_DEST)
 # Service instance literal constant
 FW_UPDATE_SERVICE = "fw_update_service"
 HOTFIX_UPDATE_SERVICE = "hotfix_update_service"
+UPLOAD_SERVICE = "upload_service"
+UPLOAD_SESSION_TIMEOUT = "UPDATE>upload_session_timeout"
+DEFAULT_UPLOAD_SESSION_TIMEOUT = 24 * 60 * 60  # seconds
+UPLOAD_SWEEP_INTERVAL = "UPDATE>upload_sweep_interval"
+DEFAULT_UPLOAD_SWEEP_INTERVAL = 60 * 60  # seconds
+# Same limit for multipart and resumable uploads
+DEFAULT_UPLOAD_SIZE_LIMIT = 2 * (1024 ** 3)  # bytes
 SECURITY_SERVICE = "security_service"
 STORAGE_CAPACITY_SERVICE = "storage_capacity_service"
 USL_SERVICE = "usl_service"
@@ -517,6 +559,11 @@ SIZE = 'size'
 USED = 'used'
 AVAILABLE = 'avail'
 USAGE_PERCENTAGE = 'usage_percentage'
+CAPACITY_SAMPLE_TIME = 'time'
+CAPACITY_SAMPLE_PERIOD = 'CSM_SERVICE>CSM_AGENT>capacity_sample_period'
+DEFAULT_CAPACITY_SAMPLE_PERIOD = 60  # seconds
+CAPACITY_HISTORY_SIZE = 'CSM_SERVICE>CSM_AGENT>capacity_history_size'
+DEFAULT_CAPACITY_HISTORY_SIZE = 60
 
 # Keys for  Description
 DECRYPTION_KEYS = {
@@ -525,6 +572,10 @@ DECRYPTION_KEYS = {
     "CSM>password": "system"
 }
 CLUSTER_ID_KEY = "PROVISIONER>cluster_id"
+PROVISIONER_MAX_WORKERS = "PROVISIONER>max_workers"
+DEFAULT_PROVISIONER_MAX_WORKERS = 4
+PROVISIONER_CACHE_TTL = "PROVISIONER>cache_ttl"
+DEFAULT_PROVISIONER_CACHE_TTL = 60  # seconds
 # Provisioner status
 PROVISIONER_CONFIG_TYPES = ['network', 'firmware', 'hotfix']
 
@@ -633,11 +684,49 @@ STORAGE_TYPE = "storage_type"
 STORAGE = "storage"
 STORAGE_TYPE_VIRTUAL = "virtual"
 FEATURE_ENDPOINT_MAP_INDEX = "FEATURE_COMPONENTS.feature_endpoint_map"
+FEATURE_SUPPORT_CACHE_TTL = "CSM_SERVICE>CSM_AGENT>feature_support_ttl"
+DEFAULT_FEATURE_SUPPORT_CACHE_TTL = 300  # seconds
+SESSION_BACKEND = "CSM_SERVICE>CSM_AGENT>session_backend"
+SESSION_BACKEND_MEMORY = "memory"
+SESSION_BACKEND_DB = "db"
+# Name the key of the S3 secrets of the sessions in the db is generated for
+SESSION_CIPHER_KEY = "session"
+SESSION_SWEEP_INTERVAL = "CSM_SERVICE>CSM_AGENT>session_sweep_interval"
+DEFAULT_SESSION_SWEEP_INTERVAL = 60  # seconds
+USER_CACHE_TTL = "CSM_SERVICE>CSM_AGENT>user_cache_ttl"
+DEFAULT_USER_CACHE_TTL = 300  # seconds
+S3_CLIENT_POOL_SIZE = "S3>client_pool_size"
+DEFAULT_S3_CLIENT_POOL_SIZE = 256
+S3_CLIENT_IDLE_TIMEOUT = "S3>client_idle_timeout"
+DEFAULT_S3_CLIENT_IDLE_TIMEOUT = 300  # seconds
+S3_CLIENT_WORKERS = "S3>client_workers"
+DEFAULT_S3_CLIENT_WORKERS = 16
+S3_TRANSPORT = "S3>transport"
+S3_TRANSPORT_AIOHTTP = "aiohttp"
+S3_TRANSPORT_BOTO = "boto"
+S3_REGION = "S3>region"
+DEFAULT_S3_REGION = "us-east-1"
+S3_LISTING_CACHE_TTL = "S3>listing_cache_ttl"
+DEFAULT_S3_LISTING_CACHE_TTL = 10  # seconds
 OK = 'ok'
 EMPTY_PASS_FIELD = "Password field can't be empty."
 HEALTH_REQUIRED_FIELDS = {'health', 'severity', 'alert_uuid', 'alert_type'}
 SHUTDOWN_CRON_TIME = "shutdown_cron_time"
 ES_RETRY = "ELASTICSEARCH>retry"
+ALERT_BATCH_SIZE = "ALERTS>batch_size"
+ALERT_FLUSH_INTERVAL = "ALERTS>flush_interval"
+DEFAULT_ALERT_BATCH_SIZE = 100
+DEFAULT_ALERT_FLUSH_INTERVAL = 0.5  # seconds
+ALERT_INDEX_SIZE = "ALERTS>index_size"
+DEFAULT_ALERT_INDEX_SIZE = 10000
+ALERT_CONSUMER_MODE = "ALERTS>consumer_mode"
+ALERT_CONSUMER_THREAD = "thread"
+ALERT_CONSUMER_ASYNC = "async"
+DEFAULT_ALERT_CONSUMER_MODE = ALERT_CONSUMER_THREAD
+ALERT_PREFETCH_COUNT = "ALERTS>prefetch_count"
+DEFAULT_ALERT_PREFETCH_COUNT = 100
+ALERT_CONSUMERS = "ALERTS>consumers"
+DEFAULT_ALERT_CONSUMERS = 4
 ES_RECORD_LIMIT = 1000
 ES_CLEANUP_PERIOD_VIRTUAL = 2  # days
 LOGROTATE_AMOUNT_VIRTUAL = 3
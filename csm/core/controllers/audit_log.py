@@ -14,8 +14,9 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import json
-from csm.core.services.file_transfer import FileType
 from cortx.utils.log import Log
+from cortx.utils.conf_store.conf_store import Conf
+from csm.core.blogic import const
 from csm.core.controllers.view import CsmView, CsmResponse, CsmAuth
 from marshmallow import Schema, fields, validate, ValidationError, validates
 from csm.common.errors import InvalidRequest
@@ -49,14 +50,16 @@ class AuditLogShowView(CsmView):
 
         start_date = request_data["start_date"]
         end_date = request_data["end_date"] 
-        return await self._service.get_by_range(component, start_date, end_date)
+        limit = int(Conf.get(const.CSM_GLOBAL_INDEX, "Log>max_result_window",
+                             const.MAX_RESULT_WINDOW))
+        return await self.stream_json_list(None, self._service.iter_by_range(
+            component, start_date, end_date, limit))
 
 @CsmView._app_routes.view("/api/v1/auditlogs/download/{component}")
 class AuditLogDownloadView(CsmView):
     def __init__(self, request):
         super(AuditLogDownloadView, self).__init__(request)
         self._service = self.request.app["audit_log"]
-        self._file_service = self.request.app["download_service"]
         self._service_dispatch = {}
 
     """
@@ -76,6 +79,9 @@ class AuditLogDownloadView(CsmView):
 
         start_date = request_data["start_date"]
         end_date = request_data["end_date"]
-        zip_file = await self._service.get_audit_log_zip(component, start_date, end_date)
-        return self._file_service.get_file_response(FileType.AUDIT_LOG, zip_file)
+        # The log is compressed while it is read and sent, no file is written
+        file_name = self._service.get_audit_log_gzip_name(component, start_date, end_date)
+        return await self.stream_attachment(file_name,
+            self._service.iter_audit_log_gzip(component, start_date, end_date),
+            content_type='application/gzip')
 
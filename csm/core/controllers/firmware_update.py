@@ -46,8 +46,9 @@ class FirmwarePackageUploadView(CsmView):
         Log.debug(f"Handling firmware package upload api"
                  f" user_id: {self.request.session.credentials.user_id}")
         with FileCache() as cache:
-            parsed_multipart = await self.parse_multipart_request(self.request, cache)
             try:
+                parsed_multipart = await self.parse_upload_request(
+                    self.request, cache, 'package', FirmwareUploadSchema())
                 multipart_data = FirmwareUploadSchema().load(parsed_multipart, unknown='EXCLUDE')
             except ValidationError as val_err:
                 raise InvalidRequest(f"Invalid package. {val_err}")
@@ -43,6 +43,20 @@ class HealthSummaryView(CsmView):
     async def get(self):
         return await self.health_service.fetch_health_summary()
 
+@CsmView._app_routes.view("/api/v1/system/health/snapshot")
+class HealthSnapshotView(CsmView):
+    def __init__(self, request):
+        super().__init__(request)
+        self.health_service = self.request.app[const.HEALTH_SERVICE]
+
+    @CsmAuth.permissions({Resource.HEALTH: {Action.LIST}})
+    async def get(self):
+        """
+        Health summary and the seq of the last delta of the "health"
+        websocket topic it includes
+        """
+        return await self.health_service.fetch_health_snapshot()
+
 @CsmView._app_routes.view("/api/v1/system/health/view")
 class HealthView(CsmView):
     def __init__(self, request):
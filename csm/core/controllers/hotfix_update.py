@@ -45,7 +45,8 @@ class CsmHotfixUploadView(CsmView):
     @CsmAuth.permissions({Resource.MAINTENANCE: {Action.UPDATE}})
     async def post(self):
         with FileCache() as cache:
-            parsed_multipart = await self.parse_multipart_request(self.request, cache)
+            parsed_multipart = await self.parse_upload_request(self.request, cache, 'package',
+                                                               HotFixUploadSchema())
             multipart_data = HotFixUploadSchema().load(parsed_multipart, unknown='EXCLUDE')
 
             package_ref = multipart_data['package']['file_ref']
@@ -40,7 +40,7 @@ class BasePermissionsView(CsmView):
         'alert': {'list': True, 'update': True}
         """
         mod_permissions = {}
-        for resource, action_list in permissions._items.items():
+        for resource, action_list in permissions.as_dict().items():
             action_dict = {}
             for action in action_list:
                 action_dict[action] = True
@@ -53,6 +53,10 @@ class S3AccountsListView(S3BaseView):
         limit = self.request.rel_url.query.get("limit", None)
         marker = self.request.rel_url.query.get("continue", None)
         with self._guard_service():
+            if limit is None and marker is None:
+                # Full listing, streamed while the pages are fetched
+                return await self.stream_json_list("s3_accounts",
+                    self._service.iter_accounts(self.request.session.credentials))
             return await self._service.list_accounts(self.request.session.credentials,
                                                      marker, limit)
 
@@ -86,9 +86,15 @@ class IamUserListView(S3AuthenticatedView):
         """
         Log.debug(f"Handling list IAM USER get request. "
                   f"user_id: {self.request.session.credentials.user_id}")
+        limit = self.request.rel_url.query.get("limit", None)
+        marker = self.request.rel_url.query.get("continue", None)
         # Execute List User Task
         with self._guard_service():
-            return await self._service.list_users(self._s3_session)
+            if limit is None and marker is None:
+                # Full listing, streamed while the pages are fetched
+                return await self.stream_json_list("iam_users",
+                    self._service.iter_users(self._s3_session), {"is_truncated": False})
+            return await self._service.list_users(self._s3_session, marker, limit)
 
     @CsmAuth.permissions({Resource.S3IAMUSERS: {Action.CREATE}})
     async def post(self):
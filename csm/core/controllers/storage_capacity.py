@@ -29,13 +29,31 @@ class StorageCapacityView(CsmView):
         super(StorageCapacityView, self).__init__(request)
         self._service = self.request.app[const.STORAGE_CAPACITY_SERVICE]
 
-    @CsmAuth.permissions({Resource.STATS: {Action.LIST}})
-    @Log.trace_method(Log.DEBUG)
-    async def get(self):
+    def _get_format_params(self):
         unit = self.request.query.get(const.UNIT,const.DEFAULT_CAPACITY_UNIT)
         round_off_value = int(self.request.query.get(const.ROUNDOFF_VALUE,const.DEFAULT_ROUNDOFF_VALUE))
         if round_off_value <= 0:
             raise InvalidRequest(f"Round off value should be greater than 0. Default value:{const.DEFAULT_ROUNDOFF_VALUE}")
         if (not unit.upper() in const.UNIT_LIST) and (not unit.upper()==const.DEFAULT_CAPACITY_UNIT):
             raise InvalidRequest(f"Invalid unit. Please enter units from {','.join(const.UNIT_LIST)}. Default unit is:{const.DEFAULT_CAPACITY_UNIT}")
+        return unit, round_off_value
+
+    @CsmAuth.permissions({Resource.STATS: {Action.LIST}})
+    @Log.trace_method(Log.DEBUG)
+    async def get(self):
+        unit, round_off_value = self._get_format_params()
         return await self._service.get_capacity_details(unit=unit, round_off_value=round_off_value)
+
+
+@CsmView._app_routes.view("/api/v1/capacity/history")
+class StorageCapacityHistoryView(StorageCapacityView):
+    """
+    GET REST API view implementation for getting the latest capacity samples.
+    """
+
+    @CsmAuth.permissions({Resource.STATS: {Action.LIST}})
+    @Log.trace_method(Log.DEBUG)
+    async def get(self):
+        unit, round_off_value = self._get_format_params()
+        return {"samples": await self._service.get_capacity_history(
+            unit=unit, round_off_value=round_off_value)}
@@ -0,0 +1,93 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import json
+from marshmallow import Schema, fields, validate
+from marshmallow.exceptions import ValidationError
+from csm.core.controllers.view import CsmView, CsmAuth
+from csm.common.errors import InvalidRequest
+from csm.common.permission_names import Resource, Action
+from cortx.utils.log import Log
+from csm.core.blogic import const
+
+# Header with the offset of the content of an upload request
+UPLOAD_OFFSET_HEADER = 'Upload-Offset'
+UPLOAD_CHUNK_SIZE = 1024 ** 2
+
+
+class UploadCreationSchema(Schema):
+    filename = fields.Str(required=True, validate=validate.Length(min=1, max=255))
+    size = fields.Int(required=True, validate=validate.Range(min=1))
+
+
+@CsmView._app_routes.view("/api/v1/uploads")
+class UploadListView(CsmView):
+    """
+    Resumable uploads of update packages. An upload is created here, its
+    content is sent to /api/v1/uploads/{upload_id}, then its upload_id is
+    posted to the hotfix or firmware upload API instead of a multipart file.
+    """
+
+    def __init__(self, request):
+        super().__init__(request)
+        self._service = self.request.app[const.UPLOAD_SERVICE]
+
+    @CsmAuth.permissions({Resource.MAINTENANCE: {Action.UPDATE}})
+    async def post(self):
+        Log.debug(f"Handling upload creation request."
+                  f" user_id: {self.request.session.credentials.user_id}")
+        try:
+            upload = UploadCreationSchema().load(await self.request.json(), unknown='EXCLUDE')
+        except json.decoder.JSONDecodeError:
+            raise InvalidRequest(message_args="Request body missing")
+        except ValidationError as val_err:
+            raise InvalidRequest(f"Invalid request body: {val_err}")
+        return self._service.create(upload['filename'], upload['size'])
+
+
+@CsmView._app_routes.view("/api/v1/uploads/{upload_id}")
+class UploadView(CsmView):
+    def __init__(self, request):
+        super().__init__(request)
+        self._service = self.request.app[const.UPLOAD_SERVICE]
+
+    @CsmAuth.permissions({Resource.MAINTENANCE: {Action.UPDATE}})
+    async def get(self):
+        """
+        State of the upload, offset is where the content has to be sent from
+        """
+        return self._service.get(self.request.match_info["upload_id"])
+
+    @CsmAuth.permissions({Resource.MAINTENANCE: {Action.UPDATE}})
+    async def put(self):
+        """
+        Append the request body to the upload at the offset of the Upload-Offset header
+        """
+        upload_id = self.request.match_info["upload_id"]
+        try:
+            offset = int(self.request.headers.get(UPLOAD_OFFSET_HEADER, ''))
+        except ValueError:
+            raise InvalidRequest(f'"{UPLOAD_OFFSET_HEADER}" header is absent or invalid')
+        Log.debug(f"Handling upload {upload_id} at offset {offset}."
+                  f" user_id: {self.request.session.credentials.user_id}")
+        return await self._service.append(upload_id, offset,
+                                          self.request.content.iter_chunked(UPLOAD_CHUNK_SIZE))
+
+    @CsmAuth.permissions({Resource.MAINTENANCE: {Action.UPDATE}})
+    async def delete(self):
+        upload_id = self.request.match_info["upload_id"]
+        self._service.get(upload_id)
+        self._service.remove(upload_id)
+        return {"upload_id": upload_id}
@@ -18,7 +18,8 @@ import asyncio
 from csm.common.errors import InvalidRequest
 from cortx.utils.log import Log
 from csm.core.services.file_transfer import FileRef, FileCache
-from csm.common.errors import CsmInternalError
+from csm.common.errors import CsmError, CsmInternalError
+from csm.core.blogic import const
 import os
 
 from aiohttp import web
@@ -132,6 +133,109 @@ class CsmView(web.View):
             permissions = view_permissions
         return permissions
 
+    async def stream_json_list(self, key, items, extra=None,
+                               chunk_size=64 * 1024) -> web.StreamResponse:
+        """
+        Stream a listing as the chunked JSON object {key: [items], **extra},
+        so a long listing is never kept in memory as a whole.
+        The first item is fetched before the response is started, so errors
+        of the listing request are still reported with their own status.
+        A later error cannot change the status any more, so the listing ends
+        with the error record {"error": {"error_code", "message"}}: as the
+        "error" key of the object instead of the extra keys, or as the last
+        item of a bare list.
+        :param key: Key of the list in the JSON object, None to send a bare list
+        :param items: Async iterator of JSON serializable items
+        :param extra: Other keys of the JSON object
+        :param chunk_size: Number of bytes sent in one chunk
+        """
+        items = items.__aiter__()
+        try:
+            first = [await items.__anext__()]
+        except StopAsyncIteration:
+            first = []
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        response.enable_chunked_encoding()
+        await response.prepare(self.request)
+
+        buffer = ['[' if key is None else f'{{{json.dumps(key)}: [']
+        size = 0
+        separator = ''
+        async def write(item):
+            nonlocal separator, size
+            chunk = separator + json.dumps(item, default=str)
+            separator = ', '
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                await response.write(''.join(buffer).encode('utf-8'))
+                buffer.clear()
+                size = 0
+
+        error = None
+        try:
+            for item in first:
+                await write(item)
+            async for item in items:
+                await write(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            Log.error(f"Listing failed after {self.request.path} response started: {e}")
+            error = {"error": self._stream_error(e)}
+            if key is None:
+                await write(error)
+        buffer.append(']')
+        if key is not None:
+            for extra_key, value in (extra if error is None else error).items():
+                buffer.append(f', {json.dumps(extra_key)}: {json.dumps(value, default=str)}')
+            buffer.append('}')
+        await response.write(''.join(buffer).encode('utf-8'))
+        await response.write_eof()
+        return response
+
+    async def stream_attachment(self, filename, chunks,
+                                content_type='application/octet-stream') -> web.StreamResponse:
+        """
+        Stream a file download that is produced while it is sent.
+        The first chunk is fetched before the response is started, so errors
+        are still reported with their own status.
+        On a later error the connection is closed without the last chunk of
+        the chunked encoding, so clients see an incomplete download.
+        :param filename: File name suggested to the client
+        :param chunks: Async iterator of bytes
+        :param content_type: Content type of the file
+        """
+        chunks = chunks.__aiter__()
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = b''
+        response = web.StreamResponse(headers={
+            'Content-Type': content_type,
+            'Content-Disposition': f'attachment; filename="{filename}"'})
+        response.enable_chunked_encoding()
+        await response.prepare(self.request)
+        try:
+            await response.write(first)
+            async for chunk in chunks:
+                await response.write(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            Log.error(f"Download failed after {self.request.path} response started: {e}")
+            if self.request.transport is not None:
+                self.request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _stream_error(err) -> dict:
+        if isinstance(err, CsmError):
+            return {"error_code": err.rc(), "message": err.error()}
+        return {"error_code": None, "message": str(err)}
+
     @classmethod
     def asyncio_shield(cls, func):
         def wrapper(*arg, **kw):
@@ -161,7 +265,7 @@ class CsmView(web.View):
                                       request,
                                       file_cache: FileCache,
                                       content_byte_size_limit=100 * (1024 ** 2),
-                                      file_byte_size_limit=2 * (1024 ** 3)):
+                                      file_byte_size_limit=const.DEFAULT_UPLOAD_SIZE_LIMIT):
         """
         Parse multipart request to dict
         Default limit for non-file content is 100 MB
@@ -225,11 +329,12 @@ class CsmView(web.View):
                     if size > file_byte_size_limit:
                         raise InvalidRequest(
                             f'File "{filename}" is bigger than permissible limit. Max size = {file_byte_size_limit} bytes')
-                    file_cache.write_chunck(file_uuid, chunk)
+                    await file_cache.write_chunk_async(file_uuid, chunk)
                 parse_result = {
                     'content_type': ct,
                     'filename': filename,
-                    'file_ref': FileRef(file_uuid, file_cache.cache_dir)
+                    'file_ref': FileRef(file_uuid, file_cache.cache_dir,
+                                        file_cache.get_sha256(file_uuid))
                 }
             else:
                 content = b''
@@ -248,6 +353,33 @@ class CsmView(web.View):
 
         return parse_results
 
+    async def parse_upload_request(self, request, file_cache: FileCache, fieldname,
+                                   schema=None):
+        """
+        Parse a file upload request to the same dict as parse_multipart_request.
+        The file is either sent as multipart or was uploaded before with a
+        resumable upload whose id is sent as JSON: {"upload_id": "..."}
+        :param fieldname: Field of the dict the resumable upload is put to
+        :param schema: Schema of the dict, a resumable upload is taken only
+                       if its filename passes it, ValidationError is raised otherwise
+        """
+        if request.content_type != 'application/json':
+            return await self.parse_multipart_request(request, file_cache)
+
+        try:
+            upload_id = (await request.json())['upload_id']
+        except (json.JSONDecodeError, KeyError, TypeError):
+            raise InvalidRequest('"upload_id" of a complete upload is expected')
+        uploads = request.app[const.UPLOAD_SERVICE]
+        parse_result = {
+            'content_type': request.content_type,
+            'filename': uploads.get(upload_id)['filename']
+        }
+        if schema is not None:
+            schema.load({fieldname: parse_result}, unknown='EXCLUDE')
+        parse_result['file_ref'] = await uploads.take(upload_id, file_cache)
+        return {fieldname: parse_result}
+
     async def aiohttp_body_getter(self,
                                   body_reader,
                                   chunk_byte_size_limit=10 * (1024 **2)):
@@ -0,0 +1,36 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from schematics.types import StringType, DateTimeType, DictType, ListType
+from csm.core.blogic.models import CsmModel
+
+
+class SessionModel(CsmModel):
+    """
+    Session record for the sessions shared by several csm_agent processes.
+    """
+
+    _id = "session_id"
+
+    session_id = StringType()
+    # Lower case user ID, user IDs are compared case insensitively
+    user_key = StringType()
+    user_id = StringType()
+    credentials_type = StringType()
+    access_key = StringType()
+    secret_key = StringType()
+    session_token = StringType()
+    permissions = DictType(ListType(StringType))
+    expiry_time = DateTimeType()
@@ -52,6 +52,8 @@ class User(CsmModel):
     _id = "user_id"
 
     user_id = StringType()
+    # Lowercase user_id, users are looked up by it as user ids are case insensitive
+    user_id_lower = StringType()
     user_type = StringType()
     roles = ListType(StringType)
     password_hash = StringType()
@@ -69,10 +71,15 @@ class User(CsmModel):
 
         self.updated_time = datetime.now(timezone.utc)
 
+    @staticmethod
+    def normalize_id(user_id: str) -> str:
+        return user_id.lower()
+
     @staticmethod
     def instantiate_csm_user(user_id, password, email="", roles=[], alert_notification=True):
         user = User()
         user.user_id = user_id
+        user.user_id_lower = User.normalize_id(user_id)
         user.user_type = UserType.CsmUser.value
         user.password_hash = Passwd.hash(password)
         user.roles = roles
@@ -86,6 +93,7 @@ class User(CsmModel):
     def instantiate_s3_account_user(user_id, roles=[]):
         user = User()
         user.user_id = user_id
+        user.user_id_lower = User.normalize_id(user_id)
         user.user_type = UserType.S3AccountUser.value
         user.password_hash = None
         user.roles = roles
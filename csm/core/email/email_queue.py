@@ -15,9 +15,9 @@
 
 import asyncio
 import copy
-import functools
+from collections import OrderedDict
 from cortx.utils.log import Log
-from csm.common.email import SmtpServerConfiguration, EmailSender, EmailError
+from csm.common.email import SmtpServerConfiguration, SmtpConnectionPool, EmailError
 from email.message import EmailMessage
 
 
@@ -32,10 +32,13 @@ def chunk_generator(orig_list, chunk_size):
 
 class EmailSenderQueue:
     """
-    Interface to a worker that performs mass email sending.
-    For now it is just a worker coroutine, but later it might end up as an
+    Interface to the workers that perform mass email sending.
+    For now they are just worker coroutines, but later it might end up as an
     interface to some separate worker process.
 
+    The workers share a pool of kept-alive connections per SMTP server,
+    see SmtpConnectionPool.
+
     How to interact with this class:
     instance = EmailSenderQueue()
     await instance.start_worker()
@@ -44,16 +47,31 @@ class EmailSenderQueue:
 
     await instance.stop_worker(True)
     """
-    def __init__(self):
+    def __init__(self, workers=1, pool_size=None, idle_timeout=60):
+        """
+        :param workers: Number of messages sent concurrently
+        :param pool_size: Maximum number of connections per SMTP server, workers by default
+        :param idle_timeout: Seconds an unused connection is kept open
+        """
         self.queue = asyncio.Queue()
-        self.worker = None
+        self.workers = []
+        self._workers_count = max(1, workers)
+        self._pool_size = pool_size or self._workers_count
+        self._idle_timeout = idle_timeout
+        self._pools = OrderedDict()
+
+    @property
+    def worker(self):
+        return self.workers[0] if self.workers else None
 
     @Log.trace_method(level=Log.DEBUG)
-    async def enqueue_email(self, message: EmailMessage, config: SmtpServerConfiguration):
+    async def enqueue_email(self, message: EmailMessage, config: SmtpServerConfiguration,
+                            recipients=None):
         """
         Enqueue an email message to be sent
+        :param recipients: Envelope recipients, taken from the message headers if omitted
         """
-        self.queue.put_nowait((message, config))
+        self.queue.put_nowait((message, recipients, config))
 
     @Log.trace_method(level=Log.DEBUG)
     async def enqueue_bulk_email(self, message: EmailMessage, recipients,
@@ -68,14 +86,16 @@ class EmailSenderQueue:
             return
 
         if len(recipients) == 1:
-            msg = copy.deepcopy(message)
+            # Only the headers are copied, the MIME parts are shared
+            msg = copy.copy(message)
+            msg._headers = list(message._headers)
             msg['To'] = recipients[0]
             await self.enqueue_email(msg, config)
         else:
+            # The recipients are passed as the envelope only, the same way as
+            # Bcc recipients are, so the message itself is shared by the chunks
             for bcc_list in chunk_generator(recipients, EMAIL_BCC_BULK_LIMIT):
-                msg = copy.deepcopy(message)
-                msg['Bcc'] = ', '.join(bcc_list)
-                await self.enqueue_email(msg, config)
+                await self.enqueue_email(message, config, bcc_list)
 
     @Log.trace_method(level=Log.DEBUG)
     async def start_worker(self):
@@ -86,39 +106,56 @@ class EmailSenderQueue:
         """
         Pauses until the worker's queue becomes empty
         """
-        if self.worker:
+        if self.workers:
             await self.queue.join()
 
     @Log.trace_method(level=Log.DEBUG)
     async def stop_worker(self, graceful=False):
-        if self.worker:
+        if self.workers:
             if graceful:
                 await self.queue.join()
 
-            self.worker.cancel()
-            self.worker = None
+            for worker in self.workers:
+                worker.cancel()
+            self.workers = []
+            pools, self._pools = self._pools, OrderedDict()
+            for pool in pools.values():
+                await pool.close()
 
     @Log.trace_method(Log.DEBUG)
     def start_worker_sync(self):
-        if self.worker:
+        if self.workers:
             return
 
-        self.worker = asyncio.ensure_future(self._worker())
+        self.workers = [asyncio.ensure_future(self._worker())
+                        for _ in range(self._workers_count)]
 
-    async def _worker(self):
-        config = None
+    def _get_pool(self, config):
+        pool = self._pools.pop(config, None)
+        if pool is None:
+            pool = SmtpConnectionPool(config, self._pool_size, self._idle_timeout)
+            while len(self._pools) >= EMAIL_CLIENT_CACHE_SIZE:
+                _, evicted = self._pools.popitem(last=False)
+                asyncio.ensure_future(evicted.close())
+        self._pools[config] = pool
+        return pool
 
-        @functools.lru_cache(EMAIL_CLIENT_CACHE_SIZE)
-        def _get_client(config):
-            return EmailSender(config)
+    async def _close_idle(self):
+        for pool in list(self._pools.values()):
+            await pool.close_idle()
 
+    async def _worker(self):
         while True:
-            message, config = await self.queue.get()
-            email_client = _get_client(config)
+            try:
+                message, recipients, config = await asyncio.wait_for(
+                    self.queue.get(), self._idle_timeout)
+            except asyncio.TimeoutError:
+                await self._close_idle()
+                continue
 
             try:
-                await email_client.send_message(message)
+                await self._get_pool(config).send_message(message, recipients)
             except EmailError as e:
-                Log.info(f'Email sending error: {e}, target: {message["To"]}')
-
-            self.queue.task_done()
+                Log.info(f'Email sending error: {e}, target: {recipients or message["To"]}')
+            finally:
+                self.queue.task_done()
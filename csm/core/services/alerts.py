@@ -16,7 +16,9 @@
 # Let it all reside in a separate controller until we've all agreed on request
 # processing architecture
 import re
+import html
 import time
+from csm.common.cache import TtlCache
 from csm.common.observer import Observable
 from datetime import datetime, timedelta, timezone
 from threading import Event, Thread
@@ -25,7 +27,7 @@ from csm.common.email import EmailSender
 from csm.common.services import Service, ApplicationService
 from csm.common.queries import SortBy, SortOrder, QueryLimits, DateTimeRange
 from csm.core.blogic.models.alerts import IAlertStorage, Alert
-from csm.common.errors import CsmNotFoundError, CsmError, InvalidRequest
+from csm.common.errors import CsmNotFoundError, CsmError, InvalidRequest, CSM_INTERNAL_ERROR
 from csm.core.blogic import const
 from cortx.utils.data.db.db_provider import (DataBaseProvider, GeneralConfig)
 from cortx.utils.data.access.filters import Compare, And, Or
@@ -40,6 +42,7 @@ from schematics.types import StringType, BooleanType, IntType
 from typing import Optional, Iterable, Dict
 from csm.common.payload import Payload, Json, JsonMessage
 import asyncio
+from collections import OrderedDict
 from cortx.utils.conf_store.conf_store import Conf
 
 
@@ -50,16 +53,176 @@ ALERTS_MSG_TOO_LONG_COMMENT = "alerts_too_long_comment"
 ALERTS_MSG_RESOLVED_AND_ACKED_ERROR = "alerts_resolved_and_acked"
 ALERTS_MSG_NON_SORTABLE_COLUMN = "alerts_non_sortable_column"
 
+class OpenAlertsIndex:
+    """
+    Bounded in-memory index of the latest open (not resolved or not
+    acknowledged) alert per (sensor_info, module_type).
+    The index is kept up to date by AlertRepository on every write, so the
+    previous alert of a sensor can be found without querying the DB.
+    The least recently used entries are evicted once max_size is reached.
+    """
+
+    def __init__(self, max_size: int):
+        self._alerts = OrderedDict()
+        self._max_size = max_size
+        self._complete = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(sensor_info, module_type):
+        return str(sensor_info), str(module_type)
+
+    @staticmethod
+    def _is_open(alert: AlertModel):
+        return not (alert.resolved and alert.acknowledged)
+
+    def __len__(self):
+        return len(self._alerts)
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def warm_up(self, alerts: Iterable[AlertModel]):
+        """
+        Loads the open alerts fetched from the DB, at most max_size of them.
+        Entries written after the alerts were fetched are kept as they are
+        newer.
+        If fewer rows than max_size were fetched, all the open alerts are in
+        the index and a sensor missing in the index is known to have no open
+        alert. Several rows may belong to one sensor, so the rows are counted
+        rather than the indexed sensors.
+        """
+        rows = 0
+        for alert in alerts:
+            rows += 1
+            key = self._key(alert.sensor_info, alert.module_type)
+            if key not in self._alerts and self._is_open(alert):
+                self._alerts[key] = AlertModel(alert.to_native())
+                self._alerts.move_to_end(key, last=False)
+        self._complete = rows < self._max_size
+        self._evict()
+
+    def lookup(self, sensor_info, module_type):
+        """
+        Looks up the open alert of the sensor.
+        :return: tuple of flag telling whether the index knows the answer and
+        a copy of the alert object (None if the sensor has no open alert)
+        """
+        key = self._key(sensor_info, module_type)
+        alert = self._alerts.get(key)
+        if alert is not None:
+            self._alerts.move_to_end(key)
+            self.hits += 1
+            return True, AlertModel(alert.to_native())
+        if self._complete:
+            self.hits += 1
+            return True, None
+        self.misses += 1
+        return False, None
+
+    def put(self, alert: AlertModel):
+        """
+        Stores a copy of the alert, the alert is removed if it is closed.
+        """
+        key = self._key(alert.sensor_info, alert.module_type)
+        if self._is_open(alert):
+            self._alerts[key] = AlertModel(alert.to_native())
+            self._alerts.move_to_end(key)
+            self._evict()
+        else:
+            self._alerts.pop(key, None)
+
+    def update(self, sensor_info, module_type, update_params: dict):
+        """
+        Applies the partial update to the indexed alert of the sensor.
+        """
+        key = self._key(sensor_info, module_type)
+        alert = self._alerts.get(key)
+        if alert is None:
+            return
+        for field, value in update_params.items():
+            alert[field] = value
+        if isinstance(alert.updated_time, int):
+            alert.updated_time = datetime.fromtimestamp(alert.updated_time, timezone.utc)
+        self.put(alert)
+
+    def invalidate(self, sensor_info, module_type):
+        """
+        Removes the sensor from the index so the DB is queried next time.
+        """
+        self._alerts.pop(self._key(sensor_info, module_type), None)
+        self._complete = False
+
+    def _evict(self):
+        while len(self._alerts) > self._max_size:
+            self._alerts.popitem(last=False)
+            self._complete = False
+
+    def stats(self) -> dict:
+        return {"size": len(self._alerts), "hits": self.hits, "misses": self.misses}
+
+
 class AlertRepository(IAlertStorage):
-    def __init__(self, storage: DataBaseProvider):
+    def __init__(self, storage: DataBaseProvider, index_size: Optional[int] = None):
+        """
+        :param storage: DataBaseProvider instance
+        :param index_size: If set, the latest open alert of up to index_size
+        sensors is kept in memory (see OpenAlertsIndex).
+        """
         self.db = storage
+        self.index = OpenAlertsIndex(index_size) if index_size else None
+
+    async def warm_up_index(self):
+        """
+        Loads the open alerts from the DB into the in-memory index.
+        """
+        if self.index is None:
+            return
+        alerts = await self.retrieve_by_range(None, show_all=False,
+            sort=SortBy(const.ALERT_CREATED_TIME, SortOrder.DESC),
+            limits=QueryLimits(self.index.max_size, 0))
+        self.index.warm_up(alerts)
+        Log.info(f"Open alerts index warmed up: {self.index.stats()}")
+
+    def _index_put(self, *alerts):
+        if self.index is not None:
+            for alert in alerts:
+                self.index.put(alert)
+
+    async def _store_indexed(self, alert: AlertModel):
+        """
+        Stores the alert and writes it through to the index. If the write
+        fails the sensor is dropped from the index as its DB state is unknown.
+        """
+        try:
+            await self.db(AlertModel).store(alert)
+        except Exception:
+            if self.index is not None:
+                self.index.invalidate(alert.sensor_info, alert.module_type)
+            raise
+        self._index_put(alert)
 
     async def store(self, alert: AlertModel):
-        await self.db(AlertModel).store(alert)
+        await self._store_indexed(alert)
 
     async def store_alerts_history(self, alert: AlertsHistoryModel):
         await self.db(AlertsHistoryModel).store(alert)
 
+    async def store_bulk(self, alerts: Iterable[AlertModel]):
+        """
+        Stores (creates or overwrites) several alerts concurrently
+        """
+        await asyncio.gather(*(self._store_indexed(alert) for alert in alerts))
+
+    async def store_alerts_history_bulk(self, alerts: Iterable[AlertsHistoryModel]):
+        """
+        Stores several alerts history records concurrently
+        """
+        await asyncio.gather(*(self.db(AlertsHistoryModel).store(alert)
+                               for alert in alerts))
+
     async def retrieve(self, alert_id) -> AlertModel:
         query = Query().filter_by(Compare(AlertModel.alert_uuid, '=', alert_id))
         return next(iter(await self.db(AlertModel).get(query)), None)
@@ -69,22 +232,66 @@ class AlertRepository(IAlertStorage):
         return next(iter(await self.db(AlertsHistoryModel).get(query)), None)
 
     async def retrieve_by_sensor_info(self, sensor_info, module_type) -> AlertModel:
+        if self.index is not None:
+            found, alert = self.index.lookup(sensor_info, module_type)
+            if found:
+                return alert
         filter = And(And(Compare(AlertModel.sensor_info, '=', \
                 str(sensor_info)), Compare(AlertModel.module_type, "=", \
                 str(module_type))), Or(Compare(AlertModel.acknowledged, '=', \
                 False), Compare(AlertModel.resolved, '=', False)))
         query = Query().filter_by(filter)
-        return next(iter(await self.db(AlertModel).get(query)), None)
+        alert = next(iter(await self.db(AlertModel).get(query)), None)
+        if alert:
+            self._index_put(alert)
+        return alert
+
+    async def retrieve_by_sensor_info_bulk(self, sensor_keys) -> Dict[tuple, AlertModel]:
+        """
+        Multi-get counterpart of retrieve_by_sensor_info.
+        :param sensor_keys: Iterable of (sensor_info, module_type) tuples
+        :return: dict mapping (sensor_info, module_type) to the alert found
+        """
+        alerts = {}
+        missing_keys = []
+        for sensor_info, module_type in sensor_keys:
+            found, alert = (self.index.lookup(sensor_info, module_type)
+                            if self.index is not None else (False, None))
+            if not found:
+                missing_keys.append((sensor_info, module_type))
+            elif alert:
+                alerts[(sensor_info, module_type)] = alert
+        sensor_filters = [And(Compare(AlertModel.sensor_info, '=', str(sensor_info)),
+                              Compare(AlertModel.module_type, '=', str(module_type)))
+                          for sensor_info, module_type in missing_keys]
+        if not sensor_filters:
+            return alerts
+        filter = And(Or(*sensor_filters), Or(Compare(AlertModel.acknowledged, '=', \
+                False), Compare(AlertModel.resolved, '=', False)))
+        query = Query().filter_by(filter).limit(const.ES_RECORD_LIMIT)
+        for alert in await self.db(AlertModel).get(query):
+            key = (alert.sensor_info, alert.module_type)
+            if key not in alerts:
+                alerts[key] = alert
+                self._index_put(alert)
+        return alerts
 
     async def update(self, alert: AlertModel):
-        await self.db(AlertModel).store(alert)
+        await self._store_indexed(alert)
 
     async def update_by_sensor_info(self, sensor_info, module_type, update_params):
         filter = And(And(Compare(AlertModel.sensor_info, '=', \
                 str(sensor_info)), Compare(AlertModel.module_type, "=", \
                 str(module_type))), Or(Compare(AlertModel.acknowledged, '=', \
                 False), Compare(AlertModel.resolved, '=', False)))
-        await self.db(AlertModel).update(filter, update_params)
+        try:
+            await self.db(AlertModel).update(filter, update_params)
+        except Exception:
+            if self.index is not None:
+                self.index.invalidate(sensor_info, module_type)
+            raise
+        if self.index is not None:
+            self.index.update(sensor_info, module_type, update_params)
 
     def _prepare_time_range(self, field, time_range: DateTimeRange):
         db_conditions = []
@@ -550,35 +757,80 @@ class AlertsAppService(ApplicationService):
             raise CsmNotFoundError("Alert was not found", ALERTS_MSG_NOT_FOUND)
         return alert.to_primitive_filter_empty()
 
+ALERT_DIGEST_SECTION = """\
+            <div style="background-color:#ffffff;padding: 20px; border:1px solid #cccccc; border-radius: 5px; margin-bottom: 10px;">
+                <label style="font-size: 0.875em; font-weight: bold;">Severity:&nbsp;</label><label>{severity} ({count})</label>
+                <table style="margin-top: 10px; border-collapse: collapse; width: 100%;">
+                    <tr style="font-size: 0.875em; text-align: left;"><th>Created On</th><th>Name</th><th>Id</th><th>Node</th><th>State</th><th>Description</th></tr>
+{rows}
+                </table>
+            </div>"""
+
+ALERT_DIGEST_ROW = """\
+                    <tr><td>{created_on}</td><td>{module_type}</td><td>{resource_id}</td><td>{node_id}</td><td>{state}</td><td>{description}</td></tr>"""
+
+
 class AlertEmailNotifier(Service):
+    """
+    Sends alert notification emails.
+
+    The email settings and the recipients are cached until the system config
+    or a user is changed, see invalidate(). Alerts are collected for
+    digest_window seconds and sent in one digest email grouped by severity.
+    Alerts of the immediate severities, and all the alerts if digest_window
+    is 0, are sent right away in an email of their own.
+    """
+
+    # Order of the severity groups in the digest
+    SEVERITY_ORDER = (const.CRITICAL, const.ERROR, const.WARNING, const.INFORMATIONAL)
+
     def __init__(self, email_sender_queue, config_manager: SystemConfigManager,
-                 template, user_manager: UserManager):
+                 template, user_manager: UserManager, digest_template=None,
+                 digest_window=0, immediate_severities=(), config_ttl=0):
         super().__init__()
         self.email_sender_queue = email_sender_queue
         self.config_manager = config_manager
         self.template = template
         self.user_manager = user_manager
+        self.digest_template = digest_template
+        self.digest_window = digest_window if digest_template is not None else 0
+        self.immediate_severities = {severity.lower() for severity in immediate_severities}
+        self._email_settings = TtlCache(config_ttl, max_size=1)
+        self._pending = []
+        self._flush_task = None
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Drop the cached email settings, called when the system config or a user is changed.
+        """
+        self._email_settings.invalidate()
 
-    @Log.trace_method(Log.DEBUG)
-    async def handle_alert(self, alert):
-        # TODO: check if email notification is enabled for alerts
+    async def _get_email_settings(self):
+        """
+        :returns: (email config, SMTP config, target emails) or None if emails are not configured
+        """
+        settings = self._email_settings.get('settings')
+        if settings is not None:
+            return settings
         system_config = await self.config_manager.get_current_config()
-
-        if not system_config:
-            return
-
-        email_config = system_config.notifications.email
-
+        email_config = system_config.notifications.email if system_config else None
         if not email_config:
-            return  # Nothing to do
-
-        smtp_config = email_config.to_smtp_config()
+            settings = ()  # Nothing to do
+        else:
+            target_emails = email_config.get_target_emails()
+            target_emails.extend(await self.user_manager.get_list_alert_notification_emails())
+            settings = (email_config, email_config.to_smtp_config(), target_emails)
+        self._email_settings.put('settings', settings)
+        return settings
+
+    @staticmethod
+    def _get_template_params(alert):
         """
         Getting the values from alert for filling in email template
         """
         extended_info = JsonMessage(alert.get(const.ALERT_EXTENDED_INFO)).load()
         info = extended_info.get(const.ALERT_INFO)
-        alert_template_params = {
+        return {
             'resource_id': info.get(const.ALERT_RESOURCE_ID, ""),
             'module_type': alert.get(const.ALERT_MODULE_TYPE, ""),
             'cluster_id': info.get(const.ALERT_CLUSTER_ID, ""),
@@ -593,17 +845,65 @@ class AlertEmailNotifier(Service):
             'created_on': alert.created_time.strftime(const.CSM_ALERT_NOTIFICATION_TIME_FORMAT),
             'updated_on': alert.updated_time.strftime(const.CSM_ALERT_NOTIFICATION_TIME_FORMAT)
         }
-        html_body = self.template.render(**alert_template_params)
-        subject = const.CSM_ALERT_EMAIL_NOTIFICATION_SUBJECT
+
+    async def _send(self, subject, html_body):
+        settings = await self._get_email_settings()
+        if not settings:
+            return
+        email_config, smtp_config, target_emails = settings
         message = EmailSender.make_multipart(email_config.smtp_sender_email,
             None, subject, html_body)
-        email_list = await self.user_manager.get_list_alert_notification_emails()
-        target_emails = email_config.get_target_emails()
-        target_emails.extend(email_list)
-
         Log.debug(f"Fetch target email  {target_emails}")
         await self.email_sender_queue.enqueue_bulk_email(message,
-            target_emails, smtp_config)
+            list(target_emails), smtp_config)
+
+    def _render_digest(self, alerts):
+        groups = OrderedDict((severity, []) for severity in self.SEVERITY_ORDER)
+        for severity, params in alerts:
+            groups.setdefault(severity, []).append(params)
+        sections = []
+        for severity, group in groups.items():
+            if not group:
+                continue
+            rows = '\n'.join(ALERT_DIGEST_ROW.format(**{key: html.escape(str(value))
+                                                         for key, value in params.items()})
+                             for params in group)
+            sections.append(ALERT_DIGEST_SECTION.format(
+                severity=html.escape(severity or 'unknown'), count=len(group), rows=rows))
+        return self.digest_template.render(
+            alert_count=len(alerts), first_created_on=alerts[0][1]['created_on'],
+            last_created_on=alerts[-1][1]['created_on'], alert_sections='\n'.join(sections))
+
+    async def _flush(self):
+        """
+        Send the alerts collected during the digest window.
+        """
+        await asyncio.sleep(self.digest_window)
+        alerts, self._pending = self._pending, []
+        self._flush_task = None
+        if len(alerts) == 1:
+            await self._send(const.CSM_ALERT_EMAIL_NOTIFICATION_SUBJECT,
+                             self.template.render(**alerts[0][1]))
+        elif alerts:
+            await self._send(f'{const.CSM_ALERT_EMAIL_NOTIFICATION_SUBJECT}: '
+                             f'{len(alerts)} alerts', self._render_digest(alerts))
+
+    @Log.trace_method(Log.DEBUG)
+    async def handle_alert(self, alert):
+        # TODO: check if email notification is enabled for alerts
+        if not await self._get_email_settings():
+            return
+
+        alert_template_params = self._get_template_params(alert)
+        severity = str(alert.get(const.ALERT_SEVERITY, "") or "").lower()
+        if self.digest_window <= 0 or severity in self.immediate_severities:
+            await self._send(const.CSM_ALERT_EMAIL_NOTIFICATION_SUBJECT,
+                             self.template.render(**alert_template_params))
+            return
+
+        self._pending.append((severity, alert_template_params))
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush())
 
 class AlertMonitorService(Service, Observable):
     """
@@ -624,13 +924,25 @@ class AlertMonitorService(Service, Observable):
         """
         self._alert_plugin = plugin
         self._monitor_thread = None
+        self._monitor_task = None
         self._thread_started = False
         self._thread_running = False
         self._ret = False
         self.repo = repo
         self._health_plugin = health_plugin
         self._http_notfications = http_notifications
-        self._es_retry = Conf.get(const.CSM_GLOBAL_INDEX, const.ES_RETRY, 5)
+        self._es_retry = int(Conf.get(const.CSM_GLOBAL_INDEX, const.ES_RETRY, 5))
+        self._batch_size = int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_BATCH_SIZE, const.DEFAULT_ALERT_BATCH_SIZE))
+        self._flush_interval = float(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_FLUSH_INTERVAL, const.DEFAULT_ALERT_FLUSH_INTERVAL))
+        self._consumer_mode = Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_CONSUMER_MODE, const.DEFAULT_ALERT_CONSUMER_MODE)
+        self._prefetch_count = int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_PREFETCH_COUNT, const.DEFAULT_ALERT_PREFETCH_COUNT))
+        self._consumers = int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.ALERT_CONSUMERS, const.DEFAULT_ALERT_CONSUMERS))
+        self._sensor_locks = {}
         super().__init__()
 
     def _monitor(self):
@@ -638,16 +950,49 @@ class AlertMonitorService(Service, Observable):
         This method acts as a thread function.
         It will monitor the alert plugin for alerts.
         This method passes consume_alert as a callback function to alert plugin.
+        If batching is configured the alerts are consumed in batches instead.
         """
         self._thread_running = True
-        self._alert_plugin.init(callback_fn=self._consume, \
-                health_plugin=self._health_plugin)
+        try:
+            self._run_coroutine(self.repo.warm_up_index())
+        except Exception as e:
+            Log.warn(f"Unable to warm up open alerts index: {e}")
+        if self._batch_size > 1:
+            self._alert_plugin.init(callback_fn=self._consume_batch, \
+                    health_plugin=self._health_plugin, batch_size=self._batch_size, \
+                    flush_interval=self._flush_interval)
+        else:
+            self._alert_plugin.init(callback_fn=self._consume, \
+                    health_plugin=self._health_plugin)
         self._alert_plugin.process_request(cmd='listen')
 
+    async def _monitor_async(self):
+        """
+        Asyncio counterpart of _monitor, runs as a task of the event loop.
+        Alerts are received and processed on the loop by _consume_async.
+        """
+        self._thread_running = True
+        try:
+            await self.repo.warm_up_index()
+        except Exception as e:
+            Log.warn(f"Unable to warm up open alerts index: {e}")
+        self._alert_plugin.init(callback_fn=self._consume_async, \
+                health_plugin=self._health_plugin, \
+                consumer_mode=const.ALERT_CONSUMER_ASYNC, \
+                prefetch_count=self._prefetch_count, consumers=self._consumers)
+        await self._alert_plugin.listen_async()
+
     def start(self):
         """
-        This method creats and starts an alert monitor thread
+        This method creats and starts an alert monitor thread.
+        In async consumer mode a task of the event loop is created instead.
         """
+        if self._consumer_mode == const.ALERT_CONSUMER_ASYNC:
+            Log.info("Starting Alert monitor task")
+            if not self._thread_started:
+                self._monitor_task = self._loop.create_task(self._monitor_async())
+                self._thread_started = True
+            return
         Log.info("Starting Alert monitor thread")
         try:
             if not self._thread_running and not self._thread_started:
@@ -662,8 +1007,9 @@ class AlertMonitorService(Service, Observable):
         try:
             Log.info("Stopping Alert monitor thread")
             self._alert_plugin.stop()
-            Log.info("Joining Alert monitor thread")
-            self._monitor_thread.join(timeout=2.0)
+            if self._monitor_thread:
+                Log.info("Joining Alert monitor thread")
+                self._monitor_thread.join(timeout=2.0)
 
             self._thread_started = False
             self._thread_running = False
@@ -726,21 +1072,9 @@ class AlertMonitorService(Service, Observable):
         """ After saving/ updating alert, update the in memory health schema """
         try:
             Log.debug(f"Incoming alert: {message}")
-            for key in [const.ALERT_CREATED_TIME, const.ALERT_UPDATED_TIME]:
-                message[key] = datetime.utcfromtimestamp(message[key])\
-                        .replace(tzinfo=timezone.utc)
+            self._prepare_alert(message)
             sensor_info = message.get(const.ALERT_SENSOR_INFO, "")
             module_type = message.get(const.ALERT_MODULE_TYPE, "")
-            is_node_alert = self._is_node_alert(message[const.ALERT_MODULE_NAME])
-            is_high_risk_severity = self._is_high_risk_severity(\
-                message[const.ALERT_SEVERITY])
-            """
-            Checking for node hw alert.
-            If the alert is node hw alert and severity is in the category of
-            high risk, then we will prepend the description field with support message.
-            """
-            if is_node_alert and is_high_risk_severity:
-                self._add_support_message(message)
             prev_alert = self._get_previous_alert(sensor_info, module_type)
             alert = AlertModel(message)
             if not prev_alert:
@@ -774,6 +1108,199 @@ class AlertMonitorService(Service, Observable):
 
         return True
 
+    async def _consume_async(self, message):
+        """
+        Asyncio counterpart of _consume, called by the consumer tasks of the
+        alert plugin on the event loop.
+        Alerts of the same sensor are serialized by a lock, which is taken
+        before the first suspension point. Locks are granted in order, so
+        alerts of a sensor are applied in order of arrival even though
+        alerts are processed concurrently.
+        Returns a boolean value to signal whether the plugin should
+        acknowledge the alert to the RabbitMQ.
+        """
+        key = (message.get(const.ALERT_SENSOR_INFO, ""),
+               message.get(const.ALERT_MODULE_TYPE, ""))
+        lock, users = self._sensor_locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._sensor_locks[key] = (lock, users + 1)
+        try:
+            Log.debug(f"Incoming alert: {message}")
+            async with lock:
+                await self._process_batch([message])
+        except Exception as e:
+            Log.warn(f"Error in consuming alert: {e}")
+            return False
+        finally:
+            lock, users = self._sensor_locks.pop(key)
+            if users > 1:
+                self._sensor_locks[key] = (lock, users - 1)
+        return True
+
+    def _prepare_alert(self, message):
+        """
+        Converts the timestamps of the incoming alert and adds the support
+        message if required.
+        """
+        for key in [const.ALERT_CREATED_TIME, const.ALERT_UPDATED_TIME]:
+            message[key] = datetime.utcfromtimestamp(message[key])\
+                    .replace(tzinfo=timezone.utc)
+        is_node_alert = self._is_node_alert(message[const.ALERT_MODULE_NAME])
+        is_high_risk_severity = self._is_high_risk_severity(\
+            message[const.ALERT_SEVERITY])
+        """
+        Checking for node hw alert.
+        If the alert is node hw alert and severity is in the category of
+        high risk, then we will prepend the description field with support message.
+        """
+        if is_node_alert and is_high_risk_severity:
+            self._add_support_message(message)
+
+    def _consume_batch(self, messages):
+        """
+        This is a callback function which will receive a batch of messages
+        from the alert plugin as a list of dictionaries.
+        The whole batch is processed in a single pass on the event loop.
+        Returns True once all the alerts of the batch are stored, so that the
+        plugin could acknowledge the batch to the RabbitMQ.
+        """
+        try:
+            Log.debug(f"Incoming alerts batch: {len(messages)} alerts")
+            self._run_coroutine(self._process_batch(messages))
+        except Exception as e:
+            Log.warn(f"Error in consuming alerts batch: {e}")
+            return False
+        return True
+
+    async def _process_batch(self, messages):
+        """
+        Stores a batch of alerts.
+        1.) Alerts are grouped by sensor_info and module_type, keeping the
+        order of arrival within each group.
+        2.) Previous alerts of all the groups are fetched with one query.
+        3.) Each group is applied to its previous alert in memory following
+        the same rules as _consume, so only the latest state of each sensor
+        is written to the DB.
+        4.) Alerts and alerts history are written concurrently.
+        5.) The health map and the listeners are updated once per sensor.
+        """
+        groups = {}
+        for message in messages:
+            self._prepare_alert(message)
+            key = (message.get(const.ALERT_SENSOR_INFO, ""),
+                   message.get(const.ALERT_MODULE_TYPE, ""))
+            groups.setdefault(key, []).append(message)
+
+        prev_alerts = await self._get_previous_alerts(groups.keys())
+        results = []
+        alerts_to_store = []
+        for key, group in groups.items():
+            prev_alert = prev_alerts.get(key)
+            alert, is_new, is_updated = self._merge_alerts(group, prev_alert)
+            if alert is not prev_alert or is_updated:
+                alerts_to_store.append(alert)
+            results.append((alert, is_new, is_updated))
+        await self.repo.store_bulk(alerts_to_store)
+        Log.debug(f"Alerts stored successfully. Number of alerts: {len(alerts_to_store)}")
+        if self.repo.index is not None:
+            Log.debug(f"Open alerts index: {self.repo.index.stats()}")
+        """
+        Storing the incoming alerts to alert's history collection.
+        These alerts will be shown on UI in a seperate alert's history tab.
+        """
+        await self.repo.store_alerts_history_bulk(
+            [AlertsHistoryModel(message) for message in messages])
+
+        for alert, is_new, is_updated in results:
+            if is_new:
+                self.add_listener(self._http_notfications.handle_alert)
+            elif is_updated:
+                self.remove_listener(self._http_notfications.handle_alert)
+            if is_new or is_updated:
+                """
+                Updating health map with alerts
+                """
+                self._health_plugin.update_health_map_with_alert(alert.to_primitive())
+            self._notify_listeners_from_loop(alert)
+
+    async def _get_previous_alerts(self, sensor_keys):
+        """
+        Batched counterpart of _get_previous_alert. Fetches the previous
+        alerts for all the sensors of a batch, retrying the same way if ES
+        is not reachable.
+        """
+        for count in range(0, self._es_retry):
+            try:
+                Log.info("Fetching previous alerts to check the state and severity.")
+                return await self.repo.retrieve_by_sensor_info_bulk(sensor_keys)
+            except Exception as ex:
+                Log.warn(f"Unable to fetch previous alerts. Retrying : {count+1}.{ex}")
+                await asyncio.sleep(2**count)
+        raise CsmError(CSM_INTERNAL_ERROR, "Unable to fetch previous alerts")
+
+    def _merge_alerts(self, messages, prev_alert):
+        """
+        Applies the alerts of one sensor to its previous alert in memory.
+        :param messages: Alert dicts of the same sensor in order of arrival
+        :param prev_alert: Previous Alert object or None
+        :return: tuple of resulting Alert object and flags telling whether
+        a new alert was created and whether the alert state was updated
+        """
+        alert = prev_alert
+        is_new = False
+        is_updated = False
+        for message in messages:
+            if not alert:
+                alert = AlertModel(message)
+                is_new = True
+            elif self._is_duplicate_alert(message, alert):
+                alert = self._merge_duplicate_alert(message, alert)
+            elif self._merge_alert(message, alert):
+                is_updated = True
+        return alert, is_new, is_updated
+
+    def _merge_alert(self, new_alert, prev_alert):
+        """
+        In-memory counterpart of _resolve_alert for a non-duplicate alert.
+        :param new_alert : New Alert Dict
+        :param prev_alert : Previous Alert object, updated in place
+        :return: boolean (True if the alert is updated)
+        """
+        if self._is_good_alert(new_alert):
+            if self._is_good_alert(prev_alert):
+                self._apply_update_params(new_alert, prev_alert)
+            elif not prev_alert.resolved:
+                prev_alert.resolved = True
+                self._apply_update_params(new_alert, prev_alert)
+            return True
+        if self._is_bad_alert(new_alert):
+            self._apply_update_params(new_alert, prev_alert, \
+                not self._is_bad_alert(prev_alert))
+            return True
+        return False
+
+    def _apply_update_params(self, alert, prev_alert, update_resolve=False):
+        """
+        In-memory counterpart of _update_alert.
+        """
+        update_params = self._get_update_params(alert, prev_alert, update_resolve)
+        update_params[const.ALERT_UPDATED_TIME] = datetime.now(timezone.utc)
+        for key, value in update_params.items():
+            prev_alert[key] = value
+
+    def _merge_duplicate_alert(self, new_alert, prev_alert):
+        """
+        In-memory counterpart of _update_duplicate_alert.
+        """
+        alert = AlertModel(new_alert)
+        alert.alert_uuid = prev_alert.alert_uuid
+        alert.resolved = prev_alert.resolved
+        alert.acknowledged = prev_alert.acknowledged
+        alert.comments = prev_alert.comments
+        alert.updated_time = datetime.now(timezone.utc)
+        return alert
+
     def _resolve_alert(self, new_alert, prev_alert):
         alert_updated = False
         if not self._is_duplicate_alert(new_alert, prev_alert):
@@ -827,6 +1354,19 @@ class AlertMonitorService(Service, Observable):
         False
         :return: None
         """
+        update_params = self._get_update_params(alert, prev_alert, update_resolve)
+        self._run_coroutine(self.repo.update_by_sensor_info\
+                (prev_alert.sensor_info, prev_alert.module_type, update_params))
+
+    def _get_update_params(self, alert, prev_alert, update_resolve=False):
+        """
+        Prepares the fields of the previous alert to be updated.
+        :param alert : Alert object
+        :param prev_alert : Previous Alert object
+        :param update_resolve : If set to True, we will mark resolved state to
+        False
+        :return: dict of fields to update
+        """
         update_params = {}
         is_node_alert = self._is_node_alert(alert.get(const.ALERT_MODULE_NAME))
         is_high_risk_severity = self._is_high_risk_severity(\
@@ -852,8 +1392,7 @@ class AlertMonitorService(Service, Observable):
                 alert.get(const.ALERT_CREATED_TIME, "")
             update_params[const.DESCRIPTION] = alert.get(const.DESCRIPTION, "")
         self._update_params_cleanup(update_params)
-        self._run_coroutine(self.repo.update_by_sensor_info\
-                (prev_alert.sensor_info, prev_alert.module_type, update_params))
+        return update_params
 
     def _update_params_cleanup(self, update_params):
         for key, value in update_params.items():
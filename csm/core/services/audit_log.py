@@ -16,8 +16,9 @@
 import asyncio
 import re
 import time
-import os
-import tarfile
+import string
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from cortx.utils.log import Log
 from csm.common.services import Service, ApplicationService
@@ -34,6 +35,31 @@ from typing import Optional, Iterable
 from cortx.utils.conf_store.conf_store import Conf
 from csm.common.process import SimpleProcess
 
+class AuditLogFormatter:
+    """
+    Precompiled form of a log format of COMPONENT_MODEL_MAPPING.
+    The format is parsed once, so formatting a record only joins its fields
+    instead of converting the whole model with to_primitive().
+    """
+
+    def __init__(self, log_format):
+        """
+        :param log_format: str.format() style format with plain field names
+        """
+        self._parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(log_format):
+            if conversion:
+                raise ValueError(f"Conversion is not supported in {log_format}")
+            self._parts.append((literal, field, spec))
+
+    def format(self, log):
+        line = []
+        for literal, field, spec in self._parts:
+            line.append(literal)
+            if field is not None:
+                line.append(format(getattr(log, field), spec))
+        return ''.join(line)
+
 # mapping of component with model, field for
 # range queires and log format
 COMPONENT_MODEL_MAPPING = { "csm":
@@ -51,29 +77,34 @@ COMPONENT_MODEL_MAPPING = { "csm":
       "{signature_version} {cipher_suite} {authentication_type} {host_header}")
                             }
                           }
+for mapping in COMPONENT_MODEL_MAPPING.values():
+    mapping["formatter"] = AuditLogFormatter(mapping["format"])
 COMPONENT_NOT_FOUND = "no_audit_log_for_component"
 
 class AuditLogManager():
     def __init__(self, storage: DataBaseProvider):
         self.db = storage
 
-    def _prepare_filters(self, component, create_time_range: DateTimeRange):
+    def _prepare_filters(self, component, create_time_range: DateTimeRange,
+                         end_exclusive=False):
         range_condition = []
         range_condition = self._prepare_time_range(
-                  COMPONENT_MODEL_MAPPING[component]["field"], create_time_range)
+                  COMPONENT_MODEL_MAPPING[component]["field"], create_time_range,
+                  end_exclusive)
         return And(*range_condition)
 
-    def _prepare_time_range(self, field, time_range: DateTimeRange):
+    def _prepare_time_range(self, field, time_range: DateTimeRange, end_exclusive=False):
         db_conditions = []
         if time_range and time_range.start:
             db_conditions.append(Compare(field, '>=', time_range.start))
         if time_range and time_range.end:
-            db_conditions.append(Compare(field, '<=', time_range.end))
+            db_conditions.append(Compare(field, '<' if end_exclusive else '<=',
+                                         time_range.end))
         return db_conditions
 
     async def retrieve_by_range(self, component, limits,
-                       time_range: DateTimeRange):
-        query_filter = self._prepare_filters(component, time_range)
+                       time_range: DateTimeRange, end_exclusive=False):
+        query_filter = self._prepare_filters(component, time_range, end_exclusive)
         query = Query().filter_by(query_filter)
         if limits and limits.offset:
             query = query.offset(limits.offset)
@@ -90,8 +121,22 @@ class AuditLogManager():
         return await self.db(COMPONENT_MODEL_MAPPING[component]["model"]).count(query_filter)
 
 class AuditService(ApplicationService):
-    def __init__(self, audit_mngr: AuditLogManager):
+    """
+    Audit log export. Records are read page by page and formatted while they
+    are sent, so the memory used does not depend on the length of the range.
+    """
+
+    # Compression of the exported logs, zlib releases the GIL
+    _executor = ThreadPoolExecutor(max_workers=2)
+
+    def __init__(self, audit_mngr: AuditLogManager, page_size=None):
+        """
+        :param audit_mngr: AuditLogManager instance
+        :param page_size: Number of records read at once, from the config if omitted
+        """
         self.audit_mngr = audit_mngr
+        self._page_size = page_size or int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.AUDIT_LOG_PAGE_SIZE, const.DEFAULT_AUDIT_LOG_PAGE_SIZE))
 
     def generate_audit_log_filename(self, component, start_time, end_time):
         """ generate audit log file name from time range"""
@@ -111,49 +156,109 @@ class AuditService(ApplicationService):
                                           tzinfo=tz).isoformat()
         return DateTimeRange(start_date, end_date)
 
-    async def create_audit_log_file(self, file_name, component, time_range):
-        """ create audit log file and comrpess to tar.gz """
-        try:
-            if not os.path.exists(const.AUDIT_LOG): os.makedirs(const.AUDIT_LOG)
-            txt_file_name = f'{os.path.join(const.AUDIT_LOG, file_name)}.txt'
-            tar_file_name = f'{os.path.join(const.AUDIT_LOG, file_name)}.tar.gz'
-            count = await self.audit_mngr.count_by_range(component, time_range)
-            file = open(txt_file_name, "w")
-            query_limit = QueryLimits(const.MAX_RESULT_WINDOW, 0)
-            audit_logs = await self.audit_mngr.retrieve_by_range(component,
-                                                 query_limit, time_range)
-            for log in audit_logs:
-                file.write(COMPONENT_MODEL_MAPPING[component]["format"].
-                                           format(**(log.to_primitive()))+"\n")
-            file.close()
-            with tarfile.open(tar_file_name, "w:gz") as tar:
-                tar.add(txt_file_name, arcname=f'{file_name}.txt')
-        except OSError as err:
-            if err.errno != errno.EEXIST: raise
-
-    async def get_by_range(self, component: str, start_time: str, end_time: str):
-        """ fetch all records for given range from audit log """
-        Log.logger.info(f"auditlogs for {component} from {start_time} to {end_time}")
+    @staticmethod
+    def _check_component(component):
         if not COMPONENT_MODEL_MAPPING.get(component, None):
             raise CsmNotFoundError("No audit logs for %s" % component,
                                                    COMPONENT_NOT_FOUND)
 
+    async def _iter_logs(self, component, time_range: DateTimeRange, limit=None):
+        """
+        Iterate over the records of the range, newest first.
+        The query can sort by timestamp only and the database does not keep
+        the order of the records sharing a timestamp between queries, so a
+        page cannot continue inside a timestamp. When a full page ends at a
+        timestamp, all the records of that timestamp are read by one query
+        and the next page ends strictly before it. No record is repeated or
+        missed, and no offset is used, so the result window of the database
+        does not cut the export unless a single timestamp exceeds it.
+        The next page is requested while the current one is consumed.
+        :param limit: Maximum number of records, all of them if omitted
+        """
+        name = COMPONENT_MODEL_MAPPING[component]["field"].name
+        page_size = self._page_size if limit is None else min(self._page_size, limit)
+
+        def fetch(end, end_exclusive=False):
+            return asyncio.ensure_future(self.audit_mngr.retrieve_by_range(
+                component, QueryLimits(page_size, 0),
+                DateTimeRange(time_range.start, end), end_exclusive))
+
+        async def fetch_timestamp(timestamp):
+            at = DateTimeRange(timestamp, timestamp)
+            count = await self.audit_mngr.count_by_range(component, at)
+            return await self.audit_mngr.retrieve_by_range(
+                component, QueryLimits(count, 0), at)
+
+        pending, group = fetch(time_range.end), None
+        try:
+            while pending is not None:
+                page = list(await pending)
+                pending = None
+                if len(page) == page_size and (limit is None or limit > page_size):
+                    last = getattr(page[-1], name)
+                    group = asyncio.ensure_future(fetch_timestamp(last))
+                    pending = fetch(last, True)
+                    page = [log for log in page if getattr(log, name) != last]
+                    page.extend(await group)
+                    group = None
+                if limit is not None:
+                    page = page[:limit]
+                    limit -= len(page)
+                    if limit == 0 and pending is not None:
+                        pending.cancel()
+                        pending = None
+                for log in page:
+                    yield log
+        finally:
+            for future in (pending, group):
+                if future is not None:
+                    future.cancel()
+
+    async def iter_by_range(self, component: str, start_time: str, end_time: str,
+                            limit=None):
+        """
+        Iterate over the formatted records for given range.
+        :param limit: Maximum number of records, all of them if omitted
+        """
+        Log.logger.info(f"auditlogs for {component} from {start_time} to {end_time}")
+        self._check_component(component)
         time_range = self.get_date_range_from_duration(int(start_time), int(end_time))
-        query_limit = QueryLimits(Conf.get(const.CSM_GLOBAL_INDEX,
-                                                   "Log>max_result_window"), 0)
-        audit_logs = await self.audit_mngr.retrieve_by_range(component,
-                                                   query_limit, time_range)
-        return [COMPONENT_MODEL_MAPPING[component]["format"].
-                               format(**(log.to_primitive())) for log in audit_logs ]
-
-    async def get_audit_log_zip(self, component: str, start_time: str, end_time: str):
-        """ get zip file for all records from given range """
-        Log.logger.info("get audit logs for given range ")
-        if not COMPONENT_MODEL_MAPPING.get(component, None):
-            raise CsmNotFoundError("No audit logs for %s" % component,
-                                                   COMPONENT_NOT_FOUND)
+        formatter = COMPONENT_MODEL_MAPPING[component]["formatter"]
+        async for log in self._iter_logs(component, time_range, limit):
+            yield formatter.format(log)
+
+    async def iter_audit_log_gzip(self, component: str, start_time: str, end_time: str,
+                                  chunk_size=256 * 1024):
+        """
+        Iterate over the gzip compressed audit log of given range.
+        Lines are compressed off the event loop in chunks of chunk_size bytes.
+        """
+        self._check_component(component)
+        loop = asyncio.get_event_loop()
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        buffer = []
+        size = 0
+        async for line in self.iter_by_range(component, start_time, end_time):
+            buffer.append(line)
+            size += len(line) + 1
+            if size >= chunk_size:
+                buffer.append('')
+                data = await loop.run_in_executor(self._executor, compressor.compress,
+                                                  '\n'.join(buffer).encode('utf-8'))
+                buffer.clear()
+                size = 0
+                if data:
+                    yield data
+
+        def finish(data):
+            return compressor.compress(data) + compressor.flush()
 
+        if buffer:
+            buffer.append('')
+        yield await loop.run_in_executor(self._executor, finish,
+                                         '\n'.join(buffer).encode('utf-8'))
+
+    def get_audit_log_gzip_name(self, component: str, start_time: str, end_time: str):
+        """ get name of the compressed audit log of given range """
         file_name = self.generate_audit_log_filename(component, start_time, end_time)
-        time_range = self.get_date_range_from_duration(int(start_time), int(end_time))
-        await self.create_audit_log_file(file_name, component, time_range)
-        return f"{file_name}.tar.gz"
+        return f"{file_name}.txt.gz"
@@ -14,15 +14,20 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import os
+import time
 import uuid
+import errno
+import asyncio
+import hashlib
 from abc import ABC
 from enum import Enum
 from typing import List
 from shutil import copyfile
 from contextlib import ContextDecorator
+from concurrent.futures import ThreadPoolExecutor
 
 from csm.core.blogic import const
-from csm.common.errors import CsmInternalError
+from csm.common.errors import CsmInternalError, CsmNotFoundError, InvalidRequest
 from csm.core.blogic import const
 from cortx.utils.log import Log
 
@@ -33,7 +38,6 @@ class FileType(Enum):
     """
     SUPPORT_BUNDLE = 1
     ETC_CSM = 2
-    AUDIT_LOG = 3
 
 
 class DownloadFileEntity:
@@ -55,7 +59,6 @@ class DownloadFileManager:
         self.directory_map = {
             FileType.SUPPORT_BUNDLE: const.DEFAULT_SUPPORT_BUNDLE_ROOT,
             FileType.ETC_CSM: const.CSM_ETC_DIR,
-            FileType.AUDIT_LOG: const.AUDIT_LOG,
         }
 
     def get_file_response(self, ftype: FileType, filename) -> DownloadFileEntity:
@@ -75,10 +78,63 @@ class DownloadFileManager:
         return DownloadFileEntity(filename, path_to_file)
 
 
+class AsyncFileWriter:
+    """
+    Writes chunks to a file off the event loop and computes their SHA-256.
+    At most one write is in flight, so receiving the next chunk overlaps
+    with writing the previous one.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=4)
+
+    def __init__(self, stream, hasher=None):
+        """
+        :param stream: File opened for binary writing
+        :param hasher: SHA-256 of the content already in the file, if any
+        """
+        self._stream = stream
+        self._hasher = hasher or hashlib.sha256()
+        self._pending = None
+        # Bytes passed to write() and bytes actually written
+        self.size = 0
+        self.written = 0
+
+    def _write(self, chunk):
+        self._stream.write(chunk)
+        self._hasher.update(chunk)
+        self.written += len(chunk)
+
+    async def write(self, chunk):
+        await self.flush()
+        self._pending = asyncio.get_event_loop().run_in_executor(
+            self._executor, self._write, chunk)
+        self.size += len(chunk)
+
+    async def flush(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            await pending
+
+    async def close(self):
+        try:
+            await self.flush()
+        finally:
+            await asyncio.get_event_loop().run_in_executor(self._executor, self._stream.close)
+
+    @property
+    def hasher(self):
+        return self._hasher
+
+    def hexdigest(self):
+        return self._hasher.hexdigest()
+
+
 class FileRef():
-    def __init__(self, file_uuid, cache_dir=const.CSM_TMP_FILE_CACHE_DIR):
+    def __init__(self, file_uuid, cache_dir=const.CSM_TMP_FILE_CACHE_DIR, sha256=None):
         self.file_uuid = file_uuid
         self.cache_dir = cache_dir
+        # SHA-256 hex digest of the content, computed while it was received
+        self.sha256 = sha256
 
     def get_file_path(self) -> str:
         path_to_cached_file = os.path.join(self.cache_dir, self.file_uuid)
@@ -102,7 +158,7 @@ class FileRef():
             finally:
                 Log.debug(f"Resetting umask with original value: {os.umask(original_mask)}")
 
-        Log.info(f"Saving {filename} at {dir_to_save}")
+        Log.info(f"Saving {filename} at {dir_to_save}, sha256: {self.sha256}")
         path_to_cached_file = self.get_file_path()
         path_to_file_to_save = os.path.join(dir_to_save, filename)
 
@@ -111,11 +167,23 @@ class FileRef():
                 f'File "{path_to_file_to_save}" already exists. Change ' +
                 '"overwrite" argument if you want to overwrite file')
 
+        # The file appears at its destination at once, complete
+        path_to_tmp_file = os.path.join(dir_to_save, f'.{self.file_uuid}.tmp')
         try:
-            copyfile(path_to_cached_file, path_to_file_to_save)
+            try:
+                os.link(path_to_cached_file, path_to_tmp_file)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+                # The cache and the destination are on different file systems
+                copyfile(path_to_cached_file, path_to_tmp_file)
+            os.replace(path_to_tmp_file, path_to_file_to_save)
         except PermissionError as pe:
             Log.warn(f"Incorrect permissions for {dir_to_save}: {pe}.")
             raise CsmInternalError(f"Incorrect permissions for {dir_to_save}")
+        finally:
+            if os.path.exists(path_to_tmp_file):
+                os.remove(path_to_tmp_file)
         
         return path_to_file_to_save
 
@@ -127,6 +195,9 @@ class FileCache(ContextDecorator):
 
         self.current_writing_file_uuid = None
         self.current_writing_file_stream = None
+        self.current_writer = None
+        # file_uuid -> SHA-256 hex digest of the files written by write_chunk_async
+        self.files_sha256 = {}
 
     def __enter__(self):
         return self
@@ -174,7 +245,243 @@ class FileCache(ContextDecorator):
         self.current_writing_file_stream = None
         self.current_writing_file_uuid = None
 
+    async def write_chunk_async(self, file_uuid, chunk):
+        """
+        Same as write_chunck, but the file is written off the event loop and
+        its SHA-256 is computed on the way, see get_sha256.
+        """
+        self.__check_file_uuid(file_uuid)
+        if self.current_writer is None:
+            self.current_writer = AsyncFileWriter(self.current_writing_file_stream)
+        if chunk != b'':
+            await self.current_writer.write(chunk)
+            return
+
+        writer, self.current_writer = self.current_writer, None
+        await writer.close()
+        self.files_sha256[file_uuid] = writer.hexdigest()
+        self.current_writing_file_stream = None
+        self.current_writing_file_uuid = None
+
+    def get_sha256(self, file_uuid):
+        return self.files_sha256.get(file_uuid)
+
+    def adopt_file(self, path, extension=''):
+        """
+        Move a complete file into the cache, it is removed with the other cached files.
+        :param path: Path to the file
+        :returns: uuid of the file in the cache
+        """
+        file_uuid = uuid.uuid4().hex
+        if extension:
+            file_uuid = file_uuid + '.' + extension
+        path_to_file = os.path.join(self.cache_dir, file_uuid)
+        try:
+            os.replace(path, path_to_file)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # The file and the cache are on different file systems
+            try:
+                copyfile(path, path_to_file)
+            except BaseException:
+                if os.path.exists(path_to_file):
+                    os.remove(path_to_file)
+                raise
+            os.remove(path)
+        self.files_uuids.append(file_uuid)
+        return file_uuid
+
     def __check_file_uuid(self, file_uuid_to_check):
         if (self.current_writing_file_uuid is not None and
                 file_uuid_to_check != self.current_writing_file_uuid):
             raise CsmInternalError('Trying to write file to cache while another file is writing')
+
+
+class UploadSession:
+    """
+    State of a resumable upload, see UploadSessionManager.
+    """
+
+    def __init__(self, upload_id, filename, size, path):
+        self.upload_id = upload_id
+        self.filename = filename
+        self.size = size
+        self.path = path
+        self.offset = 0
+        self.sha256 = None
+        self.updated = time.monotonic()
+        # SHA-256 of the first offset bytes
+        self.hasher = hashlib.sha256()
+        self.lock = asyncio.Lock()
+
+    def to_dict(self):
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "size": self.size,
+            "offset": self.offset,
+            "sha256": self.sha256
+        }
+
+
+class UploadSessionManager:
+    """
+    Resumable uploads of big files.
+
+    An upload is created with the name and the size of the file, then its
+    content is appended at the current offset by as many requests as needed.
+    After a dropped connection the client gets the offset of the upload and
+    sends the rest of the file from there. Complete uploads are taken into a
+    FileCache with take(). Uploads not appended to for session_timeout
+    seconds are removed by sweep(), which run_sweeper() calls every
+    sweep_interval seconds.
+    """
+
+    def __init__(self, upload_dir=const.CSM_TMP_UPLOAD_DIR,
+                 size_limit=const.DEFAULT_UPLOAD_SIZE_LIMIT,
+                 session_timeout=const.DEFAULT_UPLOAD_SESSION_TIMEOUT,
+                 sweep_interval=const.DEFAULT_UPLOAD_SWEEP_INTERVAL):
+        self._upload_dir = upload_dir
+        self._size_limit = size_limit
+        self._session_timeout = session_timeout
+        self._sweep_interval = sweep_interval
+        self._sessions = {}
+
+    def _remove_expired(self):
+        now = time.monotonic()
+        for session in list(self._sessions.values()):
+            if now - session.updated > self._session_timeout and not session.lock.locked():
+                Log.info(f"Removing expired upload {session.upload_id} of {session.filename}")
+                self.remove(session.upload_id)
+
+    def sweep(self):
+        """
+        Remove the expired uploads and the files of the upload directory that
+        belong to no upload, e.g. the ones left over by a restart.
+        """
+        self._remove_expired()
+        try:
+            names = os.listdir(self._upload_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name not in self._sessions:
+                Log.info(f"Removing upload file {name} of no upload")
+                try:
+                    os.remove(os.path.join(self._upload_dir, name))
+                except OSError as e:
+                    Log.warn(f"Failed to remove upload file {name}: {e}")
+
+    async def run_sweeper(self):
+        """
+        Sweep the uploads at once and then every sweep_interval seconds.
+        It has to be run as a task of the event loop.
+        """
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                Log.warn(f"Failed to sweep uploads: {e}")
+            await asyncio.sleep(self._sweep_interval)
+
+    def create(self, filename, size) -> dict:
+        """
+        Start a new upload.
+        :param filename: Name of the uploaded file
+        :param size: Size of the file in bytes
+        :returns: Upload state dict
+        """
+        if size <= 0 or size > self._size_limit:
+            raise InvalidRequest(f'File "{filename}" size must be between 1 and '
+                                 f'{self._size_limit} bytes')
+        self._remove_expired()
+        os.makedirs(self._upload_dir, exist_ok=True)
+        upload_id = uuid.uuid4().hex
+        session = UploadSession(upload_id, filename, size,
+                                os.path.join(self._upload_dir, upload_id))
+        open(session.path, 'wb').close()
+        self._sessions[upload_id] = session
+        Log.info(f"Upload {upload_id} of {filename} created, size: {size}")
+        return session.to_dict()
+
+    def _get_session(self, upload_id) -> UploadSession:
+        session = self._sessions.get(upload_id)
+        if session is None:
+            raise CsmNotFoundError(f"Upload {upload_id} not found")
+        return session
+
+    def _check_current(self, session):
+        if self._sessions.get(session.upload_id) is not session:
+            raise CsmNotFoundError(f"Upload {session.upload_id} not found")
+
+    def get(self, upload_id) -> dict:
+        return self._get_session(upload_id).to_dict()
+
+    async def append(self, upload_id, offset, chunks) -> dict:
+        """
+        Append the content to the upload.
+        :param upload_id: Id of the upload
+        :param offset: Offset of the content, it must be the current offset of the upload
+        :param chunks: Async iterable of the content chunks
+        :returns: Upload state dict
+        """
+        session = self._get_session(upload_id)
+        async with session.lock:
+            # The upload may be taken or removed while waiting for the lock
+            self._check_current(session)
+            if offset != session.offset:
+                raise InvalidRequest(f"Upload {upload_id} continues at offset "
+                                     f"{session.offset}, not {offset}")
+            # Drop the part of a chunk written before a failure
+            stream = open(session.path, 'r+b')
+            stream.truncate(session.offset)
+            stream.seek(session.offset)
+            start = session.offset
+            writer = AsyncFileWriter(stream, session.hasher)
+            try:
+                async for chunk in chunks:
+                    if start + writer.size + len(chunk) > session.size:
+                        raise InvalidRequest(f'Content exceeds the size of "{session.filename}"')
+                    await writer.write(chunk)
+                    session.offset = start + writer.written
+            finally:
+                # What was received before a dropped connection is kept
+                try:
+                    await writer.close()
+                finally:
+                    session.offset = start + writer.written
+                    session.updated = time.monotonic()
+            if session.offset == session.size:
+                session.sha256 = session.hasher.hexdigest()
+                Log.info(f"Upload {upload_id} of {session.filename} complete, "
+                         f"sha256: {session.sha256}")
+            return session.to_dict()
+
+    async def take(self, upload_id, file_cache: FileCache) -> FileRef:
+        """
+        Move a complete upload into the file cache.
+        The upload is kept if the file cannot be moved, so taking it can be retried.
+        :param upload_id: Id of the upload
+        :param file_cache: FileCache to take the file
+        :returns: FileRef of the uploaded file
+        """
+        session = self._get_session(upload_id)
+        extension = session.filename.rsplit('.', 1)[-1] if '.' in session.filename else ''
+        if len(extension) > 10 or not extension.isalnum():
+            extension = ''
+        async with session.lock:
+            # A concurrent take may have taken the upload while waiting for the lock
+            self._check_current(session)
+            if session.offset != session.size:
+                raise InvalidRequest(f"Upload {upload_id} is not complete")
+            # The file is copied if the cache is on another file system
+            file_uuid = await asyncio.get_event_loop().run_in_executor(
+                None, file_cache.adopt_file, session.path, extension)
+            self._sessions.pop(upload_id, None)
+        return FileRef(file_uuid, file_cache.cache_dir, session.sha256)
+
+    def remove(self, upload_id):
+        session = self._sessions.pop(upload_id, None)
+        if session is not None and os.path.exists(session.path):
+            os.remove(session.path)
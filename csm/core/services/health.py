@@ -21,7 +21,7 @@ from csm.core.blogic.models.alerts import AlertModel
 from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.log import Log
 from csm.common.observer import Observable
-from threading import Event, Thread
+from threading import Event, Thread, Lock
 from csm.core.services.alerts import AlertRepository
 import asyncio
 from csm.common.errors import CsmError
@@ -48,12 +48,231 @@ class HealthRepository:
         """
         self._health_schema = health_schema
 
+class HealthSchemaIndex:
+    """
+    Flat index of the nodes of the in-memory health schema.
+    Maps the key of every node to the paths and values of its occurrences,
+    in the order a recursive search of the schema visits them. The structure
+    of the schema does not change once it is loaded, only the fields of its
+    leaf nodes are updated in place, so the index stays current.
+    It also keeps the health summary counts (total, critical and warning
+    resources) of every non-leaf node. Leaf nodes have to be updated with
+    update_leaf so that the counts of their ancestors follow.
+    The health map is updated from the event loop, the executor threads and
+    the HealthMonitor thread, so the leaves and the counts are read and
+    changed under a lock.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+        self._rollups = {}
+        self._lock = Lock()
+
+    def build(self, health_schema):
+        """
+        Index all the nodes of the health schema.
+        :param health_schema: Health schema dict
+        :return: None
+        """
+        with self._lock:
+            self._nodes = {}
+            self._rollups = {}
+            if health_schema:
+                self._add_nodes(health_schema, ())
+
+    def _add_nodes(self, obj, path):
+        rollup = [0, 0, 0]
+        for key, value in obj.items():
+            if isinstance(value, dict):
+                node_path = path + (key,)
+                self._nodes.setdefault(key, []).append((node_path, value))
+                if HealthSchemaIndex.has_child_dict(value):
+                    counts = self._add_nodes(value, node_path)
+                else:
+                    counts = HealthSchemaIndex._leaf_counts(value)
+                rollup = [x + y for x, y in zip(rollup, counts)]
+        self._rollups[path] = rollup
+        return rollup
+
+    @staticmethod
+    def _leaf_counts(leaf):
+        """
+        Contribution of a leaf node to the health summary, same rules as
+        HealthAppService._get_health_count.
+        :param leaf: Resource dict
+        :return: tuple of total, critical and warning counts
+        """
+        if not leaf:
+            return (0, 0, 0)
+        health = leaf.get(const.ALERT_HEALTH, "")
+        severity = leaf.get(const.ALERT_SEVERITY, "").lower()
+        if health and health.lower() not in const.GOOD_HEALTH_VAL:
+            if severity in const.HIGH_RISK_SEVERITY:
+                return (1, 1, 0)
+            if severity in const.LOW_RISK_SEVERITY:
+                return (1, 0, 1)
+        return (1, 0, 0)
+
+    def update_leaf(self, path, leaf, values):
+        """
+        Update the fields of a leaf node and the counts of its ancestors.
+        :param path: Path of the leaf node
+        :param leaf: Leaf node dict
+        :param values: Fields to update
+        :return: None
+        """
+        with self._lock:
+            before = HealthSchemaIndex._leaf_counts(leaf)
+            leaf.update(values)
+            after = HealthSchemaIndex._leaf_counts(leaf)
+            if before != after:
+                delta = [x - y for x, y in zip(after, before)]
+                for depth in range(len(path)):
+                    rollup = self._rollups.get(path[:depth])
+                    if rollup is not None:
+                        for i, value in enumerate(delta):
+                            rollup[i] += value
+
+    def summary(self, path=()):
+        """
+        Health summary of the node at the given path, whole schema by default.
+        :param path: Path of the node
+        :return: Health summary dict
+        """
+        with self._lock:
+            total, critical, warning = self._rollups.get(path, (0, 0, 0))
+        return {
+            const.TOTAL: total,
+            const.GOOD_HEALTH: total - critical - warning,
+            const.CRITICAL.lower(): critical,
+            const.WARNING.lower(): warning
+        }
+
+    def verify(self, health_schema):
+        """
+        Consistency check of the health summary counts against a full recount
+        of the health schema.
+        :param health_schema: Health schema dict
+        :return: List of paths of the nodes whose counts differ
+        """
+        with self._lock:
+            recount = HealthSchemaIndex()
+            recount.build(health_schema)
+            paths = set(recount._rollups) | set(self._rollups)
+            return [path for path in paths
+                    if recount._rollups.get(path) != self._rollups.get(path)]
+
+    @staticmethod
+    def has_child_dict(obj):
+        """
+        Check if the obj has child dicts, i.e. if it is not a leaf node
+        :param obj:
+        :return:
+        """
+        return any(isinstance(value, dict) for value in obj.values())
+
+    def find(self, key, scope=()):
+        """
+        Find the first node with the given key below the given path.
+        :param key: Key of the node
+        :param scope: Path of the node to search in, whole schema by default
+        :return: tuple of path and node, (None, None) if not found
+        """
+        depth = len(scope)
+        for path, node in self._nodes.get(key, ()):
+            if len(path) > depth and path[:depth] == scope:
+                return path, node
+        return None, None
+
+class HealthDeltaStream(Observable):
+    """
+    Coalesces the changes of the health map and of the alerts into deltas.
+
+    Changes are collected for window seconds, then listeners are notified
+    with one delta holding the current fields of the changed resources, the
+    current health summary of every node above them and the changed alerts.
+    Deltas are numbered by seq. The fields of a delta are absolute values,
+    so a client that missed a delta can take a snapshot() and apply the
+    deltas that come after its seq.
+    Changes can be reported from any thread, listeners are notified on the
+    event loop.
+    """
+
+    def __init__(self, health_index: HealthSchemaIndex, window=const.DEFAULT_HEALTH_DELTA_WINDOW):
+        super().__init__()
+        self._health_index = health_index
+        self._window = window
+        self._loop = asyncio.get_event_loop()
+        self._lock = Lock()
+        # path -> leaf node
+        self._resources = {}
+        # alert_uuid -> alert
+        self._alerts = {}
+        self._scheduled = False
+        self.seq = 0
+
+    def resource_changed(self, path, leaf):
+        """
+        :param path: Path of the changed leaf node of the health schema
+        :param leaf: Leaf node dict
+        """
+        with self._lock:
+            self._resources[path] = leaf
+            self._schedule()
+
+    def alert_changed(self, alert):
+        """
+        :param alert: New or updated AlertModel
+        """
+        with self._lock:
+            self._alerts[alert.alert_uuid] = alert
+            self._schedule()
+
+    def _schedule(self):
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self._loop.call_soon_threadsafe(self._loop.call_later, self._window, self._flush)
+
+    def _flush(self):
+        with self._lock:
+            resources, self._resources = self._resources, {}
+            alerts, self._alerts = self._alerts, {}
+            self._scheduled = False
+            self.seq += 1
+            seq = self.seq
+
+        paths = {path[:depth] for path in resources for depth in range(len(path))}
+        delta = {
+            "seq": seq,
+            "resources": {'.'.join(path): dict(leaf) for path, leaf in resources.items()},
+            "summary": {'.'.join(path): self._health_index.summary(path)
+                        for path in sorted(paths)},
+            "alerts": [{
+                const.ALERT_UUID: alert.alert_uuid,
+                const.ALERT_SEVERITY: alert.severity,
+                const.ALERT_STATE: alert.state,
+                const.ALERT_RESOLVED: alert.resolved,
+                const.ALERT_ACKNOWLEDGED: alert.acknowledged
+            } for alert in alerts.values()]
+        }
+        Log.debug(f"Health delta {seq}: {len(resources)} resources, {len(alerts)} alerts")
+        self._notify_listeners_from_loop(delta)
+
+    def snapshot(self):
+        """
+        Health summary with the seq of the last delta it already includes.
+        """
+        return {"seq": self.seq, const.HEALTH_SUMMARY: self._health_index.summary()}
+
+
 class HealthAppService(ApplicationService):
     """
         Provides operations on in memory health schema
     """
 
-    def __init__(self, repo: HealthRepository, alerts_repo, plugin):
+    def __init__(self, repo: HealthRepository, alerts_repo, plugin,
+                 delta_window=const.DEFAULT_HEALTH_DELTA_WINDOW):
         self._health_plugin = plugin
         self.repo = repo
         self.alerts_repo = alerts_repo
@@ -61,6 +280,8 @@ class HealthAppService(ApplicationService):
         self._health_plugin = plugin
         self._node_hostname_map = dict()
         self._hostname_node_map = dict()
+        self._health_index = HealthSchemaIndex()
+        self.delta_stream = HealthDeltaStream(self._health_index, delta_window)
         self._create_node_hostname_map()
         self._init_health_schema()
 
@@ -119,6 +340,7 @@ class HealthAppService(ApplicationService):
             self.repo.health_schema = self._health_schema
             self.repo.health_schema.dump()
             self.set_default_values(self.repo.health_schema.data())
+            self._health_index.build(self.repo.health_schema.data())
         except Exception as ex:
             Log.error(f"Error occured in reading health schema. Path: {health_schema_path}, {ex}")
 
@@ -272,12 +494,15 @@ class HealthAppService(ApplicationService):
         summary call, a boolean flag is maintained.
         """
         await self.update_health_schema_with_db()
-        health_schema = self._get_schema()
-        health_count_map = {}
-        leaf_nodes = []
-        self._get_leaf_node_health(health_schema, health_count_map, leaf_nodes, {})
-        return {
-            const.HEALTH_SUMMARY: self._get_health_count(health_count_map, leaf_nodes)}
+        return {const.HEALTH_SUMMARY: self._health_index.summary()}
+
+    async def fetch_health_snapshot(self):
+        """
+        Health summary with the seq of the last health delta it includes.
+        A client of the health delta stream resyncs from it after missing a delta.
+        """
+        await self.update_health_schema_with_db()
+        return self.delta_stream.snapshot()
 
     async def _get_node_health_details(self, node_id):
         """
@@ -324,13 +549,10 @@ class HealthAppService(ApplicationService):
         :param node_id:
         :return:
         """
-        health_count_map = {}
-        leaf_nodes = []
-        alert_uuid_map = {}
-        health_schema = self._get_schema(node_id)
-        self._get_leaf_node_health(health_schema, health_count_map,
-                                   leaf_nodes, alert_uuid_map)
-        health_summary = self._get_health_count(health_count_map, leaf_nodes)
+        path = ()
+        if node_id and not node_id.isspace():
+            path, _ = self._health_index.find(node_id)
+        health_summary = self._health_index.summary(path)
         if "node" in node_id:
             hostname = self.get_hostname(node_id.split(':')[1])
             node_id = f"node:{hostname}"
@@ -393,7 +615,7 @@ class HealthAppService(ApplicationService):
         """
         health_schema = self.repo.health_schema.data()
         if key and not key.isspace():
-            health_schema = self._get_health_schema_by_key(health_schema, key)
+            _, health_schema = self._health_index.find(key)
         return health_schema
 
     def _check_resource_for_severity(self, value, severity_val):
@@ -511,97 +733,44 @@ class HealthAppService(ApplicationService):
                     keys.append(key)
         return keys
 
-    def _get_health_schema_by_key(self, obj, node_key):
-        """
-        Get the schema for the provided key
-        :param obj:
-        :param node_key:
-        :return:
+    def update_health_map(self, msg_body):
         """
-        def getvalue(obj):
-            try:
-                for key, value in obj.items():
-                    if (node_key == key):
-                        return value
-
-                    if isinstance(value, dict):
-                        if (self._checkchilddict(value)):
-                            ret_value = getvalue(value)
-                            if ret_value:
-                                return ret_value
-            except Exception as ex:
-                Log.warn(f"Getting health schema by key failed:{ex}")
-        return getvalue(obj)
-
-    def _set_health_schema_by_key(self, obj, node_key, node_value):
-        """
-        Set the schema for the provided key
-        :param obj:
-        :param node_key:
-        "param node_value:
-        :return:
+        Updates the leaf nodes of the health map for the resources of an
+        actuator response or an alert. Nodes are looked up in the health
+        schema index, resource fields are updated in place.
         """
-        try:
-            for key, value in obj.items():
-                if (node_key == key):
-                    obj[key] = node_value
-
-                if isinstance(value, dict):
-                    if (self._checkchilddict(value)):
-                        self._set_health_schema_by_key(value, node_key, node_value)
-        except Exception as ex:
-            Log.warn(f"Setting health schema by key failed:{ex}")
-
-    def update_health_map(self, msg_body):
         Log.debug(f"Updating health map : {msg_body}")
         return_value = False
         try:
-            resource_map = {}
-            resource_node_map = {}
-            update_key = None
             is_node_response = msg_body.get(const.NODE_RESPONSE, False)
             resource_key = msg_body.get(const.RESOURCE_KEY, "")
-            sub_resource_map = self.repo.health_schema.get(resource_key)
+            resource_path = tuple(resource_key.split('.'))
             """
             Converting hostname to minion id.
             """
             minion_id = self.get_minion_id(msg_body.get(const.ALERT_NODE_ID, ""))
             node_id = f"node:{minion_id}"
             if is_node_response:
-                resource_map = self._get_health_schema_by_key\
-                        (sub_resource_map, node_id)
-                update_key = node_id
-            else:
-                resource_map = sub_resource_map
-                update_key = resource_key
+                resource_path, _ = self._health_index.find(node_id, resource_path)
 
             for items in msg_body.get(const.RESOURCE_LIST, []):
                 key = items.get(const.KEY, "")
-                resource_schema_dict = self._get_health_schema_by_key\
-                        (resource_map, key)
+                path, resource_schema_dict = None, None
+                if resource_path:
+                    path, resource_schema_dict = self._health_index.find(key, resource_path)
                 if resource_schema_dict:
-                    resource_schema_dict[const.HEALTH_ALERT_TYPE] \
-                        = msg_body.get(const.HEALTH_ALERT_TYPE, "NA")
-                    resource_schema_dict[const.ALERT_SEVERITY] \
-                        = msg_body.get(const.ALERT_SEVERITY, "NA")
-                    resource_schema_dict[const.ALERT_UUID] \
-                        = msg_body.get(const.ALERT_UUID, "NA")
-                    resource_schema_dict[const.FETCH_TIME] \
-                        = msg_body.get(const.FETCH_TIME)
-                    resource_schema_dict[const.ALERT_HEALTH] \
-                        = items.get(const.ALERT_HEALTH, "NA")
-                    resource_schema_dict[const.ALERT_DURABLE_ID] \
-                        = items.get(const.ALERT_DURABLE_ID, "NA")
-                    self._set_health_schema_by_key\
-                            (resource_map, key, resource_schema_dict)
+                    self._health_index.update_leaf(path, resource_schema_dict, {
+                        const.HEALTH_ALERT_TYPE: msg_body.get(const.HEALTH_ALERT_TYPE, "NA"),
+                        const.ALERT_SEVERITY: msg_body.get(const.ALERT_SEVERITY, "NA"),
+                        const.ALERT_UUID: msg_body.get(const.ALERT_UUID, "NA"),
+                        const.FETCH_TIME: msg_body.get(const.FETCH_TIME),
+                        const.ALERT_HEALTH: items.get(const.ALERT_HEALTH, "NA"),
+                        const.ALERT_DURABLE_ID: items.get(const.ALERT_DURABLE_ID, "NA")
+                    })
+                    self.delta_stream.resource_changed(path, resource_schema_dict)
                     Log.debug(f"Health map updated for: {key}")
                 else:
                     Log.warn(f"Resource not found in health map. Key :{key}")
-            """
-            Updating the health map with sub-resource map
-            """
-            self._set_health_schema_by_key(self.repo.health_schema.data(),\
-                    update_key, resource_map)
             Log.debug(f"Health map updated successfully.")
             return_value = True
         except Exception as ex:
@@ -14,73 +14,82 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 class PermissionSet:
-    ''' Permission Set stored in a compact way as a dictionary '''
+    '''
+    Permission Set stored in a compact way as a bitmask.
+    Every (resource, action) pair is interned to a bit number the first time
+    it is seen, so the set operations are integer operations.
+    '''
+
+    # Bit numbers of the (resource, action) pairs, shared by all the sets
+    _bits = {}
+    _pairs = []
+
+    @classmethod
+    def _get_bit(cls, resource: str, action: str) -> int:
+        bit = cls._bits.get((resource, action))
+        if bit is None:
+            bit = len(cls._pairs)
+            cls._pairs.append((resource, action))
+            cls._bits[(resource, action)] = bit
+        return bit
+
+    @classmethod
+    def _from_mask(cls, mask: int) -> 'PermissionSet':
+        result = cls()
+        result._mask = mask
+        return result
 
     def __init__(self, items: dict = {}):
-        self._items = {
-            resource: set(actions)
-                for resource, actions in items.items()
-                    if len(actions) > 0
-        }
+        self._mask = 0
+        for resource, actions in items.items():
+            for action in actions:
+                self._mask |= 1 << self._get_bit(resource, action)
+
+    def as_dict(self) -> dict:
+        ''' Dictionary representation: resource -> set of actions '''
+
+        items = {}
+        mask = self._mask
+        while mask:
+            low = mask & -mask
+            resource, action = self._pairs[low.bit_length() - 1]
+            items.setdefault(resource, set()).add(action)
+            mask ^= low
+        return items
 
     def __str__(self) -> str:
         ''' String Representation Operator '''
 
-        return f'{self.__class__.__name__}{self._items.__str__()}'
+        return f'{self.__class__.__name__}{self.as_dict().__str__()}'
 
     def __eq__(self, other: 'PermissionSet') -> bool:
         ''' Equality Operator '''
 
-        return self._items == other._items
+        return self._mask == other._mask
+
+    def issubset(self, other: 'PermissionSet') -> bool:
+        ''' Check that all the permissions of the set are in the other set '''
+
+        return (self._mask & other._mask) == self._mask
 
     def __or__(self, other: 'PermissionSet') -> 'PermissionSet':
         ''' Union Operator '''
 
-        result = PermissionSet()
-        resources = set(self._items.keys()) | set(other._items.keys())
-        for resource in resources:
-            lhs_actions = self._items.get(resource, set())
-            rhs_actions = other._items.get(resource, set())
-            actions = lhs_actions | rhs_actions
-            if len(actions) > 0:
-                result._items[resource] = actions
-        return result
+        return self._from_mask(self._mask | other._mask)
 
     def __and__(self, other: 'PermissionSet') -> 'PermissionSet':
         ''' Intersection Operator '''
 
-        result = PermissionSet()
-        resources = set(self._items.keys()) & set(other._items.keys())
-        for resource in resources:
-            lhs_actions = self._items.get(resource, set())
-            rhs_actions = other._items.get(resource, set())
-            actions = lhs_actions & rhs_actions
-            if len(actions) > 0:
-                result._items[resource] = actions
-        return result
+        return self._from_mask(self._mask & other._mask)
 
     def __ior__(self, other: 'PermissionSet') -> 'PermissionSet':
         ''' In-place Union Operator '''
 
-        for resource in other._items.keys():
-            lhs_actions = self._items.get(resource, set())
-            rhs_actions = other._items.get(resource, set())
-            actions = lhs_actions | rhs_actions
-            if len(actions) > 0:
-                self._items[resource] = actions
-            else:
-                self._items.pop(resource, None)
+        self._mask |= other._mask
         return self
 
     def __iand__(self, other: 'PermissionSet') -> 'PermissionSet':
         ''' In-place Intersection Operator '''
 
-        for resource in self._items.keys():
-            lhs_actions = self._items.get(resource, set())
-            rhs_actions = other._items.get(resource, set())
-            actions = lhs_actions & rhs_actions
-            if len(actions) > 0:
-                self._items[resource] = actions
-            else:
-                self._items.pop(resource, None)
+        self._mask &= other._mask
         return self
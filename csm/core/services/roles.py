@@ -91,19 +91,27 @@ class RoleManager:
             name: Role(name, PermissionSet(value['permissions']))
                 for name, value in predefined_roles.items()
         }
+        # Effective permissions per combination of role names
+        self._effective_permissions = {}
 
     async def calc_effective_permissions(self, *role_names):
         """
         Calculate effective set of permissions from a given set of user roles.
+        The result is cached per combination of roles until the roles change.
         """
 
-        permissions = PermissionSet()
-        for role_name in role_names:
-            role = self._roles.get(role_name, self.NO_ROLE)
-            if role.name is None:
-                Log.warn(f"Invalid role name '{role_name}'")
-            permissions |= role.permissions
-        return permissions
+        key = frozenset(role_names)
+        permissions = self._effective_permissions.get(key)
+        if permissions is None:
+            permissions = PermissionSet()
+            for role_name in key:
+                role = self._roles.get(role_name, self.NO_ROLE)
+                if role.name is None:
+                    Log.warn(f"Invalid role name '{role_name}'")
+                permissions |= role.permissions
+            self._effective_permissions[key] = permissions
+        # Callers get their own copy, the cached set must not be modified
+        return permissions | PermissionSet()
 
     async def add_role(self, name, permissions):
         """
@@ -115,6 +123,7 @@ class RoleManager:
             Log.error(f'Role "{name}" is already present')
             return False
         self._roles[name] = Role(name, PermissionSet(permissions))
+        self._effective_permissions.clear()
         Log.info(f'New role "{name}" has been successfully added')
         return True
 
@@ -125,6 +134,7 @@ class RoleManager:
 
         self._validate_name(name)
         if self._roles.pop(name, None) is not None:
+            self._effective_permissions.clear()
             Log.info(f'Existing role "{name}" has been successfully deleted')
         else:
             Log.warn(f'Role "{name}" does not exist')
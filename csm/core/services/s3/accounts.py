@@ -42,6 +42,7 @@ class S3AccountService(S3BaseService):
         Password should be taken as input and not read from conf file directly.
         """
         self._s3_root_client = IamRootClient()
+        self._listing_cache = self._create_listing_cache()
 
     @Log.trace_method(Log.DEBUG, exclude_args=['password'])
     async def create_account(self, account_name: str, account_email: str, password: str) -> Dict:
@@ -72,6 +73,7 @@ class S3AccountService(S3BaseService):
             await account_client.delete_account(account.account_name)
             raise e
 
+        self._listing_cache.invalidate()
         return {
             "account_name": account.account_name,
             "account_email": account.account_email,
@@ -93,6 +95,46 @@ class S3AccountService(S3BaseService):
             "account_email": account.account_email
         }
 
+    @staticmethod
+    def _format_account(session, acc, demand_all_accounts):
+        """
+        Format the account if it may be listed in the session, None otherwise.
+        """
+        # CSM user is allowed to list all the S3 users in system.
+        # S3 user is not allowed to list all s3 user in system.
+        # Allowed to list only himself.
+        if not (isinstance(session, LocalCredentials) or demand_all_accounts or
+                (isinstance(session, S3Credentials) and
+                 acc.account_name.lower() == session.user_id.lower())):
+            return None
+        return {
+            "account_name": acc.account_name,
+            "account_email": acc.account_email
+        }
+
+    async def iter_accounts(self, session, demand_all_accounts=False):
+        """
+        Iterate over all the s3 accounts that may be listed in the session.
+        The pages are fetched from the IAM server while the accounts are consumed.
+        :param session: session object of S3Credentials or LocalCredentials
+        :demand_all_accounts: When set to True, yields all the s3 accounts regardless
+                              of session type. Needed for internal calls
+        :returns: async iterator of account dictionaries
+        """
+        accounts = self._s3_root_client.iter_accounts()
+        try:
+            async for acc in accounts:
+                if isinstance(acc, IamError):
+                    self._handle_error(acc)
+                account = self._format_account(session, acc, demand_all_accounts)
+                if account is not None:
+                    yield account
+                    if not (isinstance(session, LocalCredentials) or demand_all_accounts):
+                        # S3 user can list only himself
+                        break
+        finally:
+            await accounts.aclose()
+
     @Log.trace_method(Log.DEBUG)
     async def list_accounts(self, session, continue_marker=None, page_limit=None,
                             demand_all_accounts=False) -> dict:
@@ -102,46 +144,42 @@ class S3AccountService(S3BaseService):
         :param continue_marker: Marker that must be used in order to fetch another
                                 portion of data
         :param page_limit: If set, this will limit the maximum number of items tha will be
-                           returned in one batch
+                           returned in one batch. If neither page_limit nor continue_marker
+                           is set, all the accounts are returned
         :demand_all_accounts: When set to True, returns full list of s3 account regardless
                               of session type. Needed for internal calls
         :returns: a dictionary containing account list and, if the list is truncated, a marker
                   that can be used for fetching subsequent batches
         """
-        # TODO: right now the remote server does not seem to support pagination
         Log.debug(f"Listing accounts. continue_marker:{continue_marker}, "
                   f"page_limit:{page_limit}")
-        accounts = await self._s3_root_client.list_accounts(max_items=page_limit,
-            marker=continue_marker)
-        if isinstance(accounts, IamError):
-            self._handle_error(accounts)
-        accounts_list = []
-        # CSM user is allowed to list all the S3 users in system.
-        if isinstance(session, LocalCredentials) or demand_all_accounts:
+        cache_key = (self._get_session_key(session), demand_all_accounts,
+                     continue_marker, page_limit)
+        resp = self._listing_cache.get(cache_key)
+        if resp is not None:
+            return resp
+
+        if continue_marker is None and page_limit is None:
+            resp = {
+                "s3_accounts": [acc async for acc in self.iter_accounts(
+                    session, demand_all_accounts)]
+            }
+        else:
+            accounts = await self._s3_root_client.list_accounts(max_items=page_limit,
+                marker=continue_marker)
+            if isinstance(accounts, IamError):
+                self._handle_error(accounts)
+            accounts_list = []
             for acc in accounts.iam_accounts:
-                accounts_list.append(
-                        {
-                            "account_name": acc.account_name,
-                            "account_email": acc.account_email
-                        }
-                    )
-        # S3 user is not allowed to list all s3 user in system.
-        # Allowed to list only himself.
-        elif isinstance(session, S3Credentials):
-            for acc in accounts.iam_accounts:
-                if acc.account_name.lower() == session.user_id.lower():
-                    accounts_list.append(
-                        {
-                            "account_name": acc.account_name,
-                            "account_email": acc.account_email
-                        }
-                    )
-                    break
-        resp = {
-            "s3_accounts": accounts_list,
-        }
-        if accounts.is_truncated:
-            resp["continue"] = accounts.marker
+                account = self._format_account(session, acc, demand_all_accounts)
+                if account is not None:
+                    accounts_list.append(account)
+            resp = {
+                "s3_accounts": accounts_list,
+            }
+            if accounts.is_truncated:
+                resp["continue"] = accounts.marker
+        self._listing_cache.put(cache_key, resp)
         Log.debug(f"List account response: {resp}")
         return resp
 
@@ -202,4 +240,5 @@ class S3AccountService(S3BaseService):
         result = await account_s3_client.delete_account(account_name)
         if isinstance(result, IamError):
             self._handle_error(result)
+        self._listing_cache.invalidate()
         return {"message": "Account Deleted Successfully."}
@@ -20,6 +20,7 @@ from boto.s3.bucket import Bucket
 
 from cortx.utils.log import Log
 
+from csm.common.observer import Observable
 from csm.plugins.cortx.s3 import S3Plugin, S3Client
 from csm.core.providers.providers import Response
 from csm.core.services.sessions import S3Credentials
@@ -27,12 +28,16 @@ from csm.core.services.s3.utils import S3BaseService, CsmS3ConfigurationFactory
 
 
 # TODO: the access to this service must be restricted to CSM users only (?)
-class S3BucketService(S3BaseService):
+class S3BucketService(S3BaseService, Observable):
     """
     Service for S3 account management
+
+    Listeners are called with the bucket name when a bucket is created,
+    deleted or its tags are changed.
     """
 
     def __init__(self, s3plugin: S3Plugin):
+        super().__init__()
         self._s3plugin = s3plugin
         self._s3_connection_config = CsmS3ConfigurationFactory.get_s3_connection_config()
 
@@ -69,6 +74,7 @@ class S3BucketService(S3BaseService):
         except ClientError as e:
             # TODO: distinguish errors when user is not allowed to get/delete/create buckets
             self._handle_error(e)
+        self._notify_listeners_from_loop(bucket_name)
         return {
             "bucket_name": bucket_name,
         }  # bucket Can be None
@@ -118,6 +124,7 @@ class S3BucketService(S3BaseService):
             await s3_client.delete_bucket(bucket_name)
         except ClientError as e:
             self._handle_error(e)
+        self._notify_listeners_from_loop(bucket_name)
         return {"message": f"Bucket {bucket_name} Deleted Successfully."}
     @Log.trace_method(Log.INFO)
     async def get_bucket_policy(self, s3_session: S3Credentials,
@@ -220,4 +227,5 @@ class S3BucketService(S3BaseService):
             await s3_client.put_bucket_tagging(bucket_name, bucket_tags)
         except ClientError as e:
             self._handle_error(e)
+        self._notify_listeners_from_loop(bucket_name)
         return {"message": "Tagged the bucket successfully"}
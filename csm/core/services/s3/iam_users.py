@@ -30,6 +30,7 @@ class IamUsersService(S3BaseService):
         self._s3plugin = s3plugin
         # S3 Connection Object.
         self._iam_connection_config = CsmS3ConfigurationFactory.get_iam_connection_config()
+        self._listing_cache = self._create_listing_cache()
 
     @Log.trace_method(Log.DEBUG)
     async def fetch_iam_client(self, s3_session: Dict) -> IamClient:
@@ -75,29 +76,63 @@ class IamUsersService(S3BaseService):
         if isinstance(user_creds_resp, IamError):
             await s3_client.delete_user(user_name)
             self._handle_error(user_creds_resp)
+        self._listing_cache.invalidate()
         return {
             **vars(user_creation_resp),
             'access_key_id': user_creds_resp.access_key_id,
             'secret_key': user_creds_resp.secret_key
         }
 
+    async def iter_users(self, s3_session: Dict):
+        """
+        Iterates over all the Iam User's, the pages are fetched from the IAM
+        server while the users are consumed.
+        :param s3_session: S3 session's details. :type: dict
+        :return: async iterator of user dictionaries
+        """
+        s3_client = await self.fetch_iam_client(s3_session)
+        users = s3_client.iter_users()
+        try:
+            async for user in users:
+                if isinstance(user, IamError):
+                    self._handle_error(user)
+                if not user.user_name == "root":
+                    yield vars(user)
+        finally:
+            await users.aclose()
+
     @Log.trace_method(Log.DEBUG)
-    async def list_users(self, s3_session: Dict) -> Union[Response, Dict]:
+    async def list_users(self, s3_session: Dict, marker=None,
+                         limit=None) -> Union[Response, Dict]:
         """
         This Method Fetches Iam User's
         :param s3_session: S3 session's details. :type: dict
+        :param marker: continuation marker from the previous list users operation
+        :param limit: the maximum number of users to return, all the users are
+                      returned if neither marker nor limit is set
         :return:
         """
-        s3_client = await  self.fetch_iam_client(s3_session)
-        # Fetch IAM Users
-        Log.debug(f"List IAM User service:")
-        users_list_response = await s3_client.list_users()
-        if isinstance(users_list_response, IamError):
-            self._handle_error(users_list_response)
-        iam_users_list = vars(users_list_response)
-        iam_users_list["iam_users"] = [vars(each_user)
-                                       for each_user in iam_users_list["iam_users"]
-                                       if not vars(each_user)["user_name"] == "root" ]
+        Log.debug(f"List IAM User service: marker:{marker}, limit:{limit}")
+        cache_key = (self._get_session_key(s3_session), marker, limit)
+        iam_users_list = self._listing_cache.get(cache_key)
+        if iam_users_list is not None:
+            return iam_users_list
+
+        if marker is None and limit is None:
+            iam_users_list = {
+                "iam_users": [user async for user in self.iter_users(s3_session)],
+                "is_truncated": False
+            }
+        else:
+            s3_client = await self.fetch_iam_client(s3_session)
+            users_list_response = await s3_client.list_users(marker=marker, max_items=limit)
+            if isinstance(users_list_response, IamError):
+                self._handle_error(users_list_response)
+            iam_users_list = vars(users_list_response)
+            iam_users_list["iam_users"] = [vars(each_user)
+                                           for each_user in iam_users_list["iam_users"]
+                                           if not vars(each_user)["user_name"] == "root" ]
+        self._listing_cache.put(cache_key, iam_users_list)
         return iam_users_list
 
     @Log.trace_method(Log.DEBUG, exclude_args=['user_password'])
@@ -135,11 +170,13 @@ class IamUsersService(S3BaseService):
         Log.debug(f"Delete IAM User service: Username:{user_name}")
         s3_client = await  self.fetch_iam_client(s3_session)
 
-        list_access_keys_resp = await s3_client.list_user_access_keys(user_name=user_name)
-        if isinstance(list_access_keys_resp, IamError):
-                self._handle_error(list_access_keys_resp)
+        # Collect all the keys first, the listing pages must not change while they are fetched
+        access_keys = [key async for key in s3_client.iter_user_access_keys(user_name=user_name)]
+        for access_key in access_keys:
+            if isinstance(access_key, IamError):
+                self._handle_error(access_key)
 
-        for access_key in list_access_keys_resp.access_keys:
+        for access_key in access_keys:
             del_accesskey_resp = await s3_client.delete_user_access_key(access_key.access_key_id, user_name=user_name)
             if isinstance(del_accesskey_resp, IamError) and not del_accesskey_resp.http_status == 404:
                 self._handle_error(del_accesskey_resp)
@@ -147,6 +184,7 @@ class IamUsersService(S3BaseService):
         user_delete_response = await  s3_client.delete_user(user_name)
         if isinstance(user_delete_response, IamError):
             self._handle_error(user_delete_response)
+        self._listing_cache.invalidate()
         return {"message": "User Deleted Successfully."}
 
     def update_user(self, user_name: str):
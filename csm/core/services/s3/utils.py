@@ -17,6 +17,7 @@ from typing import Any, Optional
 
 from csm.core.blogic import const
 from cortx.utils.conf_store.conf_store import Conf
+from csm.common.cache import TtlCache
 from cortx.utils.log import Log
 from csm.common.services import ApplicationService
 from csm.core.data.models.s3 import S3ConnectionConfig, IamErrors, IamError
@@ -82,6 +83,20 @@ class S3ServiceError(Exception):
 
 
 class S3BaseService(ApplicationService):
+    @staticmethod
+    def _create_listing_cache() -> TtlCache:
+        """
+        Cache of listings, kept for a short time for repeated page requests of the UI
+        """
+        return TtlCache(float(Conf.get(const.CSM_GLOBAL_INDEX, const.S3_LISTING_CACHE_TTL,
+                                       const.DEFAULT_S3_LISTING_CACHE_TTL)))
+
+    @staticmethod
+    def _get_session_key(session):
+        """ Key of the session credentials for the listing cache """
+        return (type(session).__name__, getattr(session, 'user_id', None),
+                getattr(session, 'access_key', None))
+
     def _handle_error(self, error, args: Optional[Any] = None):
         """ A helper method for raising exceptions on S3-related errors """
 
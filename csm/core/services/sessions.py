@@ -14,15 +14,22 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import uuid
+import heapq
 from abc import ABC, abstractmethod
 from enum import Enum
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 from cortx.utils.log import Log
 from cortx.utils.conf_store.conf_store import Conf
+from cortx.utils.data.access import Query
+from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.db.db_provider import DataBaseProvider
+from cortx.utils.security.cipher import Cipher, CipherInvalidToken
+from csm.common.periodic import Periodic
 from csm.core.blogic import const
 from csm.plugins.cortx.s3 import S3Plugin
 from csm.core.data.models.s3 import S3ConnectionConfig, IamError
+from csm.core.data.models.session import SessionModel
 # TODO: from csm.common.passwd import Passwd
 from csm.core.data.models.users import UserType, User, Passwd
 from csm.core.services.users import UserManager
@@ -117,12 +124,218 @@ class Session:
         return self._permissions
 
 
+class SessionStorage(ABC):
+    """
+    Base class of the session storages used by SessionManager.
+    Sessions can be looked up by ID and by user ID (case insensitive), and
+    the expired ones can be removed without scanning all the sessions.
+    """
+
+    # Refreshed expiry times are written back to the storage only when
+    # they moved by at least this interval
+    refresh_interval = timedelta(0)
+
+    @abstractmethod
+    async def store(self, session: Session) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, session_id: Session.Id) -> Optional[Session]:
+        ...
+
+    @abstractmethod
+    async def delete(self, session_id: Session.Id) -> None:
+        ...
+
+    @abstractmethod
+    async def get_all(self) -> List[Session]:
+        ...
+
+    @abstractmethod
+    async def get_by_user(self, user_id: str) -> List[Session]:
+        ...
+
+    @abstractmethod
+    async def delete_expired(self, now: datetime) -> int:
+        """
+        Remove the sessions expired at the given time.
+        :return: Number of removed sessions
+        """
+        ...
+
+
+class InMemorySessionStorage(SessionStorage):
+    """
+    Session storage local to the process.
+    Expiry times are kept in a heap. Refreshing a session does not touch the
+    heap: when a stale entry comes out during a sweep, it is pushed back with
+    the current expiry time of the session.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._user_sessions = {}
+        self._expiry_heap = []
+
+    async def store(self, session: Session) -> None:
+        session_id = session.session_id
+        if session_id not in self._sessions:
+            heapq.heappush(self._expiry_heap, (session.expiry_time, session_id))
+            user_key = session.credentials.user_id.lower()
+            self._user_sessions.setdefault(user_key, set()).add(session_id)
+        self._sessions[session_id] = session
+
+    async def get(self, session_id: Session.Id) -> Optional[Session]:
+        return self._sessions.get(session_id, None)
+
+    def _remove(self, session_id):
+        session = self._sessions.pop(session_id)
+        user_key = session.credentials.user_id.lower()
+        user_sessions = self._user_sessions.get(user_key)
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._user_sessions[user_key]
+        return session
+
+    async def delete(self, session_id: Session.Id) -> None:
+        self._remove(session_id)
+
+    async def get_all(self) -> List[Session]:
+        return list(self._sessions.values())
+
+    async def get_by_user(self, user_id: str) -> List[Session]:
+        session_ids = self._user_sessions.get(user_id.lower(), ())
+        return [self._sessions[session_id] for session_id in session_ids]
+
+    async def delete_expired(self, now: datetime) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, session_id = heapq.heappop(heap)
+            session = self._sessions.get(session_id)
+            if session is None:
+                continue
+            if session.expiry_time < now:
+                self._remove(session_id)
+                removed += 1
+            else:
+                heapq.heappush(heap, (session.expiry_time, session_id))
+        return removed
+
+
+class DbSessionStorage(SessionStorage):
+    """
+    Session storage in the database (consul) shared by several csm_agent
+    processes, see SessionModel in database.yaml.
+    The secret key and session token of S3 sessions are stored encrypted.
+    """
+
+    refresh_interval = timedelta(minutes=1)
+
+    _CREDENTIALS_TYPES = {
+        LocalCredentials: 'local',
+        LdapCredentials: 'ldap',
+        S3Credentials: 's3',
+    }
+
+    def __init__(self, storage: DataBaseProvider, cipher_key: bytes):
+        """
+        :param storage: DataBaseProvider instance
+        :param cipher_key: Key the S3 secrets are encrypted with, see Cipher.generate_key
+        """
+        self._storage = storage
+        self._cipher_key = cipher_key
+
+    def _encrypt(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return Cipher.encrypt(self._cipher_key, value.encode('utf-8')).decode('utf-8')
+
+    def _decrypt(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return Cipher.decrypt(self._cipher_key, value.encode('utf-8')).decode('utf-8')
+
+    def _to_model(self, session: Session) -> SessionModel:
+        credentials = session.credentials
+        model = SessionModel()
+        model.session_id = session.session_id
+        model.user_id = credentials.user_id
+        model.user_key = credentials.user_id.lower()
+        model.credentials_type = self._CREDENTIALS_TYPES[type(credentials)]
+        if isinstance(credentials, S3Credentials):
+            model.access_key = credentials.access_key
+            model.secret_key = self._encrypt(credentials.secret_key)
+            model.session_token = self._encrypt(credentials.session_token)
+        model.permissions = {resource: list(actions)
+                             for resource, actions in session.permissions.as_dict().items()}
+        model.expiry_time = session.expiry_time
+        return model
+
+    def _from_model(self, model: SessionModel) -> Optional[Session]:
+        """
+        Session of the model, None if its S3 secrets can not be decrypted
+        (e.g. the cluster id changed), the user has to log in again then.
+        """
+        if model.credentials_type == 's3':
+            try:
+                credentials = S3Credentials(model.user_id, model.access_key,
+                                            self._decrypt(model.secret_key),
+                                            self._decrypt(model.session_token))
+            except CipherInvalidToken as e:
+                Log.warn(f"Dropping session of {model.user_id}, "
+                         f"credentials can not be decrypted: {e}")
+                return None
+        elif model.credentials_type == 'ldap':
+            credentials = LdapCredentials(model.user_id)
+        else:
+            credentials = LocalCredentials(model.user_id)
+        expiry_time = model.expiry_time
+        if expiry_time.tzinfo is None:
+            expiry_time = expiry_time.replace(tzinfo=timezone.utc)
+        return Session(model.session_id, expiry_time, credentials,
+                       PermissionSet(model.permissions or {}))
+
+    def _from_models(self, models) -> List[Session]:
+        sessions = (self._from_model(model) for model in models)
+        return [session for session in sessions if session is not None]
+
+    async def _get(self, condition) -> List[Session]:
+        query = Query().filter_by(condition)
+        models = await self._storage(SessionModel).get(query)
+        return self._from_models(models)
+
+    async def store(self, session: Session) -> None:
+        await self._storage(SessionModel).store(self._to_model(session))
+
+    async def get(self, session_id: Session.Id) -> Optional[Session]:
+        sessions = await self._get(Compare(SessionModel.session_id, '=', session_id))
+        return next(iter(sessions), None)
+
+    async def delete(self, session_id: Session.Id) -> None:
+        await self._storage(SessionModel).delete(
+            Compare(SessionModel.session_id, '=', session_id))
+
+    async def get_all(self) -> List[Session]:
+        models = await self._storage(SessionModel).get(Query())
+        return self._from_models(models)
+
+    async def get_by_user(self, user_id: str) -> List[Session]:
+        return await self._get(Compare(SessionModel.user_key, '=', user_id.lower()))
+
+    async def delete_expired(self, now: datetime) -> int:
+        return await self._storage(SessionModel).delete(
+            Compare(SessionModel.expiry_time, '<', now))
+
+
 class SessionManager:
     """ Session management class """
 
-    def __init__(self):
-        self._stg = {}
+    def __init__(self, storage: Optional[SessionStorage] = None):
+        self._stg = storage or InMemorySessionStorage()
         self._expiry_interval = timedelta(minutes=60)  # TODO: Load from config
+        self._sweeper = None
 
     @property
     def expiry_interval(self):
@@ -140,20 +353,43 @@ class SessionManager:
         session_id = self._generate_sid()
         expiry_time = self.calc_expiry_time()
         session = Session(session_id, expiry_time, credentials, permissions)
-        self._stg[session_id] = session
+        await self._stg.store(session)
         return session
 
     async def delete(self, session_id: Session.Id) -> None:
-        self._stg.pop(session_id)
+        await self._stg.delete(session_id)
 
     async def get(self, session_id: Session.Id) -> Optional[Session]:
-        return self._stg.get(session_id, None)
+        return await self._stg.get(session_id)
 
     async def get_all(self):
-        return list(self._stg.values())
+        return await self._stg.get_all()
+
+    async def get_by_user(self, user_id: str) -> List[Session]:
+        return await self._stg.get_by_user(user_id)
 
     async def update(self, session: Session) -> None:
-        self._stg[session.session_id] = session
+        await self._stg.store(session)
+
+    async def refresh(self, session: Session) -> None:
+        """ Move the expiry time of the session forward """
+        expiry_time = self.calc_expiry_time()
+        if expiry_time - session.expiry_time >= self._stg.refresh_interval:
+            session.expiry_time = expiry_time
+            await self._stg.store(session)
+
+    async def delete_expired(self) -> None:
+        removed = await self._stg.delete_expired(datetime.now(timezone.utc))
+        if removed:
+            Log.debug(f'Removed {removed} expired sessions')
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        Start removing the expired sessions every interval seconds.
+        """
+        if self._sweeper is None:
+            self._sweeper = Periodic(interval, self.delete_expired)
+            self._sweeper.start(now=False)
 
 
 class AuthPolicy(ABC):
@@ -267,9 +503,15 @@ class LoginService:
             Log.error(f'Failed to authenticate {user_id}')
         return None
 
+    async def _delete_session(self, session_id: Session.Id) -> None:
+        session = await self._session_manager.get(session_id)
+        await self._session_manager.delete(session_id)
+        if session is not None and isinstance(session.credentials, S3Credentials):
+            S3Plugin.release_clients(session.credentials.access_key)
+
     async def logout(self, session_id):
         Log.debug(f'Logging out session {session_id}.')
-        await self._session_manager.delete(session_id)
+        await self._delete_session(session_id)
 
     async def auth_session(self, session_id: Session.Id) -> Session:
         session = await self._session_manager.get(session_id)
@@ -286,7 +528,7 @@ class LoginService:
             raise CsmError(CSM_ERR_INVALID_VALUE, 'Session expired')
 
         # Refresh Expiry Time
-        session.expiry_time = self._session_manager.calc_expiry_time()
+        await self._session_manager.refresh(session)
 
         return session
 
@@ -296,10 +538,9 @@ class LoginService:
         :param user_id: user ID, for S3 session the S3 user name is expected.
         :return: List of temporary access keys.
         """
-        sessions = await self._session_manager.get_all()
+        sessions = await self._session_manager.get_by_user(user_id)
         return [s.credentials.access_key for s in sessions
-                if s.credentials.user_id.lower() == user_id.lower() and isinstance(
-                    s.credentials, S3Credentials)]
+                if isinstance(s.credentials, S3Credentials)]
 
     async def delete_all_sessions(self, session_id: Session.Id) -> None:
         """
@@ -322,7 +563,6 @@ class LoginService:
         :return: None
         """
         Log.debug(f"Delete all active sessions for Userid: {user_id}")
-        session_data = await self._session_manager.get_all()
+        session_data = await self._session_manager.get_by_user(user_id)
         for each_session in session_data:
-            if each_session.credentials.user_id.lower() == user_id.lower():
-                await self._session_manager.delete(each_session.session_id)
+            await self._delete_session(each_session.session_id)
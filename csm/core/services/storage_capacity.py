@@ -14,18 +14,38 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import json
+import time
+import asyncio
+from collections import deque
+from csm.common.periodic import Periodic
 from csm.common.process import SimpleProcess,AsyncioSubprocess
 from cortx.utils.log import Log
 from csm.common.services import ApplicationService
 from csm.core.blogic import const
 from csm.common.errors import CsmInternalError, CsmError
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List
 
 class StorageCapacityService(ApplicationService):
-    def __init__(self, provisioner):
+    def __init__(self, provisioner, sample_period=const.DEFAULT_CAPACITY_SAMPLE_PERIOD,
+                 history_size=const.DEFAULT_CAPACITY_HISTORY_SIZE):
+        """
+        :param sample_period: Seconds a capacity sample is used before the command is run again
+        :param history_size: Number of the latest samples kept for the capacity trend
+        """
+        super().__init__()
         self._provisioner = provisioner
+        self._sample_period = sample_period
+        # (sample time, total space, free space) of the latest samples, oldest first
+        self._samples = deque(maxlen=history_size)
+        self._refresh_task = None
+        self._sampler = None
     """
     Service for Get disk capacity details
+
+    The capacity is sampled by running FILESYSTEM_STAT_CMD at most once per
+    sample period, all the readers in between get the latest sample. A refresh
+    requested while another one is running waits for it instead of running
+    the command again.
     """
 
     @staticmethod
@@ -46,20 +66,10 @@ class StorageCapacityService(ApplicationService):
 
         return round(capacity_float, round_off_value)
 
-    @Log.trace_method(Log.DEBUG)
-    async def get_capacity_details(self, unit=const.DEFAULT_CAPACITY_UNIT, round_off_value=const.DEFAULT_ROUNDOFF_VALUE) -> Dict[str, Any]:
+    async def _read_capacity(self):
         """
-        This method will return system disk details as per command
-
-        :return: dict
+        Run FILESYSTEM_STAT_CMD and append its result to the samples.
         """
-
-        def convert_to_format(value: int, unit: str ,round_off_value:int) -> Any:
-            if unit.upper()==const.DEFAULT_CAPACITY_UNIT:
-                # keep original format (i.e., integer)
-                return value
-            return StorageCapacityService._integer_to_human(value, unit.upper(), round_off_value)
-
         try:
             process = AsyncioSubprocess(const.FILESYSTEM_STAT_CMD)
             stdout, stderr, rc = await process.run()
@@ -76,13 +86,84 @@ class StorageCapacityService(ApplicationService):
             raise CsmInternalError("System storage details not available.")
         if int(capacity_info[const.TOTAL_SPACE]) <= 0:
             raise CsmInternalError("Total storage space cannot be zero", message_args=capacity_info)
+        sample = (time.time(), int(capacity_info[const.TOTAL_SPACE]),
+                  int(capacity_info[const.FREE_SPACE]))
+        self._samples.append(sample)
+        return sample
+
+    async def refresh(self):
+        """
+        Take a new capacity sample. Concurrent calls share one command run.
+
+        :return: (sample time, total space, free space)
+        """
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._read_capacity())
+            self._refresh_task.add_done_callback(self._on_refreshed)
+        return await asyncio.shield(self._refresh_task)
+
+    def _on_refreshed(self, task):
+        self._refresh_task = None
+        if not task.cancelled():
+            # The error is raised to the callers, do not report it as never retrieved
+            task.exception()
+
+    def start_sampler(self, period=None):
+        """
+        Refresh the capacity sample in the background every period seconds.
+
+        :param period: Seconds between the samples, the sample period by default
+        """
+        if self._sampler is None:
+            self._sampler = Periodic(period or self._sample_period, self.refresh)
+            self._sampler.start()
+
+    async def _get_sample(self):
+        if self._samples and time.time() - self._samples[-1][0] < self._sample_period:
+            return self._samples[-1]
+        return await self.refresh()
+
+    @staticmethod
+    def _format_sample(total: int, free: int, unit: str, round_off_value: int) -> Dict[str, Any]:
+
+        def convert_to_format(value: int, unit: str ,round_off_value:int) -> Any:
+            if unit.upper()==const.DEFAULT_CAPACITY_UNIT:
+                # keep original format (i.e., integer)
+                return value
+            return StorageCapacityService._integer_to_human(value, unit.upper(), round_off_value)
+
         formatted_output = {}
-        formatted_output[const.SIZE] = convert_to_format(int(capacity_info[const.TOTAL_SPACE]),unit,round_off_value)
-        formatted_output[const.USED] = convert_to_format(
-            int(capacity_info[const.TOTAL_SPACE] - capacity_info[const.FREE_SPACE]),unit,round_off_value)
-        formatted_output[const.AVAILABLE] = convert_to_format(int(capacity_info[const.FREE_SPACE]),unit,round_off_value)
-        formatted_output[const.USAGE_PERCENTAGE] = round((((int(capacity_info[const.TOTAL_SPACE]) -
-                                                             int(capacity_info[const.FREE_SPACE])) / 
-                                                             int(capacity_info[const.TOTAL_SPACE])) * 100),round_off_value)
+        formatted_output[const.SIZE] = convert_to_format(total,unit,round_off_value)
+        formatted_output[const.USED] = convert_to_format(total - free,unit,round_off_value)
+        formatted_output[const.AVAILABLE] = convert_to_format(free,unit,round_off_value)
+        formatted_output[const.USAGE_PERCENTAGE] = round((((total - free) / total) * 100),
+                                                         round_off_value)
         formatted_output[const.UNIT] = unit
         return formatted_output
+
+    @Log.trace_method(Log.DEBUG)
+    async def get_capacity_details(self, unit=const.DEFAULT_CAPACITY_UNIT, round_off_value=const.DEFAULT_ROUNDOFF_VALUE) -> Dict[str, Any]:
+        """
+        This method will return system disk details as per command
+
+        :return: dict
+        """
+        _, total, free = await self._get_sample()
+        return self._format_sample(total, free, unit, round_off_value)
+
+    @Log.trace_method(Log.DEBUG)
+    async def get_capacity_history(self, unit=const.DEFAULT_CAPACITY_UNIT,
+                                   round_off_value=const.DEFAULT_ROUNDOFF_VALUE) -> List[Dict[str, Any]]:
+        """
+        Return the latest capacity samples, oldest first, for plotting the capacity trend
+
+        :return: list of dict
+        """
+        if not self._samples:
+            await self._get_sample()
+        history = []
+        for sample_time, total, free in self._samples:
+            sample = self._format_sample(total, free, unit, round_off_value)
+            sample[const.CAPACITY_SAMPLE_TIME] = int(sample_time)
+            history.append(sample)
+        return history
@@ -16,6 +16,7 @@
 from typing import List
 
 from csm.common.errors import CsmNotFoundError
+from csm.common.observer import Observable
 from csm.common.email import EmailSender, EmailError
 from csm.common.queries import SortBy
 from csm.common.services import ApplicationService
@@ -32,12 +33,14 @@ from csm.plugins.cortx.provisioner import ProvisionerPlugin
 
 SYSTEM_CONFIG_NOT_FOUND = "system_config_not_found"
 
-class SystemConfigManager:
+class SystemConfigManager(Observable):
     """
     The class encapsulates system config management activities.
+    Listeners are notified with the config id whenever a config is changed.
     """
 
     def __init__(self, storage: DataBaseProvider) -> None:
+        super().__init__()
         self.storage = storage
 
     async def create(self,
@@ -48,7 +51,9 @@ class SystemConfigManager:
         :returns: System config settings object.
         """
         # TODO Model Validation.
-        return await self.storage(SystemConfigSettings).store(system_config)
+        result = await self.storage(SystemConfigSettings).store(system_config)
+        self._notify_listeners_from_loop(system_config.config_id)
+        return result
 
     async def get_system_config_by_id(self,
                                       config_id: str) -> SystemConfigSettings:
@@ -96,6 +101,7 @@ class SystemConfigManager:
         # TODO: validate the model
         Log.debug("Save system config")
         await self.storage(SystemConfigSettings).store(system_config)
+        self._notify_listeners_from_loop(system_config.config_id)
 
     async def delete(self, config_id: str) -> None:
         """
@@ -106,6 +112,7 @@ class SystemConfigManager:
         await self.storage(SystemConfigSettings).delete(
             Compare(SystemConfigSettings.config_id, \
                     '=', config_id))
+        self._notify_listeners_from_loop(config_id)
 
     async def get_current_config(self):
         # TODO: give it more thought
@@ -20,6 +20,8 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from cortx.utils.log import Log
+from csm.common.cache import TtlCache
+from csm.common.observer import Observable
 from csm.common.services import Service, ApplicationService
 from csm.common.queries import SortBy, SortOrder, QueryLimits, DateTimeRange
 from csm.core.data.models.users import User, UserType, Passwd
@@ -35,13 +37,47 @@ from schematics.types import StringType, BooleanType, IntType
 from typing import Optional, Iterable
 from cortx.utils.conf_store.conf_store import Conf
 
-class UserManager:
+class UserManager(Observable):
     """
     The class encapsulates user management activities.
     This is intended to be used during user management and authorization
+
+    Users are looked up by their lowercase user_id_lower key. The records
+    that are read or written are kept in a write-through cache for
+    cache_ttl seconds. The cache holds copies and get() returns copies, so
+    changing a user does not change the cached one until it is saved.
+    Listeners are notified with the user id whenever a user is saved or
+    deleted.
     """
-    def __init__(self, storage: DataBaseProvider) -> None:
+    def __init__(self, storage: DataBaseProvider,
+                 cache_ttl: float = const.DEFAULT_USER_CACHE_TTL) -> None:
+        super().__init__()
         self.storage = storage
+        # user_id_lower -> copy of the stored User
+        self._cache = TtlCache(cache_ttl)
+        self._normalized = False
+        self._normalize_lock = asyncio.Lock()
+
+    async def _normalize_ids(self) -> None:
+        """
+        Store the user_id_lower key of the records created before it was added.
+        This is done once, then users are never looked up by a full scan.
+        """
+        if self._normalized:
+            return
+        async with self._normalize_lock:
+            if self._normalized:
+                return
+            for user in await self.get_list():
+                if user.user_id_lower != User.normalize_id(user.user_id):
+                    Log.info(f"Storing user_id_lower of user {user.user_id}")
+                    user.user_id_lower = User.normalize_id(user.user_id)
+                    await self.storage(User).store(user)
+            self._normalized = True
+
+    @staticmethod
+    def _copy(user: User) -> User:
+        return User(user.to_native())
 
     async def create(self, user: User) -> User:
         """
@@ -53,27 +89,36 @@ class UserManager:
         if existing_user:
             raise ResourceExist(f"User already exists: {existing_user.user_id}", USERS_MSG_ALREADY_EXISTS)
 
-        return await self.storage(User).store(user)
+        return await self.save(user)
 
     async def get(self, user_id) -> User:
         """
         Fetches a single user.
-        :param user_id: User identifier
+        :param user_id: User identifier, case insensitive
         :returns: User object in case of success. None otherwise.
         """
         Log.debug(f"Get user service user id:{user_id}")
-        # TODO In absence of ComapareIgnoreCase manually filtering 
-        # query = Query().filter_by(Compare(User.to_native("user_id").lower(), '=', user_id.lower()))
-        # return next(iter(await self.storage(User).get(query)), None)
-        all_users = await self.get_list()
-        for user in all_users:
-            if user["user_id"].lower() == user_id.lower():
-                return user
-        return None
+        key = User.normalize_id(user_id)
+        user = self._cache.get(key)
+        if user is not None:
+            return self._copy(user)
+        await self._normalize_ids()
+        query = Query().filter_by(Compare(User.user_id_lower, '=', key))
+        user = next(iter(await self.storage(User).get(query)), None)
+        if user is not None:
+            self._cache.put(key, self._copy(user))
+        return user
 
     async def delete(self, user_id: str) -> None:
         Log.debug(f"Delete user service user id:{user_id}")
-        await self.storage(User).delete(Compare(User.user_id, '=', user_id))
+        key = User.normalize_id(user_id)
+        self._cache.invalidate(lambda cached: cached == key)
+        try:
+            await self.storage(User).delete(Compare(User.user_id, '=', user_id))
+        finally:
+            # A get() running during the deletion may have cached the record again
+            self._cache.invalidate(lambda cached: cached == key)
+        self._notify_listeners_from_loop(user_id)
 
     async def get_list(self, offset: int = None, limit: int = None,
                        sort: SortBy = None) -> List[User]:
@@ -112,7 +157,15 @@ class UserManager:
         :param user:
         """
         # TODO: validate the model
-        await self.storage(User).store(user)
+        user.user_id_lower = User.normalize_id(user.user_id)
+        try:
+            result = await self.storage(User).store(user)
+        except Exception:
+            self._cache.invalidate(lambda key: key == user.user_id_lower)
+            raise
+        self._cache.put(user.user_id_lower, self._copy(user))
+        self._notify_listeners_from_loop(user.user_id)
+        return result
 
 
 USERS_MSG_USER_NOT_FOUND = "users_not_found"
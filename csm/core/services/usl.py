@@ -26,6 +26,7 @@ from typing import Any, Dict, List
 from uuid import UUID, uuid4, uuid5
 
 from cortx.utils.conf_store.conf_store import Conf
+from csm.common.cache import TtlCache
 from csm.common.errors import (
     CsmGatewayTimeout, CsmInternalError, CsmNotFoundError, CsmPermissionDenied, InvalidRequest)
 from csm.common.periodic import Periodic
@@ -51,6 +52,8 @@ from cortx.utils.security.cipher import Cipher
 
 DEFAULT_CORTX_DEVICE_VENDOR = 'Seagate'
 USL_API_KEY_UPDATE_PERIOD = 24 * 60 * 60
+# Maximum number of bucket tagging requests sent at once
+USL_BUCKET_TAGGING_CONCURRENCY = 16
 
 
 class UslApiKeyDispatcher:
@@ -81,12 +84,14 @@ class UslService(ApplicationService):
     _native_certificate_manager: USLNativeCertificateManager
     _api_key_dispatch: UslApiKeyDispatcher
 
-    def __init__(self, s3_plugin, storage, provisioner) -> None:
+    def __init__(self, s3_plugin, storage, provisioner, storage_capacity_service=None) -> None:
         """
         Constructor.
         """
         self._s3plugin = s3_plugin
         self._provisioner = provisioner
+        self._storage_capacity_service = (storage_capacity_service or
+                                          StorageCapacityService(provisioner))
         self._storage = storage
         self._device_uuid = self._get_device_uuid()
         key = Cipher.generate_key(str(self._device_uuid), 'USL')
@@ -94,6 +99,11 @@ class UslService(ApplicationService):
         self._domain_certificate_manager = USLDomainCertificateManager(secure_storage)
         self._native_certificate_manager = USLNativeCertificateManager()
         self._api_key_dispatch = UslApiKeyDispatcher(self._storage)
+        # (access key, secret key) -> volumes
+        self._volumes_cache = TtlCache(float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.USL_VOLUMES_CACHE_TTL,
+            const.DEFAULT_USL_VOLUMES_CACHE_TTL)))
+        self._volumes_generation = 0
 
     async def _get_system_friendly_name(self) -> str:
         entries = await self._storage(ApplianceName).get(Query())
@@ -128,36 +138,65 @@ class UslService(ApplicationService):
         tags = await s3_cli.get_bucket_tagging(bucket.name)
         return tags.get('udx', 'disabled') == 'enabled'
 
-    async def _get_volume_name(self, bucket_name: str) -> str:
-        return await self._get_system_friendly_name() + ": " + bucket_name
+    def _get_volume_name(self, friendly_name: str, bucket_name: str) -> str:
+        return friendly_name + ": " + bucket_name
 
     def _get_volume_uuid(self, bucket_name: str) -> UUID:
         """Generates the CORTX volume (bucket) UUID from CORTX device UUID and bucket name."""
         return uuid5(self._device_uuid, bucket_name)
 
-    async def _format_bucket_as_volume(self, bucket: Bucket) -> Volume:
+    def _format_bucket_as_volume(self, bucket: Bucket, friendly_name: str,
+                                 capacity_details: Dict) -> Volume:
         bucket_name = bucket.name
-        volume_name = await self._get_volume_name(bucket_name)
+        volume_name = self._get_volume_name(friendly_name, bucket_name)
         device_uuid = self._device_uuid
         volume_uuid = self._get_volume_uuid(bucket_name)
-        capacity_details = await StorageCapacityService(self._provisioner).get_capacity_details()
         capacity_size = capacity_details[const.SIZE]
         capacity_used = capacity_details[const.USED]
         return Volume.instantiate(
             volume_name, bucket_name, device_uuid, volume_uuid, capacity_size, capacity_used)
 
+    def invalidate_volumes(self, bucket_name: str = None) -> None:
+        """
+        Drops the cached volume lists, e.g. when a bucket or its tags are changed.
+
+        :param bucket_name: Name of the changed bucket
+        """
+        self._volumes_generation += 1
+        self._volumes_cache.invalidate()
+
     async def _get_lyve_pilot_volume_list(
         self, access_key_id: str, secret_access_key: str
     ) -> Dict[UUID, Volume]:
+        cache_key = (access_key_id, secret_access_key)
+        volumes = self._volumes_cache.get(cache_key)
+        if volumes is not None:
+            return volumes
+        generation = self._volumes_generation
+
         s3_client = self._s3plugin.get_s3_client(
             access_key_id, secret_access_key, CsmS3ConfigurationFactory.get_s3_connection_config()
         )
+        buckets = list(await s3_client.get_all_buckets())
+        semaphore = asyncio.Semaphore(USL_BUCKET_TAGGING_CONCURRENCY)
+
+        async def is_enabled(bucket):
+            async with semaphore:
+                return await self._is_bucket_lyve_pilot_enabled(s3_client, bucket)
+
+        enabled = await asyncio.gather(*(is_enabled(bucket) for bucket in buckets))
+        enabled_buckets = [bucket for bucket, is_on in zip(buckets, enabled) if is_on]
         volumes = {}
-        for bucket in await s3_client.get_all_buckets():
-            if not await self._is_bucket_lyve_pilot_enabled(s3_client, bucket):
-                continue
-            volume = await self._format_bucket_as_volume(bucket)
-            volumes[volume.uuid] = volume
+        if enabled_buckets:
+            # The same for all the volumes, fetched once per listing
+            friendly_name = await self._get_system_friendly_name()
+            capacity_details = await self._storage_capacity_service.get_capacity_details()
+            for bucket in enabled_buckets:
+                volume = self._format_bucket_as_volume(bucket, friendly_name, capacity_details)
+                volumes[volume.uuid] = volume
+        # Not cached if the buckets were changed during the listing
+        if generation == self._volumes_generation:
+            self._volumes_cache.put(cache_key, volumes)
         return volumes
 
     # TODO replace stub
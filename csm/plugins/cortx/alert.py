@@ -20,7 +20,7 @@ import asyncio
 from csm.common.comm import AmqpComm
 from csm.common.errors import CsmError
 from cortx.utils.log import Log
-from csm.common.payload import Payload, Json, JsonMessage, Dict
+from csm.common.payload import Json, JsonMessage, PayloadMap
 from csm.common.plugin import CsmPlugin
 from csm.core.blogic import const
 from marshmallow import Schema, fields, ValidationError
@@ -112,26 +112,64 @@ class AlertPlugin(CsmPlugin):
             self.comm_client = AmqpComm()
             self.monitor_callback = None
             self.health_plugin = None
+            self.batch_size = 1
+            self.flush_interval = 0
+            self.consumer_mode = const.ALERT_CONSUMER_THREAD
+            self.prefetch_count = 0
+            self.consumers = 1
             self.mapping_dict = Json(const.ALERT_MAPPING_TABLE).load()
+            self._compile_mapping()
+            self.alert_validator = AlertSchemaValidator()
             self.decision_maker_service = DecisionMakerService()
         except Exception as e:
             Log.exception(e)
 
-    def init(self, callback_fn, health_plugin):
+    def init(self, callback_fn, health_plugin, batch_size=1, flush_interval=0,
+             consumer_mode=const.ALERT_CONSUMER_THREAD, prefetch_count=0, consumers=1):
         """
         Establish connection with the RMQ Server.
         AlertPlugin's _listen method acts as the thread function.
         Parameters -
         1. callback_fn :- This parameter specifies the name AlertMonitor 
            class function to which plugin will send the alerts as JSON string.  
+        2. batch_size :- If greater than 1, alerts are passed to callback_fn
+           as a list of up to batch_size alerts.
+        3. flush_interval :- Maximum time in seconds an alert waits for its
+           batch to be filled.
+        4. consumer_mode :- In async mode, alerts are received by listen_async
+           on the event loop and callback_fn must be a coroutine function.
+           The connection is then established by listen_async.
+        5. prefetch_count :- Maximum number of alerts received in async mode
+           and not processed yet.
+        6. consumers :- Number of alerts processed concurrently in async mode.
         """
         try:
             self.monitor_callback = callback_fn
             self.health_plugin = health_plugin
-            self.comm_client.init()
+            self.batch_size = batch_size
+            self.flush_interval = flush_interval
+            self.consumer_mode = consumer_mode
+            self.prefetch_count = prefetch_count
+            self.consumers = consumers
+            if consumer_mode != const.ALERT_CONSUMER_ASYNC:
+                self.comm_client.init()
         except Exception as e:
             Log.error(f"Error occured while calling alert plugin init. {e}")
 
+    def _compile_mapping(self):
+        """
+        Compile the mapping table once into a conversion plan per resource
+        type. Each plan applies the common mapping followed by the resource
+        specific one. Unknown resource types use the common mapping only.
+        """
+        common_mapping = self.mapping_dict.get(const.COMMON)
+        self._common_map = PayloadMap(common_mapping)
+        self._resource_maps = {
+            resource_type: PayloadMap(common_mapping, resource_mapping)
+            for resource_type, resource_mapping in self.mapping_dict.items()
+            if resource_type != const.COMMON and resource_mapping
+        }
+
     def process_request(self, **kwargs):
         for key, value in kwargs.items():
             if key == const.CSM_ALERT_CMD and value.strip() == 'listen':
@@ -168,10 +206,9 @@ class AlertPlugin(CsmPlugin):
             try:
                 if self.monitor_callback:
                     Log.info("Coverting and validating alert.")
-                    alert = self._convert_to_csm_schema(message)
+                    alert = self._convert_to_csm_schema(sensor_queue_msg)
                     """Validating Schema using marshmallow"""
-                    alert_validator = AlertSchemaValidator()
-                    alert_data = alert_validator.load(alert,  unknown='EXCLUDE')
+                    alert_data = self.alert_validator.load(alert,  unknown='EXCLUDE')
                     Log.debug(f"Alert validated : {alert_data}")
                     status = self.monitor_callback(alert_data)
                     """
@@ -192,6 +229,96 @@ class AlertPlugin(CsmPlugin):
             Log.debug(f"Marking sensor response as acknowleged. status: {status}")
             self.comm_client.acknowledge()
 
+    def _plugin_batch_callback(self, messages):
+        """
+        Batched counterpart of _plugin_callback.
+        1. Actuator responses are passed to the health plugin one by one.
+        2. Alerts are converted and validated, then passed to AlertMonitor
+           as a single list. Invalid alerts are dropped.
+        3. Returns for each message whether it is done with. Only the alerts
+           of a batch AlertMonitor could not store are False, the comm client
+           returns them to the queue. Alerts are stored by alert_uuid, so one
+           stored before the batch failed is overwritten when it comes again.
+        Parameters -
+        1. messages - List of actual alert JSON strings
+        """
+        results = [True] * len(messages)
+        alerts = []
+        indexes = []
+        sensor_queue_msgs = []
+        for index, message in enumerate(messages):
+            try:
+                sensor_queue_msg = JsonMessage(message).load()
+                Log.info(f"Message on sensor queue: {sensor_queue_msg}")
+                title = sensor_queue_msg.get("title", "")
+                if "actuator" in title.lower():
+                    self.health_plugin.health_plugin_callback(message)
+                elif "sensor" in title.lower():
+                    alert = self._convert_to_csm_schema(sensor_queue_msg)
+                    alerts.append(self.alert_validator.load(alert, unknown='EXCLUDE'))
+                    indexes.append(index)
+                    sensor_queue_msgs.append(sensor_queue_msg)
+            except ValidationError as ve:
+                Log.warn(f"Dropping alert on validation error {ve}")
+            except Exception as e:
+                Log.warn(f"Dropping message, error occured during processing: {e}")
+        if alerts and self.monitor_callback:
+            Log.debug(f"Alerts validated : {len(alerts)}")
+            if not self.monitor_callback(alerts):
+                Log.warn(f"Alerts not stored: {len(alerts)}")
+                for index in indexes:
+                    results[index] = False
+                return results
+        if self.decision_maker_service:
+            for sensor_queue_msg in sensor_queue_msgs:
+                self.decision_maker_service.decision_maker_callback(sensor_queue_msg)
+        return results
+
+    async def _plugin_async_callback(self, message):
+        """
+        Asyncio counterpart of _plugin_callback, called by the consumer tasks
+        of the comm client on the event loop.
+        Returns True if the message is to be acknowledged. False is returned
+        only when the alert could not be stored, the message is then returned
+        to the queue. Messages that can never be processed are acknowledged.
+        Parameters -
+        1. message - Actual alert JSON string
+        """
+        try:
+            sensor_queue_msg = JsonMessage(message).load()
+        except ValueError as e:
+            Log.warn(f"Dropping message that is not valid JSON: {e}")
+            return True
+        Log.info(f"Message on sensor queue: {sensor_queue_msg}")
+        title = sensor_queue_msg.get("title", "").lower()
+        if "actuator" in title:
+            """
+            Health plugin waits on the event loop while updating the health map,
+            so it is called in the default executor.
+            """
+            status = await asyncio.get_event_loop().run_in_executor(None,
+                self.health_plugin.health_plugin_callback, message)
+            if not status:
+                Log.warn("Dropping actuator response not processed by health plugin.")
+            return True
+        if "sensor" not in title:
+            Log.warn(f"Dropping message of unknown type: {title}")
+            return True
+        try:
+            Log.info("Coverting and validating alert.")
+            alert = self._convert_to_csm_schema(sensor_queue_msg)
+            alert_data = self.alert_validator.load(alert, unknown='EXCLUDE')
+            Log.debug(f"Alert validated : {alert_data}")
+        except ValidationError as ve:
+            # Acknowledge incase of validation error.
+            Log.warn(f"Acknowledge incase of validation error {ve}")
+            return True
+        status = await self.monitor_callback(alert_data)
+        if self.decision_maker_service and status:
+            await self.decision_maker_service.decision_maker_callback_async(
+                sensor_queue_msg)
+        return status
+
     def _listen(self):
         """
         This is thread function.
@@ -199,7 +326,25 @@ class AlertPlugin(CsmPlugin):
         and starts consuming the alerts.
         """
         try:
-            self.comm_client.recv(self._plugin_callback)
+            if self.batch_size > 1:
+                self.comm_client.recv_batch(self._plugin_batch_callback,
+                                            self.batch_size, self.flush_interval)
+            else:
+                self.comm_client.recv(self._plugin_callback)
+        except Exception as e:
+            Log.warn(e)
+
+    async def listen_async(self):
+        """
+        Asyncio counterpart of _listen. It has to be run as a task of the
+        event loop, alerts are then processed on the loop by a pool of
+        consumer tasks.
+        """
+        try:
+            await self.comm_client.recv_async(self._plugin_async_callback,
+                                              self.prefetch_count, self.consumers)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             Log.warn(e)
 
@@ -214,12 +359,15 @@ class AlertPlugin(CsmPlugin):
     def _convert_to_csm_schema(self, message):
         """
         Parsing the alert JSON to create the csm schema
+        :param message: Alert JSON string or the already loaded alert message
         """
         Log.debug(f"Convert to csm schema:{message}")
         csm_schema = {}
         try:
-            json_msg_obj = JsonMessage(message)
-            msg_body = json_msg_obj.load()
+            if isinstance(message, dict):
+                msg_body = message
+            else:
+                msg_body = JsonMessage(message).load()
             sub_body = msg_body.get(const.ALERT_MESSAGE, {}).get(
                 const.ALERT_SENSOR_TYPE, {})
             resource_type = sub_body.get("info", {}).get\
@@ -236,16 +384,8 @@ class AlertPlugin(CsmPlugin):
                 """
                 module_type = res_split[len(res_split) - 1]
                 """ Convert  the SSPL Schema to CSM Schema. """
-                input_alert_payload = Payload(JsonMessage(message))
-                csm_alert_payload = Payload(Dict(dict()))
-                input_alert_payload.convert(self.mapping_dict.get\
-                        (const.COMMON), csm_alert_payload)
-                resource_mapping = self.mapping_dict.get(resource_type, "")
-                if resource_mapping:
-                    input_alert_payload.convert(resource_mapping, csm_alert_payload)
-                csm_alert_payload.dump()
-                csm_schema = csm_alert_payload.load()
-                obj_extended_info = JsonMessage(csm_schema[const.ALERT_EXTENDED_INFO])
+                csm_schema = self._resource_maps.get(resource_type,
+                                                     self._common_map).convert(msg_body)
                 """
                 Fetching the health information from the alert.
                 Currently we require 3 values 1. health, 2. health_reason and
@@ -306,13 +446,12 @@ class AlertPlugin(CsmPlugin):
                 if const.ALERT_EVENTS in csm_schema and \
                         csm_schema[const.ALERT_EVENTS] is not None:
                     csm_schema[const.ALERT_EVENT_DETAILS] = []
-                    obj_event_details = JsonMessage(csm_schema[const.ALERT_EVENT_DETAILS])
                     self._prepare_specific_info(csm_schema, specific_info)
                     csm_schema.pop(const.ALERT_EVENTS)
-                    csm_schema[const.ALERT_EVENT_DETAILS]= \
-                        obj_event_details.dump(csm_schema[const.ALERT_EVENT_DETAILS])
+                    csm_schema[const.ALERT_EVENT_DETAILS] = \
+                        json.dumps(csm_schema[const.ALERT_EVENT_DETAILS])
                 csm_schema[const.ALERT_EXTENDED_INFO] = \
-                    obj_extended_info.dump(csm_schema[const.ALERT_EXTENDED_INFO])
+                    json.dumps(csm_schema[const.ALERT_EXTENDED_INFO])
         except Exception as e:
             Log.error(f"Error occured in coverting alert to csm schema. {e}")
         Log.debug(f"Converted schema:{csm_schema}")
@@ -372,6 +511,26 @@ class DecisionMakerService(Service):
     def decision_maker_callback(self, alert_data):
         self._transmit_alerts_info(alert_data)
 
+    async def decision_maker_callback_async(self, alert_data):
+        """
+        Asyncio counterpart of decision_maker_callback, to be called on the
+        event loop.
+        """
+        error = ""
+        if self._decision_maker:
+            for count in range(0, const.ALERT_RETRY_COUNT):
+                try:
+                    Log.debug(f"Sending Alert to Decision Maker for data {alert_data}")
+                    await self._decision_maker.handle_alert(alert_data)
+                except Exception as e:
+                    Log.debug(f"retrying decision_maker {count} : {e}")
+                    error = f"{e}"
+                    await asyncio.sleep(2**count)
+                    continue
+                break
+            else:
+                Log.error(f"Decision Maker Failed {error} for data {alert_data}")
+
     def _transmit_alerts_info(self, alert_data):
         """
         This Method will send the alert to HA system for System check.
@@ -19,6 +19,7 @@ import os
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from cortx.utils.log import Log
+from csm.common.cache import TtlCache
 from csm.core.blogic import const
 from csm.common.errors import InvalidRequest, CsmInternalError
 from csm.core.data.models.upgrade import (PackageInformation, ProvisionerStatusResponse,
@@ -59,6 +60,14 @@ class ProvisionerPlugin:
     PRVSNR_NETWORK_PARAM_CIP = 'network/cluster_ip'
 
     def __init__(self, username=None, password=None):
+        # Provisioner calls block on salt, they are run by a shared executor
+        self._executor = ThreadPoolExecutor(max_workers=int(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.PROVISIONER_MAX_WORKERS, const.DEFAULT_PROVISIONER_MAX_WORKERS)))
+        # Results of the read-only queries
+        self._cache = TtlCache(float(Conf.get(const.CSM_GLOBAL_INDEX,
+            const.PROVISIONER_CACHE_TTL, const.DEFAULT_PROVISIONER_CACHE_TTL)))
+        # key -> task of the call in flight
+        self._calls = {}
         try:
             self.provisioner = provisioner
             Log.info("Provisioner plugin is loaded")
@@ -74,9 +83,33 @@ class ProvisionerPlugin:
             Log.error(f"Provisioner module not found : {error}")
 
     async def _await_nonasync(self, func):
-        pool = ThreadPoolExecutor(max_workers=1)
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(pool, func)
+        return await loop.run_in_executor(self._executor, func)
+
+    async def _await_shared(self, key, func, cache=False):
+        """
+        Same as _await_nonasync, but concurrent calls with the same key share
+        one run of func.
+        :param key: Key of the call
+        :param func: Function to be run by the executor
+        :param cache: Keep the result in the cache of read-only queries
+        """
+        if cache:
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._await_nonasync(func))
+            self._calls[key] = task
+            task.add_done_callback(lambda task: self._on_call_done(key, task, cache))
+        return await asyncio.shield(task)
+
+    def _on_call_done(self, key, task, cache):
+        self._calls.pop(key, None)
+        # The error is raised to the callers, do not report it as never retrieved
+        if not task.cancelled() and task.exception() is None and cache:
+            self._cache.put(key, task.result())
 
     @Log.trace_method(Log.DEBUG)
     async def validate_hotfix_package(self, path, file_name) -> PackageInformation:
@@ -125,6 +158,8 @@ class ProvisionerPlugin:
             except Exception as e:
                 Log.exception(e)
                 raise CsmInternalError('Failed to start the software update process')
+        # The product version is going to change
+        self._cache.invalidate()
         return await self._await_nonasync(_command_handler)
 
     @Log.trace_method(Log.DEBUG)
@@ -146,7 +181,7 @@ class ProvisionerPlugin:
             except self.provisioner.errors.ProvisionerError as pe:
                 return ProvisionerStatusResponse(ProvisionerCommandStatus.Failure, str(pe))
 
-        return await self._await_nonasync(_command_handler)
+        return await self._await_shared(('job_status', query_id), _command_handler)
 
 
     def _generate_random_version(self):
@@ -269,7 +304,7 @@ class ProvisionerPlugin:
                 except Exception as error:
                     Log.error(f"Provisioner api error : {error}")
                     raise NetworkConfigFetchError(f"Failed to fetch Network Configuration: {error}")
-            network_config = await self._await_nonasync(_command_handler)
+            network_config = await self._await_shared('network_configuration', _command_handler)
             Conf.set(const.CSM_GLOBAL_INDEX, const.NETWORK_CONFIG, network_config)
             Log.debug(f"Netowrk config fetched from provisioner, set in in-memory: {network_config}")
 
@@ -288,7 +323,7 @@ class ProvisionerPlugin:
                 Log.error(f"Provisioner api error : {error}")
                 raise ClusterIdFetchError(f"Failed to fetch IDs: {error}")
 
-        return await self._await_nonasync(_command_handler)
+        return await self._await_shared('cluster_id', _command_handler, cache=True)
 
     def get_dict(self, dictionary, keys, default=None):
         """
@@ -424,7 +459,7 @@ class ProvisionerPlugin:
                 Log.error(f"Failed to get release version : {error}")
                 raise ProductVersionFetchError(f"Failed to fetch product version: {error}")
 
-        return await self._await_nonasync(_command_handler)
+        return await self._await_shared('current_version', _command_handler, cache=True)
 
     @Log.trace_method(Log.DEBUG)
     async def start_node_replacement(self, node_id, hostname=None, ssh_port=None):
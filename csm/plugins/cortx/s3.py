@@ -13,11 +13,13 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import time
 import asyncio
+import threading
 import boto
 import boto3
 from botocore.exceptions import ClientError
-from functools import partial
+from collections import OrderedDict
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List
@@ -27,9 +29,11 @@ from boto.connection import DEFAULT_CA_CERTS_FILE
 from boto import config as boto_config
 from http import HTTPStatus
 from cortx.utils.log import Log
+from cortx.utils.conf_store.conf_store import Conf
 import json
 from csm.common.errors import CsmInternalError
 from csm.core.blogic import const
+from csm.plugins.cortx.s3_transport import AioS3Transport, S3Bucket
 from csm.core.data.models.s3 import (S3ConnectionConfig, IamAccount, ExtendedIamAccount,
                                      IamLoginProfile, IamUser, IamUserListResponse,
                                      IamAccountListResponse, IamTempCredentials, IamUserCredentials,
@@ -43,10 +47,18 @@ class BaseClient:
     """
 
     def __init__(self, access_key: str, secret_key: str, config: S3ConnectionConfig,
-                 loop=asyncio.get_event_loop(), session_token=None):
+                 loop=asyncio.get_event_loop(), session_token=None, executor=None,
+                 transport: AioS3Transport = None):
         self._loop = loop
-        self._executor = ThreadPoolExecutor()
+        self._executor = executor or ThreadPoolExecutor()
         self._config = config
+        # Requests are sent by the transport on the event loop if it is set,
+        # otherwise by boto in the executor
+        self._transport = transport
+        # Number of boto calls running in the executor, the client is closed
+        # after them if it is evicted from the pool in the meantime
+        self._calls = 0
+        self._close_pending = False
         self.connection = self._create_boto_connection(access_key, secret_key,
                                                        config, session_token)
 
@@ -86,8 +98,32 @@ class BaseClient:
             conn.num_retries = config.max_retries_num
         return conn
 
-    async def _run_async(self, function):
-        return await self._loop.run_in_executor(self._executor, function)
+    def close(self):
+        """
+        Close the connections kept alive by the boto connection.
+        """
+        close = getattr(self.connection, 'close', None)
+        if close is not None:
+            close()
+
+    def close_when_idle(self):
+        """
+        Close the client now or, if boto calls are running, after the last one.
+        """
+        if self._calls:
+            self._close_pending = True
+        else:
+            self.close()
+
+    async def _run_async(self, function, *args):
+        self._calls += 1
+        try:
+            return await self._loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self._calls -= 1
+            if self._close_pending and not self._calls:
+                self._close_pending = False
+                self.close()
 
     def _parse_body(self, body, list_marker=None) -> dict:
         if not body:
@@ -104,14 +140,17 @@ class BaseClient:
     async def _query_conn(self, action, params, path, verb, list_marker=None):
         Log.debug(f"Make query:action:{action}, params:{params}, "
                   f"path:{path}, verb:{verb}, list_marker:{list_marker}")
+        if self._transport is not None:
+            return await self._transport.query(action, params, path, verb, list_marker)
+
         def _execute():
-            return self.connection.make_request(action, params, path, verb)
+            response = self.connection.make_request(action, params, path, verb)
+            return response.status, response.read()
 
         try:
-            response = await self._run_async(_execute)
-            body = response.read()
-            Log.debug('%s responded with %s status', self._config.host, response.status)
-            return (response.status, self._parse_body(body, list_marker))
+            status, body = await self._run_async(_execute)
+            Log.debug('%s responded with %s status', self._config.host, status)
+            return (status, self._parse_body(body, list_marker))
         except Exception as e:
             raise e  # TODO: create some custom exception for this?
 
@@ -307,20 +346,21 @@ class IamClient(BaseClient):
 
     @Log.trace_method(Log.DEBUG)
     async def get_account(self, account_name) -> Union[IamAccount, IamError]:
-        accounts = await self.list_accounts()
-        if isinstance(accounts, IamError):
-            return accounts
-        for acc in accounts.iam_accounts:
-            if acc.account_name == account_name:
-                return acc
+        accounts = self.iter_accounts()
+        try:
+            async for acc in accounts:
+                if isinstance(acc, IamError) or acc.account_name == account_name:
+                    return acc
+        finally:
+            await accounts.aclose()
         return None
 
     @Log.trace_method(Log.DEBUG)
     async def list_accounts(self, max_items=None,
                             marker=None) -> Union[IamAccountListResponse, IamError]:
         """
-        Fetches the list of S3 accounts from the IAM server.
-        Note that max_items and marker parameters are not supported yet!
+        Fetches a page of the list of S3 accounts from the IAM server.
+        Use iter_accounts() to go through all the pages.
 
         :returns: IamAccountListResponse or IamError
         """
@@ -355,6 +395,40 @@ class IamClient(BaseClient):
 
             return resp
 
+    async def _iter_pages(self, list_page, items_attr, **kwargs):
+        """
+        Page through a listing following its markers. The next page is
+        requested while the items of the current one are consumed.
+
+        :param list_page: listing method accepting marker and max_items arguments
+        :param items_attr: attribute of the listing response holding the items
+        :returns: async iterator of the items, an IamError is the last item if a page fails
+        """
+        next_page = asyncio.ensure_future(list_page(**kwargs))
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if isinstance(page, IamError):
+                    yield page
+                    return
+                if page.is_truncated:
+                    next_page = asyncio.ensure_future(list_page(marker=page.marker, **kwargs))
+                for item in getattr(page, items_attr):
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def iter_accounts(self, page_size=None):
+        """
+        Iterates over all the S3 accounts, page by page.
+
+        :param page_size: maximum number of accounts fetched by one request
+        :returns: async iterator of IamAccount, an IamError is the last item on failure
+        """
+        return self._iter_pages(self.list_accounts, 'iam_accounts', max_items=page_size)
+
     @Log.trace_method(Log.DEBUG)
     async def reset_account_access_key(self, account_name) -> Union[ExtendedIamAccount, IamError]:
         """
@@ -504,6 +578,15 @@ class IamClient(BaseClient):
 
             return resp
 
+    def iter_users(self, page_size=None):
+        """
+        Iterates over all the IAM users, page by page.
+
+        :param page_size: maximum number of users fetched by one request
+        :returns: async iterator of IamUser, an IamError is the last item on failure
+        """
+        return self._iter_pages(self.list_users, 'iam_users', max_items=page_size)
+
     @Log.trace_method(Log.DEBUG)
     async def delete_user(self, user_name) -> Union[bool, IamError]:
         """
@@ -701,6 +784,17 @@ class IamClient(BaseClient):
 
             return resp
 
+    def iter_user_access_keys(self, user_name=None, page_size=None):
+        """
+        Iterates over all the access keys of IAM user, page by page.
+
+        :param user_name: IAM user name, if None, user is deduced from the current session
+        :param page_size: maximum number of access keys fetched by one request
+        :returns: async iterator of IamAccessKeyMetadata, an IamError is the last item on failure
+        """
+        return self._iter_pages(self.list_user_access_keys, 'access_keys',
+                                user_name=user_name, max_items=page_size)
+
     async def delete_user_access_key(self, access_key_id, user_name=None) -> Union[bool, IamError]:
         """
         Deletes an access key for IAM user.
@@ -726,6 +820,63 @@ class IamClient(BaseClient):
             return True
 
 
+class ThreadLocalS3Resource:
+    """
+    boto3 S3 resource created per thread.
+
+    boto3 resources and sessions are not thread-safe, so the executor threads
+    running the calls of one S3Client each get their own resource created with
+    the same parameters. Every thread keeps one boto3 session the resources of
+    all the clients are created from. Attributes are looked up on the resource
+    of the calling thread.
+    """
+
+    # boto3 session of every thread, shared by all the clients
+    _sessions = threading.local()
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._resources = []
+
+    @classmethod
+    def _get_session(cls):
+        session = getattr(cls._sessions, 'session', None)
+        if session is None:
+            session = boto3.session.Session()
+            cls._sessions.session = session
+        return session
+
+    def _get_resource(self):
+        with self._lock:
+            local = self._local
+        resource = getattr(local, 'resource', None)
+        if resource is None:
+            resource = self._get_session().resource(service_name='s3', **self._kwargs)
+            local.resource = resource
+            with self._lock:
+                self._resources.append(resource)
+        return resource
+
+    def __getattr__(self, name):
+        return getattr(self._get_resource(), name)
+
+    def close(self):
+        """
+        Close the connections kept alive by the resources of all the threads
+        and release the resources.
+        """
+        with self._lock:
+            resources, self._resources = self._resources, []
+            # The threads keep the resources as long as the thread-local lives
+            self._local = threading.local()
+        for resource in resources:
+            close = getattr(resource.meta.client, 'close', None)
+            if close is not None:
+                close()
+
+
 class S3Client(BaseClient):
     """
     Class represents S3 server connection that manages buckets
@@ -737,11 +888,10 @@ class S3Client(BaseClient):
         is_secure = kwargs.get('is_secure', False)
         proto = 'https' if is_secure else 'http'
         url = f"{proto}://{kwargs.get('host', 'localhost')}:{kwargs.get('port', '80')}"
-        s3 = boto3.resource(service_name='s3', endpoint_url=url,
-                            aws_access_key_id=kwargs['aws_access_key_id'],
-                            aws_secret_access_key=kwargs['aws_secret_access_key'],
-                            aws_session_token=kwargs["security_token"])
-        return s3
+        return ThreadLocalS3Resource(endpoint_url=url,
+                                     aws_access_key_id=kwargs['aws_access_key_id'],
+                                     aws_secret_access_key=kwargs['aws_secret_access_key'],
+                                     aws_session_token=kwargs["security_token"])
 
     @Log.trace_method(Log.DEBUG)
     async def create_bucket(self, bucket_name):
@@ -751,9 +901,10 @@ class S3Client(BaseClient):
         :returns: S3.Bucket
         """
         Log.debug(f"create bucket: {bucket_name}")
-        return await self._loop.run_in_executor(self._executor,
-                                                partial(self.connection.create_bucket,
-                                                        Bucket=bucket_name))
+        if self._transport is not None:
+            return await self._transport.create_bucket(bucket_name)
+        # The resource is looked up in the executor thread that runs the call
+        return await self._run_async(lambda: self.connection.create_bucket(Bucket=bucket_name))
 
     @Log.trace_method(Log.DEBUG)
     async def get_bucket(self, bucket_name):
@@ -761,10 +912,14 @@ class S3Client(BaseClient):
         Checks if a bucket with a specified name exists and returns it
         """
         Log.debug(f"get bucket: {bucket_name}")
-        bucket = self.connection.Bucket(bucket_name)
         try:
-            coro = partial(self.connection.meta.client.head_bucket, Bucket=bucket_name)
-            await self._loop.run_in_executor(self._executor, coro)
+            if self._transport is not None:
+                await self._transport.head_bucket(bucket_name)
+                return S3Bucket(bucket_name)
+            def _run():
+                self.connection.meta.client.head_bucket(Bucket=bucket_name)
+                return self.connection.Bucket(bucket_name)
+            bucket = await self._run_async(_run)
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
                 bucket = None
@@ -776,21 +931,32 @@ class S3Client(BaseClient):
     @Log.trace_method(Log.DEBUG)
     async def delete_bucket(self, bucket_name: str):
         Log.debug(f"delete bucket: {bucket_name}")
-        bucket = await self._loop.run_in_executor(self._executor, self.connection.Bucket, bucket_name)
-        # Assume that the bucket is empty, if not, the error will be returned.
-        # It is user's responsibility to empty the bucket before the deletion.
-        await self._loop.run_in_executor(self._executor, bucket.delete)
+        if self._transport is not None:
+            return await self._transport.delete_bucket(bucket_name)
+        def _run():
+            # Assume that the bucket is empty, if not, the error will be returned.
+            # It is user's responsibility to empty the bucket before the deletion.
+            return self.connection.Bucket(bucket_name).delete()
+        await self._run_async(_run)
 
     @Log.trace_method(Log.DEBUG)
     async def get_all_buckets(self):
         Log.debug(f"Get all buckets ")
-        return await self._loop.run_in_executor(self._executor, self.connection.buckets.all)
+        if self._transport is not None:
+            return await self._transport.list_buckets()
+        return await self._run_async(lambda: self.connection.buckets.all())
 
     @Log.trace_method(Log.DEBUG)
     async def get_bucket_tagging(self, bucket_name: str):
         # When the tag_set is not available ClientError is raised
         # Need to avoid that in order to iterate over tags for all available buckets
         Log.debug(f"Get bucket tagging: {bucket_name}")
+        if self._transport is not None:
+            try:
+                return await self._transport.get_bucket_tagging(bucket_name)
+            except ClientError:
+                return {}
+
         def _run():
             try:
                 tagging = self.connection.BucketTagging(bucket_name)
@@ -798,11 +964,14 @@ class S3Client(BaseClient):
             except ClientError:
                 tag_set = {}
             return tag_set
-        return await self._loop.run_in_executor(self._executor, _run)
+        return await self._run_async(_run)
 
     @Log.trace_method(Log.DEBUG)
     async def put_bucket_tagging(self, bucket_name, tags: dict):
         Log.debug(f"Put bucket tagging: bucket_name:{bucket_name}, tags:{tags}")
+        if self._transport is not None:
+            return await self._transport.put_bucket_tagging(bucket_name, tags)
+
         def _run():
             tag_set = {
                 'TagSet': [
@@ -814,7 +983,7 @@ class S3Client(BaseClient):
             }
             tagging = self.connection.BucketTagging(bucket_name)
             return tagging.put(Tagging=tag_set)
-        return await self._loop.run_in_executor(self._executor, _run)
+        return await self._run_async(_run)
 
     @Log.trace_method(Log.DEBUG)
     async def get_bucket_policy(self, bucket_name: str):
@@ -826,11 +995,14 @@ class S3Client(BaseClient):
         :returns: A dict of bucket policy
         """
         Log.debug(f"Get bucket tagging: {bucket_name}")
+        if self._transport is not None:
+            return await self._transport.get_bucket_policy(bucket_name)
+
         def _run():
             bucket = self.connection.BucketPolicy(bucket_name)
             return json.loads(bucket.policy)
 
-        return await self._loop.run_in_executor(self._executor, _run)
+        return await self._run_async(_run)
 
     @Log.trace_method(Log.DEBUG)
     async def put_bucket_policy(self, bucket_name: str, policy: dict):
@@ -844,12 +1016,15 @@ class S3Client(BaseClient):
         :returns:
         """
         Log.debug(f"Put bucket tagging: bucket_name: {bucket_name}, policy: {policy}")
+        if self._transport is not None:
+            return await self._transport.put_bucket_policy(bucket_name, policy)
+
         def _run():
             bucket = self.connection.BucketPolicy(bucket_name)
             bucket_policy = json.dumps(policy)
             return bucket.put(Bucket=bucket_name, Policy=bucket_policy)
 
-        return await self._loop.run_in_executor(self._executor, _run)
+        return await self._run_async(_run)
 
     @Log.trace_method(Log.DEBUG)
     async def delete_bucket_policy(self, bucket_name: str):
@@ -862,10 +1037,93 @@ class S3Client(BaseClient):
         """
 
         Log.debug(f"Delete bucket tagging: {bucket_name}")
-        bucket = await self._loop.run_in_executor(self._executor,
-                                                  self.connection.BucketPolicy,
-                                                  bucket_name)
-        return await self._loop.run_in_executor(self._executor, bucket.delete)
+        if self._transport is not None:
+            return await self._transport.delete_bucket_policy(bucket_name)
+        def _run():
+            return self.connection.BucketPolicy(bucket_name).delete()
+        return await self._run_async(_run)
+
+
+class S3ClientPool:
+    """
+    Pool of IAM and S3 clients.
+
+    A client is kept per client class, endpoint and credentials, so its boto
+    connection and the HTTP connections it keeps alive are reused by the
+    following requests. All the clients share one bounded executor. Clients
+    that have not been used for idle_timeout seconds are closed, the least
+    recently used ones are closed when there are more than max_size clients.
+    An evicted client that still has boto calls running is closed after them.
+    If use_transport is set, the clients send their requests with
+    AioS3Transport on the event loop and the executor is left unused.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float, max_workers: int,
+                 use_transport=False, region=const.DEFAULT_S3_REGION):
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._use_transport = use_transport
+        self._region = region
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # key -> (client, time of last use), least recently used first
+        self._clients = OrderedDict()
+
+    @staticmethod
+    def _config_key(config: S3ConnectionConfig):
+        return (config.host, config.port, config.use_ssl, config.verify_ssl_cert,
+                config.ca_cert_file, config.max_retries_num)
+
+    def __len__(self):
+        return len(self._clients)
+
+    def get(self, cls, access_key, secret_key, config: S3ConnectionConfig,
+            session_token=None):
+        """
+        Get a pooled client, a new one is created if there is none.
+        :param cls: IamClient or S3Client
+        :returns: an instance of cls
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+        key = (cls, self._config_key(config), access_key, secret_key, session_token)
+        entry = self._clients.pop(key, None)
+        if entry is None:
+            transport = None
+            if self._use_transport:
+                transport = AioS3Transport(access_key, secret_key, config, session_token,
+                                           self._region)
+            client = cls(access_key, secret_key, config, asyncio.get_event_loop(),
+                         session_token, executor=self._executor, transport=transport)
+        else:
+            client = entry[0]
+        self._clients[key] = (client, now)
+        while len(self._clients) > self._max_size:
+            _, (lru_client, _) = self._clients.popitem(last=False)
+            self._close(lru_client)
+        return client
+
+    def evict(self, access_key):
+        """
+        Close the clients using the access key, e.g. when its session ends.
+        """
+        for key in [key for key in self._clients if key[2] == access_key]:
+            client, _ = self._clients.pop(key)
+            self._close(client)
+
+    def _evict_idle(self, now):
+        while self._clients:
+            key, (client, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self._idle_timeout:
+                break
+            del self._clients[key]
+            self._close(client)
+
+    @staticmethod
+    def _close(client):
+        try:
+            client.close_when_idle()
+        except Exception as e:
+            Log.warn(f"Failed to close S3 client connection: {e}")
 
 
 class S3Plugin:
@@ -896,9 +1154,35 @@ class S3Plugin:
     the get_temp_credentials function, e.g.
         creds = await s3plugin.get_temp_credentials('login', 'pwd', connection_config=config)
     """
+    # Clients are shared by all the plugin instances
+    _client_pool = None
+
     def __init__(self):
         Log.info('S3 plugin is loaded')
 
+    @classmethod
+    def _get_client_pool(cls) -> S3ClientPool:
+        if cls._client_pool is None:
+            cls._client_pool = S3ClientPool(
+                int(Conf.get(const.CSM_GLOBAL_INDEX, const.S3_CLIENT_POOL_SIZE,
+                             const.DEFAULT_S3_CLIENT_POOL_SIZE)),
+                float(Conf.get(const.CSM_GLOBAL_INDEX, const.S3_CLIENT_IDLE_TIMEOUT,
+                               const.DEFAULT_S3_CLIENT_IDLE_TIMEOUT)),
+                int(Conf.get(const.CSM_GLOBAL_INDEX, const.S3_CLIENT_WORKERS,
+                             const.DEFAULT_S3_CLIENT_WORKERS)),
+                Conf.get(const.CSM_GLOBAL_INDEX, const.S3_TRANSPORT,
+                         const.S3_TRANSPORT_AIOHTTP) == const.S3_TRANSPORT_AIOHTTP,
+                Conf.get(const.CSM_GLOBAL_INDEX, const.S3_REGION, const.DEFAULT_S3_REGION))
+        return cls._client_pool
+
+    @classmethod
+    def release_clients(cls, access_key):
+        """
+        Close the pooled clients of the access key, e.g. on logout.
+        """
+        if cls._client_pool is not None:
+            cls._client_pool.evict(access_key)
+
     @Log.trace_method(Log.DEBUG, exclude_args=['access_key','secret_key','session_token'])
     def get_iam_client(self, access_key, secret_key, connection_config=None, session_token=None) -> IamClient:
         """
@@ -907,8 +1191,8 @@ class S3Plugin:
         if not connection_config:
             raise CsmInternalError('Connection configuration must be provided')
 
-        return IamClient(access_key, secret_key, connection_config,
-                         asyncio.get_event_loop(), session_token)
+        return self._get_client_pool().get(IamClient, access_key, secret_key,
+                                           connection_config, session_token)
 
     @Log.trace_method(Log.DEBUG, exclude_args=['access_key','secret_key','session_token'])
     def get_s3_client(self, access_key, secret_key, connection_config=None, session_token=None) -> S3Client:
@@ -918,8 +1202,8 @@ class S3Plugin:
         if not connection_config:
             raise CsmInternalError('Connection configuration must be provided')
 
-        return S3Client(access_key, secret_key, connection_config,
-                        asyncio.get_event_loop(), session_token)
+        return self._get_client_pool().get(S3Client, access_key, secret_key,
+                                           connection_config, session_token)
 
 
     @Log.trace_method(Log.DEBUG, exclude_args=['password'])
@@ -936,7 +1220,7 @@ class S3Plugin:
         :returns: An instance of IamTempCredentials object
         """
         Log.debug(f"Get temp credentials: {account_name}, user_name:{user_name}")
-        iamcli = IamClient('', '', connection_config, asyncio.get_event_loop())
+        iamcli = self._get_client_pool().get(IamClient, '', '', connection_config)
         params = {
             'AccountName': account_name,
             'Password': password
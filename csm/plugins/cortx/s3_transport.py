@@ -0,0 +1,253 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import ssl
+import json
+import base64
+import asyncio
+import hashlib
+import xml.sax
+from urllib.parse import urlencode, quote
+from xml.etree.ElementTree import XMLPullParser
+from xml.sax.saxutils import escape
+
+import aiohttp
+from boto.jsonresponse import Element, XmlHandler
+from botocore.auth import SigV4Auth, S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+from cortx.utils.log import Log
+
+IAM_API_VERSION = '2010-05-08'
+S3_NAMESPACE = 'http://s3.amazonaws.com/doc/2006-03-01/'
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class S3Bucket:
+    """
+    Bucket as returned by AioS3Transport, the counterpart of the boto3 Bucket
+    resource attributes used by CSM.
+    """
+
+    def __init__(self, name, creation_date=None):
+        self.name = name
+        self.creation_date = creation_date
+
+
+class AioS3Transport:
+    """
+    Sends IAM Query API and S3 bucket requests with aiohttp on the event loop
+    instead of running blocking boto calls in an executor.
+    Requests are signed with AWS Signature Version 4 and the XML responses
+    are parsed while they are received. The HTTP connections are kept alive
+    in a session shared by all the transports of the event loop.
+    """
+
+    # Event loop -> aiohttp.ClientSession
+    _sessions = {}
+    connection_limit = 100
+
+    def __init__(self, access_key, secret_key, config, session_token=None,
+                 region='us-east-1'):
+        proto = 'https' if config.use_ssl else 'http'
+        self._host = f'{config.host}:{config.port}' if config.port else config.host
+        self._endpoint = f'{proto}://{self._host}'
+        self._credentials = Credentials(access_key or '', secret_key or '', session_token)
+        self._region = region
+        self._ssl = None
+        if config.use_ssl:
+            self._ssl = ssl.create_default_context(cafile=config.ca_cert_file)
+            if not config.verify_ssl_cert:
+                self._ssl.check_hostname = False
+                self._ssl.verify_mode = ssl.CERT_NONE
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_event_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            for closed_loop in [l for l in cls._sessions if l.is_closed()]:
+                del cls._sessions[closed_loop]
+            connector = aiohttp.TCPConnector(limit=cls.connection_limit)
+            session = aiohttp.ClientSession(connector=connector)
+            cls._sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close_sessions(cls):
+        """
+        Close the HTTP sessions, e.g. on shutdown.
+        """
+        sessions, cls._sessions = cls._sessions, {}
+        for session in sessions.values():
+            await session.close()
+
+    def _sign(self, service, method, url, headers, body):
+        request = AWSRequest(method=method, url=url, data=body, headers=headers)
+        auth_cls = S3SigV4Auth if service == 's3' else SigV4Auth
+        auth_cls(self._credentials, service, self._region).add_auth(request)
+        return dict(request.headers.items())
+
+    async def _request(self, service, method, path, query='', headers=None, body=b''):
+        url = f'{self._endpoint}{path}'
+        if query:
+            url = f'{url}?{query}'
+        headers = dict(headers or {})
+        headers['Host'] = self._host
+        signed_headers = self._sign(service, method, url, headers, body)
+        return await self._get_session().request(
+            method, url, headers=signed_headers, data=body or None,
+            ssl=self._ssl, skip_auto_headers=('Content-Type',))
+
+    @staticmethod
+    async def _parse_query_response(response, list_marker=None) -> dict:
+        """
+        Parse the XML response of the Query API as BaseClient._parse_body.
+        """
+        element = Element(list_marker=list_marker or 'Set', pythonize_name=False)
+        parser = xml.sax.make_parser()
+        parser.setContentHandler(XmlHandler(element, None))
+        empty = True
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            if chunk:
+                parser.feed(chunk)
+                empty = False
+        if empty:
+            return {}
+        parser.close()
+        return element
+
+    async def query(self, action, params, path, verb, list_marker=None):
+        """
+        IAM Query API request.
+        :returns: HTTP status and parsed response body
+        """
+        params = dict(params, Action=action, Version=IAM_API_VERSION)
+        headers = {}
+        query, body = '', b''
+        if verb == 'POST':
+            headers['Content-Type'] = 'application/x-www-form-urlencoded; charset=UTF-8'
+            body = urlencode(params).encode('utf-8')
+        else:
+            query = urlencode(params)
+        async with await self._request('iam', verb, path, query, headers, body) as response:
+            Log.debug(f'{self._host} responded with {response.status} status')
+            return (response.status, await self._parse_query_response(response, list_marker))
+
+    @staticmethod
+    def _local_name(tag):
+        return tag.rsplit('}', 1)[-1]
+
+    async def _iter_xml(self, response):
+        """
+        Parse the XML response while it is received.
+        :returns: async iterator of (local tag name, text) of the closed elements
+        """
+        parser = XMLPullParser(events=('end',))
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                yield self._local_name(element.tag), element.text
+        parser.close()
+        for _, element in parser.read_events():
+            yield self._local_name(element.tag), element.text
+
+    async def _raise_error(self, response, operation):
+        error = {'Code': str(response.status), 'Message': response.reason}
+        if response.method != 'HEAD':
+            async for tag, text in self._iter_xml(response):
+                if tag in ('Code', 'Message'):
+                    error[tag] = text
+        raise ClientError({
+            'Error': error,
+            'ResponseMetadata': {'HTTPStatusCode': response.status}
+        }, operation)
+
+    async def _s3_request(self, operation, method, bucket_name='', query='',
+                          headers=None, body=b''):
+        path = f'/{quote(bucket_name)}' if bucket_name else '/'
+        response = await self._request('s3', method, path, query, headers, body)
+        if response.status >= 300:
+            async with response:
+                await self._raise_error(response, operation)
+        return response
+
+    async def list_buckets(self):
+        buckets = []
+        name = None
+        async with await self._s3_request('ListBuckets', 'GET') as response:
+            async for tag, text in self._iter_xml(response):
+                if tag == 'Name':
+                    name = text
+                elif tag == 'CreationDate':
+                    creation_date = text
+                elif tag == 'Bucket':
+                    buckets.append(S3Bucket(name, creation_date))
+        return buckets
+
+    async def create_bucket(self, bucket_name):
+        response = await self._s3_request('CreateBucket', 'PUT', bucket_name)
+        response.release()
+        return S3Bucket(bucket_name)
+
+    async def head_bucket(self, bucket_name):
+        response = await self._s3_request('HeadBucket', 'HEAD', bucket_name)
+        response.release()
+
+    async def delete_bucket(self, bucket_name):
+        response = await self._s3_request('DeleteBucket', 'DELETE', bucket_name)
+        response.release()
+
+    async def get_bucket_tagging(self, bucket_name):
+        tags = {}
+        key = None
+        async with await self._s3_request('GetBucketTagging', 'GET', bucket_name,
+                                          'tagging') as response:
+            async for tag, text in self._iter_xml(response):
+                if tag == 'Key':
+                    key = text
+                elif tag == 'Value':
+                    tags[key] = text or ''
+        return tags
+
+    async def put_bucket_tagging(self, bucket_name, tags: dict):
+        tag_set = ''.join(f'<Tag><Key>{escape(str(key))}</Key><Value>{escape(str(value))}</Value></Tag>'
+                          for key, value in tags.items())
+        body = (f'<Tagging xmlns="{S3_NAMESPACE}"><TagSet>{tag_set}</TagSet></Tagging>'
+                .encode('utf-8'))
+        headers = {'Content-MD5': base64.b64encode(hashlib.md5(body).digest()).decode()}
+        response = await self._s3_request('PutBucketTagging', 'PUT', bucket_name,
+                                          'tagging', headers, body)
+        response.release()
+        return {'ResponseMetadata': {'HTTPStatusCode': response.status}}
+
+    async def get_bucket_policy(self, bucket_name):
+        async with await self._s3_request('GetBucketPolicy', 'GET', bucket_name,
+                                          'policy') as response:
+            return json.loads(await response.read())
+
+    async def put_bucket_policy(self, bucket_name, policy: dict):
+        body = json.dumps(policy).encode('utf-8')
+        response = await self._s3_request('PutBucketPolicy', 'PUT', bucket_name,
+                                          'policy', None, body)
+        response.release()
+        return {'ResponseMetadata': {'HTTPStatusCode': response.status}}
+
+    async def delete_bucket_policy(self, bucket_name):
+        response = await self._s3_request('DeleteBucketPolicy', 'DELETE', bucket_name,
+                                          'policy')
+        response.release()
+        return {'ResponseMetadata': {'HTTPStatusCode': response.status}}
@@ -0,0 +1,136 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the throughput (messages/sec) of the SSPL to CSM alert conversion
+before and after precompiling the alert mapping table.
+
+Usage: benchmark.py [corpus.json] [number_of_rounds]
+The corpus is a JSON list of sensor messages as captured from the sensor
+queue, test/test_data/alert_input.json is used by default.
+"""
+
+import os
+import sys
+import json
+import time
+import timeit
+from unittest import mock
+from marshmallow import ValidationError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.common.payload import Payload, JsonMessage, Dict
+from csm.core.blogic import const
+from csm.plugins.cortx.alert import AlertPlugin, AlertSchemaValidator
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), '..', '..',
+                              'test', 'test_data', 'alert_input.json')
+MAPPING_TABLE = os.path.join(os.path.dirname(__file__), '..', '..',
+                             'schema', 'alert_mapping_table.json')
+NUMBER_OF_ROUNDS = 2000
+
+
+def legacy_convert(plugin, message):
+    """ Conversion as done before the mapping table was precompiled. """
+    msg_body = JsonMessage(message).load()
+    sub_body = msg_body.get(const.ALERT_MESSAGE, {}).get(const.ALERT_SENSOR_TYPE, {})
+    resource_type = sub_body.get("info", {}).get(const.ALERT_RESOURCE_TYPE, "")
+    module_type = resource_type.split(':')[-1]
+    input_alert_payload = Payload(JsonMessage(message))
+    csm_alert_payload = Payload(Dict(dict()))
+    input_alert_payload.convert(plugin.mapping_dict.get(const.COMMON), csm_alert_payload)
+    resource_mapping = plugin.mapping_dict.get(resource_type, "")
+    if resource_mapping:
+        input_alert_payload.convert(resource_mapping, csm_alert_payload)
+    csm_alert_payload.dump()
+    csm_schema = csm_alert_payload.load()
+    obj_extended_info = JsonMessage(csm_schema[const.ALERT_EXTENDED_INFO])
+    specific_info = csm_schema.get(const.ALERT_EXTENDED_INFO).get(const.SPECIFIC_INFO)
+    if module_type != const.IEM:
+        plugin._set_health_info(csm_schema, specific_info)
+    info = csm_schema.get(const.ALERT_EXTENDED_INFO).get(const.ALERT_INFO)
+    csm_schema[const.ALERT_NODE_ID] = info.get(const.ALERT_NODE_ID)
+    csm_schema[const.ALERT_RESOURCE_ID] = info.get(const.ALERT_RESOURCE_ID)
+    csm_schema[const.ALERT_MODULE_TYPE] = module_type
+    csm_schema[const.ALERT_MODULE_NAME] = resource_type
+    csm_schema[const.ALERT_CREATED_TIME] = int(csm_schema[const.ALERT_CREATED_TIME])
+    csm_schema[const.ALERT_UPDATED_TIME] = int(time.time())
+    csm_schema[const.ALERT_RESOLVED] = False
+    csm_schema[const.ALERT_ACKNOWLEDGED] = False
+    csm_schema[const.ALERT_COMMENT] = ""
+    csm_schema[const.SUPPORT_MESSAGE] = ""
+    csm_schema[const.ALERT_SENSOR_INFO] = '_'.join(
+        str(x) for x in csm_schema[const.ALERT_SENSOR_INFO].values()).replace(" ", "_")
+    if csm_schema.get(const.ALERT_EVENTS) is not None:
+        csm_schema[const.ALERT_EVENT_DETAILS] = []
+        obj_event_details = JsonMessage(csm_schema[const.ALERT_EVENT_DETAILS])
+        plugin._prepare_specific_info(csm_schema, specific_info)
+        csm_schema.pop(const.ALERT_EVENTS)
+        csm_schema[const.ALERT_EVENT_DETAILS] = \
+            obj_event_details.dump(csm_schema[const.ALERT_EVENT_DETAILS])
+    csm_schema[const.ALERT_EXTENDED_INFO] = \
+        obj_extended_info.dump(csm_schema[const.ALERT_EXTENDED_INFO])
+    return csm_schema
+
+
+def legacy_process(plugin, message):
+    JsonMessage(message).load()
+    alert = legacy_convert(plugin, message)
+    try:
+        AlertSchemaValidator().load(alert, unknown='EXCLUDE')
+    except ValidationError:
+        pass
+    return alert
+
+
+def compiled_process(plugin, message):
+    sensor_queue_msg = JsonMessage(message).load()
+    alert = plugin._convert_to_csm_schema(sensor_queue_msg)
+    try:
+        plugin.alert_validator.load(alert, unknown='EXCLUDE')
+    except ValidationError:
+        pass
+    return alert
+
+
+def run(corpus, rounds):
+    with open(corpus, 'r') as corpus_file:
+        messages = [json.dumps(message) for message in json.load(corpus_file)]
+    if not os.path.exists(const.ALERT_MAPPING_TABLE):
+        const.ALERT_MAPPING_TABLE = MAPPING_TABLE
+    # Only the conversion is measured, no connection to RMQ is needed.
+    with mock.patch('csm.plugins.cortx.alert.AmqpComm'):
+        plugin = AlertPlugin()
+
+    for message in messages:
+        expected = legacy_process(plugin, message)
+        actual = compiled_process(plugin, message)
+        expected.pop(const.ALERT_UPDATED_TIME)
+        actual.pop(const.ALERT_UPDATED_TIME)
+        assert expected == actual, f"Converted alerts differ for {message}"
+
+    total = len(messages) * rounds
+    for name, process in (("legacy", legacy_process), ("compiled", compiled_process)):
+        elapsed = timeit.timeit(lambda: [process(plugin, m) for m in messages],
+                                number=rounds)
+        print(f"{name:>10}: {total / elapsed:10.0f} messages/sec")
+
+
+if __name__ == '__main__':
+    corpus = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CORPUS
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else NUMBER_OF_ROUNDS
+    run(corpus, rounds)
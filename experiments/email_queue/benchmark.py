@@ -0,0 +1,143 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the throughput (messages/sec) of the email sender queue with a
+single worker and deep copied messages, as it was before, and with several
+workers sharing a pool of kept-alive connections.
+
+Usage: benchmark.py [number_of_messages] [server_latency_ms] [workers]
+The messages are sent to a local stub SMTP server that answers each
+message after server_latency_ms, like a remote relay would.
+"""
+
+import os
+import sys
+import copy
+import time
+import asyncio
+import threading
+import socketserver
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.common.email import SmtpServerConfiguration, EmailSender, EmailError
+from csm.core.email.email_queue import (EmailSenderQueue, chunk_generator,
+                                        EMAIL_BCC_BULK_LIMIT)
+
+NUMBER_OF_MESSAGES = 200
+SERVER_LATENCY_MS = 20
+WORKERS = 4
+RECIPIENTS = [f"user{i}@example.com" for i in range(2 * EMAIL_BCC_BULK_LIMIT)]
+
+
+class StubSmtpHandler(socketserver.StreamRequestHandler):
+    """ Minimal SMTP server session, every connection is served by its own thread """
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.reply('220 localhost stub')
+        for line in self.rfile:
+            command = line[:4].upper()
+            if command in (b'EHLO', b'HELO'):
+                self.reply('250 localhost')
+            elif command == b'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                for data in self.rfile:
+                    if data == b'.\r\n':
+                        break
+                time.sleep(self.server.latency)
+                self.server.messages += 1
+                self.reply('250 OK')
+            elif command == b'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class StubSmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self, latency):
+        super().__init__(('localhost', 0), StubSmtpHandler)
+        self.latency = latency
+        self.messages = 0
+
+
+class LegacyEmailSenderQueue(EmailSenderQueue):
+    """ Single worker and a deep copied message per chunk, as before """
+
+    async def enqueue_bulk_email(self, message, recipients, config):
+        for bcc_list in chunk_generator(recipients, EMAIL_BCC_BULK_LIMIT):
+            msg = copy.deepcopy(message)
+            msg['Bcc'] = ', '.join(bcc_list)
+            await self.enqueue_email(msg, config)
+
+    async def _worker(self):
+        email_client = None
+        while True:
+            message, _, config = await self.queue.get()
+            email_client = email_client or EmailSender(config)
+            try:
+                await email_client.send_message(message)
+            except EmailError:
+                pass
+            self.queue.task_done()
+
+
+async def measure(email_queue, config, count):
+    message = EmailSender.make_multipart("csm@example.com", None, "Alert notification",
+                                         "<html><body>" + "x" * 4096 + "</body></html>")
+    await email_queue.start_worker()
+    start = time.monotonic()
+    for _ in range(count // 2):
+        await email_queue.enqueue_bulk_email(message, RECIPIENTS, config)
+    await email_queue.join_worker()
+    elapsed = time.monotonic() - start
+    await email_queue.stop_worker()
+    return elapsed
+
+
+def run(count, latency_ms, workers):
+    server = StubSmtpServer(latency_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = SmtpServerConfiguration()
+    config.smtp_host = "localhost"
+    config.smtp_port = server.server_address[1]
+    config.smtp_login = None
+    config.smtp_use_ssl = False
+
+    loop = asyncio.get_event_loop()
+    # Log calls of the queue are not measured
+    with mock.patch('csm.core.email.email_queue.Log'):
+        for name, email_queue in (("legacy", LegacyEmailSenderQueue()),
+                                  ("pooled", EmailSenderQueue(workers=workers))):
+            server.messages = 0
+            elapsed = loop.run_until_complete(measure(email_queue, config, count))
+            assert server.messages == count, f"{server.messages} of {count} messages sent"
+            print(f"{name:>10}: {count / elapsed:10.1f} messages/sec")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_MESSAGES
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else SERVER_LATENCY_MS
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else WORKERS
+    run(count, latency_ms, workers)
@@ -0,0 +1,88 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the number of permission checks per second done by
+permission_middleware with the dictionary based PermissionSet and with
+the bitmask based one.
+
+Usage: benchmark.py [number_of_checks]
+The roles are taken from schema/roles.json.
+"""
+
+import os
+import sys
+import json
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.core.services.permissions import PermissionSet
+
+ROLES = os.path.join(os.path.dirname(__file__), '..', '..', 'schema', 'roles.json')
+NUMBER_OF_CHECKS = 200000
+
+
+class LegacyPermissionSet:
+    """ Permission set as stored before, a dictionary of sets. """
+
+    def __init__(self, items: dict = {}):
+        self._items = {
+            resource: set(actions)
+                for resource, actions in items.items()
+                    if len(actions) > 0
+        }
+
+    def __eq__(self, other):
+        return self._items == other._items
+
+    def __and__(self, other):
+        result = LegacyPermissionSet()
+        resources = set(self._items.keys()) & set(other._items.keys())
+        for resource in resources:
+            lhs_actions = self._items.get(resource, set())
+            rhs_actions = other._items.get(resource, set())
+            actions = lhs_actions & rhs_actions
+            if len(actions) > 0:
+                result._items[resource] = actions
+        return result
+
+
+def run(number):
+    with open(ROLES, 'r') as roles_file:
+        roles = json.load(roles_file)
+    granted = {}
+    for role in roles.values():
+        for resource, actions in role['permissions'].items():
+            granted.setdefault(resource, set()).update(actions)
+    required = [{resource: {action}} for resource, actions in granted.items()
+                for action in actions]
+
+    for name, cls in (("legacy", LegacyPermissionSet), ("bitmask", PermissionSet)):
+        user = cls(granted)
+        checks = [cls(permissions) for permissions in required]
+        if cls is PermissionSet:
+            check = lambda: [r.issubset(user) for r in checks]
+        else:
+            check = lambda: [(user & r) == r for r in checks]
+        assert all(check())
+        rounds = max(1, number // len(checks))
+        elapsed = timeit.timeit(check, number=rounds)
+        print(f"{name:>10}: {rounds * len(checks) / elapsed:12.0f} checks/sec")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_CHECKS)
@@ -0,0 +1,103 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the latency the unsupported endpoint check adds to every REST
+request before and after compiling the feature endpoint mapping and caching
+the feature support verdicts.
+
+Usage: benchmark.py [number_of_rounds] [db_latency_ms]
+The unsupported features database is replaced by a mock answering after
+db_latency_ms milliseconds (1 ms by default).
+"""
+
+import os
+import re
+import sys
+import time
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.common.payload import Json
+from csm.common.features import FeatureEndpointMap, FeatureSupportCache
+from csm.core.blogic import const
+from csm.core.agent.api import CsmRestApi
+
+MAPPING_SCHEMA = os.path.join(os.path.dirname(__file__), '..', '..',
+                              'schema', 'feature_endpoint_mapping.json')
+NUMBER_OF_ROUNDS = 200
+DB_LATENCY_MS = 1.0
+
+
+class MockFeaturesDB:
+    latency = DB_LATENCY_MS / 1000
+
+    async def is_feature_supported(self, component, feature):
+        await asyncio.sleep(self.latency)
+        return True
+
+
+async def legacy_check(request):
+    """ Check as done before the mapping was compiled and the verdicts cached. """
+    def getMatchingEndpoint(endpoint_map, path):
+        for key,value in endpoint_map.items():
+            map_re = f'^{key}$'.replace("*", r"[\w\d]*")
+            if re.search(rf"{map_re}", path):
+                return value
+
+    feature_endpoint_map = Json(MAPPING_SCHEMA).load()
+    endpoint = getMatchingEndpoint(feature_endpoint_map, request.path)
+    if endpoint:
+        unsupported_feature_instance = MockFeaturesDB()
+        for component in endpoint[const.DEPENDENT_ON]:
+            await unsupported_feature_instance.is_feature_supported(
+                component, endpoint[const.FEATURE_NAME])
+        await unsupported_feature_instance.is_feature_supported(
+            const.CSM_COMPONENT_NAME, endpoint[const.FEATURE_NAME])
+
+
+async def measure(check, requests, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for request in requests:
+            await check(request)
+    return (time.perf_counter() - start) / (rounds * len(requests))
+
+
+async def run(rounds):
+    feature_endpoint_map = Json(MAPPING_SCHEMA).load()
+    paths = [key.replace('*', 'id_1') for key in feature_endpoint_map]
+    paths += ['/api/v1/unknown', '/api/v1/csm/users']
+    requests = [SimpleNamespace(path=path) for path in paths]
+
+    CsmRestApi._feature_endpoints = FeatureEndpointMap(feature_endpoint_map)
+    CsmRestApi._feature_support = FeatureSupportCache(
+        const.DEFAULT_FEATURE_SUPPORT_CACHE_TTL, MockFeaturesDB())
+    for name, check in (("legacy", legacy_check),
+                        ("compiled", CsmRestApi.check_for_unsupported_endpoint)):
+        latency = await measure(check, requests, rounds)
+        print(f"{name:>10}: {latency * 1e6:10.1f} us/request")
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_ROUNDS
+    if len(sys.argv) > 2:
+        MockFeaturesDB.latency = float(sys.argv[2]) / 1000
+    with mock.patch('csm.core.agent.api.Log'), mock.patch('csm.common.features.Log'):
+        asyncio.get_event_loop().run_until_complete(run(rounds))
@@ -0,0 +1,127 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the latency and the number of TCP connections of IAM account
+listing and S3 bucket list/create/tagging calls with a new client per call
+(as done before) and with pooled clients.
+
+Usage: benchmark.py [number_of_calls]
+The calls are made against a stub IAM/S3 HTTP server started on localhost.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.core.data.models.s3 import S3ConnectionConfig
+from csm.plugins.cortx.s3 import S3Plugin, IamClient, S3Client
+
+NUMBER_OF_CALLS = 200
+
+LIST_ACCOUNTS = (b'<ListAccountsResponse><ListAccountsResult><Accounts/>'
+                 b'<IsTruncated>false</IsTruncated></ListAccountsResult></ListAccountsResponse>')
+LIST_BUCKETS = (b'<ListAllMyBucketsResult><Owner><ID>1</ID></Owner><Buckets>'
+                b'<Bucket><Name>bucket</Name><CreationDate>2020-01-01T00:00:00.000Z'
+                b'</CreationDate></Bucket></Buckets></ListAllMyBucketsResult>')
+TAGGING = (b'<Tagging><TagSet><Tag><Key>key</Key><Value>value</Value></Tag>'
+           b'</TagSet></Tagging>')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        StubHandler.connections += 1
+
+    def _reply(self, body=b''):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_GET(self):
+        self._reply(TAGGING if 'tagging' in self.path else LIST_BUCKETS)
+
+    def do_POST(self):
+        self._read_body()
+        self._reply(LIST_ACCOUNTS)
+
+    def do_PUT(self):
+        self._read_body()
+        self._reply()
+
+    def log_message(self, *args):
+        pass
+
+
+def legacy_client(cls, config):
+    """ A new client with its own executor, as done before. """
+    return cls('access_key', 'secret_key', config, asyncio.get_event_loop())
+
+
+def pooled_client(cls, config):
+    plugin = S3Plugin()
+    if cls is IamClient:
+        return plugin.get_iam_client('access_key', 'secret_key', config)
+    return plugin.get_s3_client('access_key', 'secret_key', config)
+
+
+CALLS = {
+    'list accounts': (IamClient, lambda c: c.list_accounts()),
+    'list buckets': (S3Client, lambda c: c.get_all_buckets()),
+    'create bucket': (S3Client, lambda c: c.create_bucket('bucket')),
+    'get tagging': (S3Client, lambda c: c.get_bucket_tagging('bucket')),
+}
+
+
+async def run(config, number):
+    for name, (cls, call) in CALLS.items():
+        for mode, get_client in (("new client", legacy_client), ("pooled", pooled_client)):
+            StubHandler.connections = 0
+            start = time.perf_counter()
+            for _ in range(number):
+                result = await call(get_client(cls, config))
+                if cls is S3Client and name == 'list buckets':
+                    list(result)
+            latency = (time.perf_counter() - start) / number
+            print(f"{name:>14} {mode:>10}: {latency * 1000:8.2f} ms/call, "
+                  f"{StubHandler.connections:5} connections")
+
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_CALLS
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = S3ConnectionConfig()
+    config.host = '127.0.0.1'
+    config.port = server.server_address[1]
+    with mock.patch('csm.plugins.cortx.s3.Log'), \
+            mock.patch('csm.plugins.cortx.s3.Conf.get', lambda index, key, default: default):
+        asyncio.get_event_loop().run_until_complete(run(config, number))
+    server.shutdown()
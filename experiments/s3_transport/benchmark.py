@@ -0,0 +1,127 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Compare the throughput (requests/sec) of IAM account listing and S3 bucket
+listing with boto run in the client executor and with the aiohttp transport,
+for 1, 16 and 128 concurrent callers.
+
+Usage: benchmark.py [number_of_requests]
+The requests are made against a mock IAM/S3 HTTP server started on localhost.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.core.data.models.s3 import S3ConnectionConfig
+from csm.plugins.cortx.s3 import S3ClientPool, IamClient, S3Client
+from csm.plugins.cortx.s3_transport import AioS3Transport
+
+NUMBER_OF_REQUESTS = 2000
+CONCURRENCY = (1, 16, 128)
+WORKERS = 16
+
+LIST_ACCOUNTS = (b'<ListAccountsResponse><ListAccountsResult><Accounts>'
+                 + b'<member><AccountName>account</AccountName><AccountId>1</AccountId>'
+                   b'<CanonicalId>1</CanonicalId><Email>a@b.c</Email></member>' * 20
+                 + b'</Accounts><IsTruncated>false</IsTruncated></ListAccountsResult>'
+                 b'</ListAccountsResponse>')
+LIST_BUCKETS = (b'<ListAllMyBucketsResult><Owner><ID>1</ID></Owner><Buckets>'
+                + b'<Bucket><Name>bucket</Name><CreationDate>2020-01-01T00:00:00.000Z'
+                b'</CreationDate></Bucket>' * 20
+                + b'</Buckets></ListAllMyBucketsResult>')
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _reply(self, body):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(LIST_BUCKETS)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply(LIST_ACCOUNTS)
+
+    def log_message(self, *args):
+        pass
+
+
+async def list_buckets(client):
+    # boto3 lists the buckets lazily
+    return list(await client.get_all_buckets())
+
+
+CALLS = {
+    'list accounts': (IamClient, lambda c: c.list_accounts()),
+    'list buckets': (S3Client, list_buckets),
+}
+
+
+async def measure(pool, cls, call, config, number, concurrency):
+    client = pool.get(cls, 'access_key', 'secret_key', config)
+    remaining = iter(range(number))
+
+    async def caller():
+        for _ in remaining:
+            await call(client)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return number / (time.perf_counter() - start)
+
+
+async def run(config, number):
+    pools = {
+        'boto': S3ClientPool(256, 300, WORKERS),
+        'aiohttp': S3ClientPool(256, 300, WORKERS, use_transport=True),
+    }
+    for name, (cls, call) in CALLS.items():
+        for concurrency in CONCURRENCY:
+            for transport, pool in pools.items():
+                # Warm up the connections
+                await measure(pool, cls, call, config, concurrency, concurrency)
+                rate = await measure(pool, cls, call, config, number, concurrency)
+                print(f"{name:>14} {concurrency:4} callers {transport:>8}: "
+                      f"{rate:8.0f} requests/sec")
+    await AioS3Transport.close_sessions()
+
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_REQUESTS
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+    server.request_queue_size = 256
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = S3ConnectionConfig()
+    config.host = '127.0.0.1'
+    config.port = server.server_address[1]
+    with mock.patch('csm.plugins.cortx.s3.Log'), \
+            mock.patch('csm.plugins.cortx.s3_transport.Log'):
+        asyncio.get_event_loop().run_until_complete(run(config, number))
+    server.shutdown()
@@ -0,0 +1,98 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+#!/usr/bin/env python3
+
+"""
+Measure the throughput of the in-memory session storage: session creation
+(login), authentication of a session, lookup of the sessions of a user and
+removal of the expired sessions.
+
+Usage: benchmark.py [number_of_sessions] [number_of_users]
+"""
+
+import os
+import sys
+import time
+import heapq
+import random
+import asyncio
+from datetime import timedelta
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.common.permission_names import Resource, Action
+from csm.core.services.permissions import PermissionSet
+from csm.core.services.sessions import (SessionManager, LoginService,
+                                        S3Credentials)
+
+NUMBER_OF_SESSIONS = 100000
+NUMBER_OF_USERS = 1000
+
+
+def report(name, count, elapsed):
+    print(f"{name:>20}: {count / elapsed:12.0f} ops/sec")
+
+
+async def run(number_of_sessions, number_of_users):
+    permissions = PermissionSet({Resource.ALERTS: {Action.LIST}})
+    session_manager = SessionManager()
+    login_service = LoginService(None, None, None, session_manager)
+    users = [f'user{i}' for i in range(number_of_users)]
+
+    start = time.perf_counter()
+    session_ids = []
+    for i in range(number_of_sessions):
+        credentials = S3Credentials(users[i % number_of_users], 'access', 'secret', 'token')
+        session = await session_manager.create(credentials, permissions)
+        session_ids.append(session.session_id)
+    report("login", number_of_sessions, time.perf_counter() - start)
+
+    random.shuffle(session_ids)
+    start = time.perf_counter()
+    for session_id in session_ids:
+        await login_service.auth_session(session_id)
+    report("auth", number_of_sessions, time.perf_counter() - start)
+
+    lookups = min(number_of_users, 1000)
+    start = time.perf_counter()
+    for user_id in users[:lookups]:
+        await login_service.get_temp_access_keys(user_id)
+    report("user lookup", lookups, time.perf_counter() - start)
+
+    sessions = await session_manager.get_all()
+    start = time.perf_counter()
+    for user_id in users[:lookups]:
+        [s for s in sessions if s.credentials.user_id.lower() == user_id.lower()]
+    report("user scan (before)", lookups, time.perf_counter() - start)
+
+    # Expire all the sessions
+    session_manager._expiry_interval = timedelta(seconds=-1)
+    for session in sessions:
+        session.expiry_time = session_manager.calc_expiry_time()
+    session_manager._stg._expiry_heap = [
+        (s.expiry_time, s.session_id) for s in sessions]
+    heapq.heapify(session_manager._stg._expiry_heap)
+    start = time.perf_counter()
+    await session_manager.delete_expired()
+    report("sweep", number_of_sessions, time.perf_counter() - start)
+    assert not await session_manager.get_all()
+
+
+if __name__ == '__main__':
+    number_of_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_SESSIONS
+    number_of_users = int(sys.argv[2]) if len(sys.argv) > 2 else NUMBER_OF_USERS
+    with mock.patch('csm.core.services.sessions.Log'):
+        asyncio.get_event_loop().run_until_complete(run(number_of_sessions, number_of_users))
@@ -0,0 +1,56 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import json
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, Const
+from csm.common.payload import Payload, PayloadMap, JsonMessage, Dict
+from csm.core.blogic import const
+
+
+def test_payload_map_get_set(args):
+    payload_map = PayloadMap({"a.b": "x.y", "a.c": "x", "missing.key": "z.w"})
+    assert_equal(payload_map.convert({"a": {"b": 1, "c": 2}}),
+                 {"x": 2, "z": {"w": None}})
+    assert_equal(payload_map.convert({"a": [1]}, {"x": {"y": 0}}),
+                 {"x": None, "z": {"w": None}})
+
+
+def test_payload_map_matches_payload_convert(args):
+    mapping = args['mapping']
+    for message in args['messages']:
+        resource_type = message["message"]["sensor_response_type"]["info"]["resource_type"]
+        expected = Payload(Dict(dict()))
+        input_payload = Payload(JsonMessage(json.dumps(message)))
+        input_payload.convert(mapping["common"], expected)
+        input_payload.convert(mapping[resource_type], expected)
+        actual = PayloadMap(mapping["common"], mapping[resource_type]).convert(message)
+        assert_equal(actual, expected.data())
+
+
+def init(args):
+    with open(const.ALERT_MAPPING_TABLE, 'r') as mapping_file:
+        args['mapping'] = json.load(mapping_file)
+    with open(os.path.join(Const.MOCK_PATH, 'alert_input.json'), 'r') as input_file:
+        args['messages'] = json.load(input_file)
+
+
+test_list = [
+    test_payload_map_get_set,
+    test_payload_map_matches_payload_convert,
+]
@@ -0,0 +1,132 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import json
+import asyncio
+from datetime import datetime
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.template import Template
+from csm.core.services.alerts import AlertEmailNotifier
+
+
+class MockEmailQueue:
+    def __init__(self):
+        self.emails = []
+
+    async def enqueue_bulk_email(self, message, recipients, smtp_config):
+        self.emails.append((message, recipients))
+
+
+class MockEmailConfig:
+    smtp_sender_email = 'csm@example.com'
+
+    def get_target_emails(self):
+        return ['admin@example.com']
+
+    def to_smtp_config(self):
+        return 'smtp'
+
+
+class MockConfigManager:
+    def __init__(self):
+        self.gets = 0
+
+    async def get_current_config(self):
+        self.gets += 1
+        return mock.Mock(notifications=mock.Mock(email=MockEmailConfig()))
+
+
+class MockUserManager:
+    async def get_list_alert_notification_emails(self):
+        return ['user@example.com']
+
+
+class MockAlert(dict):
+    def __init__(self, resource_id, severity):
+        super().__init__(
+            extended_info=json.dumps({"info": {"resource_id": resource_id}}),
+            severity=severity, module_type="disk", state="fault",
+            description=f"<{resource_id}> failed")
+        self.created_time = self.updated_time = datetime(2020, 1, 1)
+
+
+def make_notifier(digest_window):
+    template = Template('{resource_id}')
+    digest_template = Template('{alert_count}:{alert_sections}')
+    return AlertEmailNotifier(MockEmailQueue(), MockConfigManager(), template,
+                              MockUserManager(), digest_template=digest_template,
+                              digest_window=digest_window,
+                              immediate_severities=['critical'], config_ttl=60)
+
+
+def make_multipart(sender, recipient, subject, body):
+    return subject, body
+
+
+@async_test
+async def test_critical_alert_sent_immediately(args):
+    notifier = make_notifier(60)
+    with mock.patch('csm.core.services.alerts.EmailSender.make_multipart', make_multipart):
+        await notifier.handle_alert(MockAlert('disk-1', 'critical'))
+    assert_equal(len(notifier.email_sender_queue.emails), 1)
+    (subject, body), recipients = notifier.email_sender_queue.emails[0]
+    assert_equal(body, 'disk-1')
+    assert_equal(recipients, ['admin@example.com', 'user@example.com'])
+
+
+@async_test
+async def test_alerts_coalesced_into_digest(args):
+    notifier = make_notifier(0.01)
+    with mock.patch('csm.core.services.alerts.EmailSender.make_multipart', make_multipart):
+        for i in range(5):
+            await notifier.handle_alert(MockAlert(f'disk-{i}', 'warning' if i % 2 else 'error'))
+        assert_equal(notifier.email_sender_queue.emails, [])
+        await asyncio.sleep(0.05)
+    assert_equal(len(notifier.email_sender_queue.emails), 1)
+    (subject, body), _ = notifier.email_sender_queue.emails[0]
+    assert_equal(body.startswith('5:'), True)
+    assert_equal(body.index('error') < body.index('warning'), True)
+    assert_equal('&lt;disk-0&gt; failed' in body, True)
+    # The settings are read once for all the alerts
+    assert_equal(notifier.config_manager.gets, 1)
+
+
+@async_test
+async def test_settings_invalidated(args):
+    notifier = make_notifier(0)
+    with mock.patch('csm.core.services.alerts.EmailSender.make_multipart', make_multipart):
+        await notifier.handle_alert(MockAlert('disk-1', 'warning'))
+        await notifier.handle_alert(MockAlert('disk-2', 'warning'))
+        assert_equal(notifier.config_manager.gets, 1)
+        notifier.invalidate('config')
+        await notifier.handle_alert(MockAlert('disk-3', 'warning'))
+    assert_equal(notifier.config_manager.gets, 2)
+    assert_equal(len(notifier.email_sender_queue.emails), 3)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_critical_alert_sent_immediately,
+    test_alerts_coalesced_into_digest,
+    test_settings_invalidated,
+]
@@ -0,0 +1,189 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.test.alerts.test_alerts_batch import MockAlertRepository, MockHealthPlugin, \
+    make_alert, make_monitor
+from csm.common.comm import AmqpChannel, AmqpComm, RETRY_HEADER
+from csm.plugins.cortx.alert import AlertPlugin
+
+
+class SlowAlertRepository(MockAlertRepository):
+    async def retrieve_by_sensor_info_bulk(self, sensor_keys):
+        await asyncio.sleep(0.01)
+        self.bulk_gets += 1
+        return {(alert.sensor_info, alert.module_type): alert for alert in self.stored
+                if (alert.sensor_info, alert.module_type) in sensor_keys}
+
+    async def store_bulk(self, alerts):
+        await asyncio.sleep(0.01)
+        self.stored.extend(alerts)
+
+
+class MockAsyncChannel:
+    def __init__(self):
+        self.acknowledged = []
+        self.rejected = []
+        self.retried = []
+
+    def acknowledge(self, delivery_tag=None, multiple=False):
+        self.acknowledged.append(delivery_tag)
+
+    def reject(self, delivery_tag=None, multiple=False, requeue=True):
+        self.rejected.append((delivery_tag, requeue))
+
+    def retry(self, delivery_tag, body, properties, retries):
+        self.retried.append((delivery_tag, retries))
+
+
+def make_comm():
+    comm = AmqpComm.__new__(AmqpComm)
+    comm._asyncInChannel = MockAsyncChannel()
+    comm.REQUEUE_DELAY = 0
+    return comm
+
+
+@async_test
+async def test_consume_async_keeps_order(args):
+    repo = SlowAlertRepository()
+    monitor = make_monitor(repo, MockHealthPlugin())
+    results = await asyncio.gather(
+        monitor._consume_async(make_alert("1", "sensor_a", "missing")),
+        monitor._consume_async(make_alert("2", "sensor_b", "fault")),
+        monitor._consume_async(make_alert("3", "sensor_a", "insertion")))
+    assert_equal(results, [True, True, True])
+    assert_equal(repo.bulk_gets, 3)
+    assert_equal(repo.stored[-1].alert_uuid, "1")
+    assert_equal(repo.stored[-1].state, "insertion")
+    assert_equal(monitor._sensor_locks, {})
+
+
+@async_test
+async def test_consumer_tasks_acknowledge(args):
+    async def callback(body):
+        if body == b"error":
+            raise Exception("processing failed")
+        return body == b"ok"
+
+    comm = make_comm()
+    queue = asyncio.Queue()
+    for tag, body in enumerate([b"ok", b"nok", b"error", b"ok"], 1):
+        queue.put_nowait((tag, body, None))
+    consumers = [comm._consume_queue(queue, callback) for _ in range(2)]
+    for _ in consumers:
+        queue.put_nowait((None, None, None))
+    await asyncio.gather(*consumers)
+    assert_equal(sorted(comm._asyncInChannel.acknowledged), [1, 4])
+    # Failed processing is dropped, a failed store is returned to the queue
+    assert_equal(comm._asyncInChannel.rejected, [(3, False)])
+    assert_equal(comm._asyncInChannel.retried, [(2, 1)])
+
+
+@async_test
+async def test_requeues_are_capped(args):
+    async def callback(body):
+        return False
+
+    comm = make_comm()
+    queue = asyncio.Queue()
+    # Retries are counted per message, not per body
+    for tag, retries in enumerate([None, 0, AmqpComm.MAX_REQUEUES - 1,
+                                   AmqpComm.MAX_REQUEUES], 1):
+        headers = {RETRY_HEADER: retries} if retries is not None else None
+        queue.put_nowait((tag, b"not stored", SimpleNamespace(headers=headers)))
+    queue.put_nowait((None, None, None))
+    await comm._consume_queue(queue, callback)
+    assert_equal(comm._asyncInChannel.retried,
+                 [(1, 1), (2, 1), (3, AmqpComm.MAX_REQUEUES)])
+    assert_equal(comm._asyncInChannel.rejected, [(4, False)])
+
+
+@async_test
+async def test_bad_json_is_not_requeued(args):
+    plugin = AlertPlugin.__new__(AlertPlugin)
+    comm = make_comm()
+    queue = asyncio.Queue()
+    queue.put_nowait((1, b"{not json", None))
+    queue.put_nowait((2, b'{"title": "Actuator Response"}', None))
+    queue.put_nowait((None, None, None))
+    plugin.health_plugin = MockHealthPlugin()
+    plugin.health_plugin.health_plugin_callback = lambda message: False
+    await comm._consume_queue(queue, plugin._plugin_async_callback)
+    assert_equal(comm._asyncInChannel.acknowledged, [1, 2])
+    assert_equal((comm._asyncInChannel.rejected, comm._asyncInChannel.retried), ([], []))
+
+
+def test_retry_publishes_with_count(args):
+    channel = AmqpChannel.__new__(AmqpChannel)
+    channel._channel = mock.Mock()
+    channel.exchange_queue = "alerts"
+    channel.connection_exceptions = ()
+    properties = SimpleNamespace(headers={"source": "sspl"}, delivery_mode=2)
+    channel.retry(7, b"alert", properties, 2)
+    publish = channel._channel.basic_publish.call_args[1]
+    assert_equal((publish["exchange"], publish["routing_key"], publish["body"]),
+                 ("", "alerts", b"alert"))
+    assert_equal(publish["properties"].headers, {"source": "sspl", RETRY_HEADER: 2})
+    assert_equal(AmqpChannel.retries(publish["properties"]), 2)
+    channel._channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+
+def test_batch_settled_per_message(args):
+    plugin = AlertPlugin.__new__(AlertPlugin)
+    plugin.health_plugin = MockHealthPlugin()
+    plugin.decision_maker_service = None
+    plugin.monitor_callback = lambda alerts: False
+    plugin.alert_validator = mock.Mock()
+    plugin._convert_to_csm_schema = lambda message: message
+    comm = make_comm()
+    comm._inChannel = MockAsyncChannel()
+    comm.plugin_callback = plugin._plugin_batch_callback
+    comm._flush_timer = None
+    comm._batch = [
+        (1, b"{not json", None),
+        (2, b'{"title": "Sensor Response"}', None),
+        (3, b'{"title": "Sensor Response"}',
+         SimpleNamespace(headers={RETRY_HEADER: AmqpComm.MAX_REQUEUES})),
+    ]
+    comm._flush_batch()
+    channel = comm._inChannel
+    assert_equal((channel.acknowledged, channel.retried, channel.rejected),
+                 ([1], [(2, 1)], [(3, False)]))
+
+    plugin.monitor_callback = lambda alerts: True
+    comm._batch = [(4, b'{"title": "Sensor Response"}', None), (5, b"{not json", None)]
+    comm._flush_batch()
+    assert_equal(channel.acknowledged, [1, 5])
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_consume_async_keeps_order,
+    test_consumer_tasks_acknowledge,
+    test_requeues_are_capped,
+    test_bad_json_is_not_requeued,
+    test_retry_publishes_with_count,
+    test_batch_settled_per_message,
+]
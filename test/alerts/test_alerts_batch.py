@@ -0,0 +1,131 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.blogic.models.alerts import AlertModel
+from csm.core.services.alerts import AlertMonitorService
+
+
+class MockAlertRepository:
+    def __init__(self, prev_alerts=None):
+        self.index = None
+        self.prev_alerts = prev_alerts or {}
+        self.stored = []
+        self.history = []
+        self.bulk_gets = 0
+
+    async def retrieve_by_sensor_info_bulk(self, sensor_keys):
+        self.bulk_gets += 1
+        return {key: alert for key, alert in self.prev_alerts.items() if key in sensor_keys}
+
+    async def store_bulk(self, alerts):
+        self.stored.extend(alerts)
+
+    async def store_alerts_history_bulk(self, alerts):
+        self.history.extend(alerts)
+
+
+class MockHealthPlugin:
+    def __init__(self):
+        self.updates = []
+
+    def update_health_map_with_alert(self, alert):
+        self.updates.append(alert)
+
+
+class MockHttpNotifications:
+    async def handle_alert(self, alert):
+        pass
+
+
+def make_alert(alert_uuid, sensor_info, state, severity='warning'):
+    return {
+        "alert_uuid": alert_uuid,
+        "sensor_info": sensor_info,
+        "state": state,
+        "severity": severity,
+        "module_type": "disk",
+        "module_name": "enclosure:fru:disk",
+        "created_time": 1600000000,
+        "updated_time": 1600000000,
+        "resolved": False,
+        "acknowledged": False,
+        "extended_info": "{}"
+    }
+
+
+def make_monitor(repo, health_plugin):
+    return AlertMonitorService(repo, None, health_plugin, MockHttpNotifications())
+
+
+@async_test
+async def test_batch_keeps_latest_state(args):
+    repo = MockAlertRepository()
+    health_plugin = MockHealthPlugin()
+    monitor = make_monitor(repo, health_plugin)
+    await monitor._process_batch([
+        make_alert("1", "sensor_a", "missing"),
+        make_alert("2", "sensor_a", "insertion"),
+        make_alert("3", "sensor_b", "fault"),
+    ])
+    assert_equal(repo.bulk_gets, 1)
+    assert_equal(len(repo.stored), 2)
+    assert_equal(len(repo.history), 3)
+    stored = {alert.sensor_info: alert for alert in repo.stored}
+    assert_equal(stored["sensor_a"].alert_uuid, "1")
+    assert_equal(stored["sensor_a"].state, "insertion")
+    assert_equal(stored["sensor_a"].resolved, True)
+    assert_equal(stored["sensor_b"].state, "fault")
+    assert_equal(len(health_plugin.updates), 2)
+
+
+@async_test
+async def test_batch_resolves_previous_alert(args):
+    prev_alert = AlertModel(make_alert("prev", "sensor_a", "fault"))
+    repo = MockAlertRepository({("sensor_a", "disk"): prev_alert})
+    monitor = make_monitor(repo, MockHealthPlugin())
+    await monitor._process_batch([make_alert("new", "sensor_a", "fault_resolved")])
+    assert_equal(len(repo.stored), 1)
+    assert_equal(repo.stored[0].alert_uuid, "prev")
+    assert_equal(repo.stored[0].resolved, True)
+    assert_equal(repo.stored[0].state, "fault_resolved")
+
+
+@async_test
+async def test_batch_duplicate_alert(args):
+    prev_alert = AlertModel(make_alert("prev", "sensor_a", "fault"))
+    prev_alert.acknowledged = True
+    repo = MockAlertRepository({("sensor_a", "disk"): prev_alert})
+    monitor = make_monitor(repo, MockHealthPlugin())
+    await monitor._process_batch([make_alert("new", "sensor_a", "fault", "critical")])
+    assert_equal(len(repo.stored), 1)
+    assert_equal(repo.stored[0].alert_uuid, "prev")
+    assert_equal(repo.stored[0].acknowledged, True)
+    assert_equal(repo.stored[0].severity, "critical")
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_batch_keeps_latest_state,
+    test_batch_resolves_previous_alert,
+    test_batch_duplicate_alert,
+]
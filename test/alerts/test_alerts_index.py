@@ -0,0 +1,124 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.blogic.models.alerts import AlertModel
+from csm.core.services.alerts import AlertRepository, OpenAlertsIndex
+
+
+class MockCollection:
+    def __init__(self, alerts):
+        self.alerts = alerts
+        self.gets = 0
+
+    async def get(self, query):
+        self.gets += 1
+        return list(self.alerts)
+
+    async def store(self, alert):
+        pass
+
+    async def update(self, filter, update_params):
+        pass
+
+
+class MockDB:
+    def __init__(self, alerts):
+        self.collection = MockCollection(alerts)
+
+    def __call__(self, model):
+        return self.collection
+
+
+def make_alert(alert_uuid, sensor_info, state="fault", resolved=False, acknowledged=False):
+    return AlertModel({
+        "alert_uuid": alert_uuid,
+        "sensor_info": sensor_info,
+        "module_type": "disk",
+        "state": state,
+        "resolved": resolved,
+        "acknowledged": acknowledged,
+        "created_time": 1600000000,
+        "updated_time": 1600000000
+    })
+
+
+def test_index_lru_eviction(args):
+    index = OpenAlertsIndex(2)
+    index.warm_up([make_alert("1", "a"), make_alert("2", "b")])
+    found, _ = index.lookup("c", "disk")
+    assert_equal(found, False)
+    index.lookup("a", "disk")
+    index.put(make_alert("3", "c"))
+    assert_equal(len(index), 2)
+    found, alert = index.lookup("a", "disk")
+    assert_equal((found, alert.alert_uuid), (True, "1"))
+    found, _ = index.lookup("b", "disk")
+    assert_equal(found, False)
+    assert_equal(index.stats()["hits"], 2)
+
+
+def test_index_complete_after_warm_up(args):
+    index = OpenAlertsIndex(10)
+    index.warm_up([make_alert("1", "a")])
+    assert_equal(index.lookup("b", "disk"), (True, None))
+    index.put(make_alert("1", "a", resolved=True, acknowledged=True))
+    assert_equal(index.lookup("a", "disk"), (True, None))
+
+
+def test_index_incomplete_with_duplicate_rows(args):
+    # A full page of rows, but only two sensors: more open alerts may remain
+    index = OpenAlertsIndex(3)
+    index.warm_up([make_alert("1", "a"), make_alert("2", "a"), make_alert("3", "b")])
+    assert_equal(len(index), 2)
+    assert_equal(index.lookup("c", "disk"), (False, None))
+    found, alert = index.lookup("a", "disk")
+    assert_equal((found, alert.alert_uuid), (True, "1"))
+
+
+@async_test
+async def test_repository_uses_index(args):
+    db = MockDB([make_alert("1", "a")])
+    repo = AlertRepository(db, 10)
+    await repo.warm_up_index()
+    alert = await repo.retrieve_by_sensor_info("a", "disk")
+    assert_equal(alert.alert_uuid, "1")
+    assert_equal(await repo.retrieve_by_sensor_info("b", "disk"), None)
+    assert_equal(db.collection.gets, 1)
+
+    await repo.update_by_sensor_info("a", "disk", {"state": "fault_resolved",
+                                                    "resolved": True})
+    alert = await repo.retrieve_by_sensor_info("a", "disk")
+    assert_equal((alert.state, alert.resolved), ("fault_resolved", True))
+    alert.acknowledged = True
+    await repo.update(alert)
+    assert_equal(await repo.retrieve_by_sensor_info("a", "disk"), None)
+    assert_equal(db.collection.gets, 1)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_index_lru_eviction,
+    test_index_complete_after_warm_up,
+    test_index_incomplete_with_duplicate_rows,
+    test_repository_uses_index,
+]
@@ -0,0 +1,120 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.data.models.users import User
+from csm.core.services.users import UserManager
+
+
+class MockCompare:
+    def __init__(self, field, op, value):
+        self.value = value
+
+
+class MockQuery:
+    def __init__(self):
+        self.condition = None
+
+    def filter_by(self, condition):
+        self.condition = condition
+        return self
+
+
+class MockStorage:
+    def __init__(self, users):
+        self.users = {user.user_id: user for user in users}
+        self.gets = 0
+        self.scans = 0
+
+    async def get(self, query):
+        self.gets += 1
+        if query.condition is None:
+            self.scans += 1
+            return list(self.users.values())
+        return [user for user in self.users.values()
+                if user.user_id_lower == query.condition.value]
+
+    async def store(self, user):
+        self.users[user.user_id] = user
+        return user
+
+    async def delete(self, condition):
+        self.users.pop(condition.value, None)
+
+    def __call__(self, model):
+        return self
+
+
+@async_test
+async def test_user_lookup(args):
+    legacy = User.instantiate_s3_account_user('Legacy')
+    legacy.user_id_lower = None
+    storage = MockStorage([legacy, User.instantiate_s3_account_user('s3user')])
+    manager = UserManager(storage, 300)
+    with mock.patch('csm.core.services.users.Query', MockQuery), \
+            mock.patch('csm.core.services.users.Compare', MockCompare):
+        assert_equal((await manager.get('LEGACY')).user_id, 'Legacy')
+        assert_equal((await manager.get('S3User')).user_id, 's3user')
+        assert_equal(await manager.get('unknown'), None)
+        # One scan to store user_id_lower of the legacy record, then keyed lookups
+        assert_equal((storage.scans, storage.gets), (1, 4))
+
+        await manager.get('legacy')
+        await manager.get('s3USER')
+        assert_equal(storage.gets, 4)
+
+        user = await manager.get('s3user')
+        user.email = 's3user@seagate.com'
+        # The cached user is changed only when the user is saved
+        assert_equal((await manager.get('s3user')).email, '')
+        await manager.save(user)
+        await manager.delete('Legacy')
+        assert_equal(await manager.get('legacy'), None)
+        assert_equal((await manager.get('S3USER')).email, 's3user@seagate.com')
+        assert_equal(storage.gets, 5)
+
+
+@async_test
+async def test_get_during_delete(args):
+    storage = MockStorage([User.instantiate_s3_account_user('s3user')])
+    manager = UserManager(storage, 300)
+    delete = storage.delete
+
+    async def _delete(condition):
+        # A lookup served by the database before the record is gone
+        await manager.get('s3user')
+        await delete(condition)
+
+    storage.delete = _delete
+    with mock.patch('csm.core.services.users.Query', MockQuery), \
+            mock.patch('csm.core.services.users.Compare', MockCompare):
+        await manager.get('s3user')
+        await manager.delete('s3user')
+        assert_equal(await manager.get('s3user'), None)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_user_lookup,
+    test_get_during_delete,
+]
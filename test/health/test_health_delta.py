@@ -0,0 +1,73 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import copy
+import json
+import asyncio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test, Const
+from csm.core.blogic import const
+from csm.core.blogic.models.alerts import AlertModel
+from csm.core.services.health import HealthDeltaStream
+from csm.test.health.test_health_index import make_service, fan_alert, NODES_PATH, NODE_2
+
+health_schema = None
+
+
+@async_test
+async def test_changes_coalesced(args):
+    service = make_service(copy.deepcopy(health_schema))
+    stream = HealthDeltaStream(service._health_index, 0.01)
+    service.delta_stream = stream
+    deltas = []
+    stream.add_listener(deltas.append)
+
+    service.update_health_map(fan_alert("Fault", "warning"))
+    service.update_health_map(fan_alert("Fault", "critical"))
+    stream.alert_changed(AlertModel({"alert_uuid": "1", "severity": "critical",
+                                     "state": "fault", "resolved": False,
+                                     "acknowledged": False}))
+    assert_equal(deltas, [])
+    await asyncio.sleep(0.05)
+
+    assert_equal(len(deltas), 1)
+    delta = deltas[0]
+    assert_equal(delta["seq"], 1)
+    fan_path, fan = service._health_index.find("node:fru:fan-FAN1", NODES_PATH + (NODE_2,))
+    assert_equal(delta["resources"], {'.'.join(fan_path): fan})
+    assert_equal(delta["summary"][""], service._health_index.summary())
+    node_path = '.'.join(NODES_PATH + (NODE_2,))
+    assert_equal(delta["summary"][node_path][const.CRITICAL], 1)
+    assert_equal([alert[const.ALERT_UUID] for alert in delta["alerts"]], ["1"])
+    assert_equal(stream.snapshot()["seq"], 1)
+
+    service.update_health_map(fan_alert("OK", "informational"))
+    await asyncio.sleep(0.05)
+    assert_equal([delta["seq"] for delta in deltas], [1, 2])
+    assert_equal(deltas[1]["summary"][node_path][const.CRITICAL], 0)
+
+
+def init(args):
+    global health_schema
+    with open(os.path.join(Const.MOCK_PATH, 'health_schema.json'), 'r') as schema_file:
+        health_schema = json.load(schema_file)
+
+
+test_list = [
+    test_changes_coalesced,
+]
@@ -0,0 +1,162 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import copy
+import json
+import threading
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, Const
+from csm.common.payload import Payload, Dict
+from csm.core.blogic import const
+from csm.core.services.health import HealthAppService, HealthRepository, HealthSchemaIndex
+
+NODES_PATH = ('cluster', 'sites', '1', 'rack', '1', 'nodes')
+NODE_1 = 'node:ssc-vm-c-115.colo.seagate.com'
+NODE_2 = 'node:ssc-vm-c-116.colo.seagate.com'
+FAN = 'node:fru:fan-FAN1'
+
+
+def make_service(health_schema):
+    with mock.patch.object(HealthAppService, '_create_node_hostname_map'), \
+            mock.patch.object(HealthAppService, '_init_health_schema'):
+        service = HealthAppService(HealthRepository(), None, None)
+    service.repo.health_schema = Payload(Dict(health_schema))
+    service._health_index.build(health_schema)
+    service._hostname_node_map = {"ssc-vm-c-116.colo.seagate.com":
+                                  "ssc-vm-c-116.colo.seagate.com"}
+    return service
+
+
+def test_index_find_in_scope(args):
+    index = HealthSchemaIndex()
+    index.build(args['health_schema'])
+    path, node = index.find(NODE_2)
+    assert_equal(path, NODES_PATH + (NODE_2,))
+    path, fan = index.find(FAN, path)
+    assert_equal(path, NODES_PATH + (NODE_2, 'hw', 'fru', 'fans', 'fans_info', FAN))
+    assert_equal(fan is node['hw']['fru']['fans']['fans_info'][FAN], True)
+    assert_equal(index.find(FAN, NODES_PATH + ('storage_encl',)), (None, None))
+
+
+def test_update_health_map(args):
+    service = make_service(args['health_schema'])
+    index = service._health_index
+    status = service.update_health_map({
+        const.NODE_RESPONSE: True,
+        const.RESOURCE_KEY: '.'.join(NODES_PATH),
+        const.ALERT_NODE_ID: "ssc-vm-c-116.colo.seagate.com",
+        const.HEALTH_ALERT_TYPE: "fault",
+        const.ALERT_SEVERITY: "critical",
+        const.ALERT_UUID: "1",
+        const.RESOURCE_LIST: [{const.KEY: FAN, const.ALERT_HEALTH: "Fault",
+                               const.ALERT_DURABLE_ID: "FAN1"}]
+    })
+    assert_equal(status, True)
+    _, fan = index.find(FAN, NODES_PATH + (NODE_2,))
+    assert_equal((fan[const.ALERT_HEALTH], fan[const.ALERT_SEVERITY]), ("Fault", "critical"))
+    _, fan = index.find(FAN, NODES_PATH + (NODE_1,))
+    assert_equal(fan[const.ALERT_SEVERITY] == "critical", False)
+
+
+def recount(service, key=None):
+    health_count_map = {}
+    leaf_nodes = []
+    service._get_leaf_node_health(service._get_schema(key), health_count_map, leaf_nodes, {})
+    return service._get_health_count(health_count_map, leaf_nodes)
+
+
+def fan_alert(health, severity):
+    return {
+        const.NODE_RESPONSE: True,
+        const.RESOURCE_KEY: '.'.join(NODES_PATH),
+        const.ALERT_NODE_ID: "ssc-vm-c-116.colo.seagate.com",
+        const.HEALTH_ALERT_TYPE: "fault",
+        const.ALERT_SEVERITY: severity,
+        const.ALERT_UUID: "1",
+        const.RESOURCE_LIST: [{const.KEY: FAN, const.ALERT_HEALTH: health,
+                               const.ALERT_DURABLE_ID: "FAN1"}]
+    }
+
+
+def test_health_rollups(args):
+    health_schema = copy.deepcopy(args['health_schema'])
+    service = make_service(health_schema)
+    index = service._health_index
+    assert_equal(index.summary(), recount(service))
+    assert_equal(index.summary(NODES_PATH + (NODE_2,)), recount(service, NODE_2))
+
+    for health, severity in (("Fault", "critical"), ("Fault", "warning"), ("OK", "informational")):
+        service.update_health_map(fan_alert(health, severity))
+        assert_equal(index.verify(health_schema), [])
+        assert_equal(index.summary(), recount(service))
+        assert_equal(index.summary(NODES_PATH + (NODE_2,)), recount(service, NODE_2))
+        assert_equal(index.summary(NODES_PATH + (NODE_1,)), recount(service, NODE_1))
+
+    node_summary = index.summary(NODES_PATH + (NODE_2,))
+    service.update_health_map(fan_alert("Fault", "critical"))
+    summary = index.summary(NODES_PATH + (NODE_2,))
+    assert_equal(summary[const.CRITICAL.lower()], node_summary[const.CRITICAL.lower()] + 1)
+    assert_equal(summary[const.TOTAL], node_summary[const.TOTAL])
+    node_health = service._get_node_health(NODE_2)
+    assert_equal(list(node_health.values())[0][const.HEALTH_SUMMARY], summary)
+
+    # Changes made behind the back of the index are caught by the recount.
+    _, fan = index.find(FAN, NODES_PATH + (NODE_2,))
+    fan[const.ALERT_HEALTH] = "OK"
+    assert_equal(NODES_PATH + (NODE_2,) in index.verify(health_schema), True)
+
+
+def test_concurrent_leaf_updates(args):
+    health_schema = copy.deepcopy(args['health_schema'])
+    index = HealthSchemaIndex()
+    index.build(health_schema)
+    leaves = [index.find(FAN, NODES_PATH + (node,)) for node in (NODE_1, NODE_2)]
+    states = [{const.ALERT_HEALTH: "Fault", const.ALERT_SEVERITY: "critical"},
+              {const.ALERT_HEALTH: "Fault", const.ALERT_SEVERITY: "warning"},
+              {const.ALERT_HEALTH: "OK", const.ALERT_SEVERITY: "informational"}]
+
+    def update():
+        for i in range(3000):
+            path, leaf = leaves[i % 2]
+            index.update_leaf(path, leaf, states[i % 3])
+
+    threads = [threading.Thread(target=update) for _ in range(4)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert_equal(index.verify(health_schema), [])
+
+
+def init(args):
+    with open(os.path.join(Const.MOCK_PATH, 'health_schema.json'), 'r') as schema_file:
+        args['health_schema'] = json.load(schema_file)
+
+
+test_list = [
+    test_index_find_in_scope,
+    test_update_health_map,
+    test_health_rollups,
+    test_concurrent_leaf_updates,
+]
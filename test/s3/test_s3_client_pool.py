@@ -0,0 +1,137 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.data.models.s3 import S3ConnectionConfig
+from csm.plugins.cortx.s3 import BaseClient, S3ClientPool, ThreadLocalS3Resource
+
+
+class MockClient:
+    def __init__(self, access_key, secret_key, config, loop, session_token, executor=None,
+                 transport=None):
+        self.access_key = access_key
+        self.executor = executor
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    close_when_idle = close
+
+
+class BlockingClient(BaseClient):
+    def _create_boto_connection(self, access_key, secret_key, config, session_token=None):
+        return mock.MagicMock()
+
+
+def make_config(host='localhost'):
+    config = S3ConnectionConfig()
+    config.host = host
+    config.port = 9080
+    return config
+
+
+def test_client_pool_reuse(args):
+    pool = S3ClientPool(10, 300, 4)
+    client = pool.get(MockClient, 'key1', 'secret1', make_config(), 'token1')
+    assert_equal(pool.get(MockClient, 'key1', 'secret1', make_config(), 'token1') is client, True)
+    assert_equal(pool.get(MockClient, 'key1', 'secret1', make_config(), 'token2') is client, False)
+    assert_equal(pool.get(MockClient, 'key1', 'secret1', make_config('s3'), 'token1') is client, False)
+    other = pool.get(MockClient, 'key2', 'secret2', make_config(), None)
+    assert_equal(other.executor is client.executor, True)
+    assert_equal(len(pool), 4)
+
+    pool.evict('key1')
+    assert_equal((len(pool), client.closed, other.closed), (1, True, False))
+
+
+def test_client_pool_eviction(args):
+    pool = S3ClientPool(2, 300, 4)
+    with mock.patch('csm.plugins.cortx.s3.time.monotonic', return_value=1000):
+        first = pool.get(MockClient, 'key1', 'secret', make_config())
+        second = pool.get(MockClient, 'key2', 'secret', make_config())
+        pool.get(MockClient, 'key1', 'secret', make_config())
+        pool.get(MockClient, 'key3', 'secret', make_config())
+    assert_equal((first.closed, second.closed), (False, True))
+
+    with mock.patch('csm.plugins.cortx.s3.time.monotonic', return_value=1400):
+        client = pool.get(MockClient, 'key1', 'secret', make_config())
+    assert_equal((first.closed, client is first, len(pool)), (True, False, 1))
+
+
+@async_test
+async def test_client_closed_after_running_call(args):
+    pool = S3ClientPool(1, 300, 4)
+    client = pool.get(BlockingClient, 'key1', 'secret', make_config())
+    started, release = threading.Event(), threading.Event()
+
+    def _call():
+        started.set()
+        release.wait(5)
+        return 'done'
+
+    call = asyncio.ensure_future(client._run_async(_call))
+    await asyncio.get_event_loop().run_in_executor(None, started.wait, 5)
+    pool.get(BlockingClient, 'key2', 'secret', make_config())
+    assert_equal(client.connection.close.called, False)
+    release.set()
+    assert_equal(await call, 'done')
+    assert_equal(client.connection.close.call_count, 1)
+
+
+def test_resource_per_thread(args):
+    with mock.patch('csm.plugins.cortx.s3.boto3.session.Session') as session, \
+            mock.patch.object(ThreadLocalS3Resource, '_sessions', threading.local()):
+        session.return_value.resource.side_effect = lambda **kwargs: mock.MagicMock()
+        resource = ThreadLocalS3Resource(endpoint_url='http://localhost:80')
+        other = ThreadLocalS3Resource(endpoint_url='http://localhost:80')
+        barrier = threading.Barrier(2)
+
+        def _bucket():
+            barrier.wait(5)
+            return resource.Bucket('bucket'), other.Bucket('bucket')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first, second = [f.result() for f in
+                             [executor.submit(_bucket), executor.submit(_bucket)]]
+        assert_equal(first[0] is second[0], False)
+        assert_equal(resource.Bucket('bucket') is resource.Bucket('bucket'), True)
+        # One session per thread for all the clients, one resource per client
+        # and thread: two executor threads and this one
+        assert_equal(session.call_count, 3)
+        assert_equal(session.return_value.resource.call_count, 5)
+        resource.close()
+        assert_equal(len(resource._resources), 0)
+        assert_equal(getattr(resource._local, 'resource', None), None)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_client_pool_reuse,
+    test_client_pool_eviction,
+    test_client_closed_after_running_call,
+    test_resource_per_thread,
+]
@@ -0,0 +1,191 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import json
+import asyncio
+from aiohttp import web, ClientSession, ClientPayloadError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.cache import TtlCache
+from csm.common.errors import CsmInternalError
+from csm.core.controllers.view import CsmView
+from csm.core.data.models.s3 import IamAccount, IamAccountListResponse, IamError
+from csm.core.services.s3.accounts import S3AccountService
+from csm.core.services.sessions import LocalCredentials
+from csm.plugins.cortx.s3 import IamClient
+
+
+def make_page(names, marker=None):
+    page = IamAccountListResponse()
+    page.iam_accounts = []
+    for name in names:
+        account = IamAccount()
+        account.account_name = name
+        account.account_email = f'{name}@seagate.com'
+        page.iam_accounts.append(account)
+    page.is_truncated = marker is not None
+    page.marker = marker
+    return page
+
+
+class MockIamClient(IamClient):
+    def __init__(self, pages, error=None):
+        self.pages = pages
+        self.error = error
+        self.requests = []
+
+    async def list_accounts(self, max_items=None, marker=None):
+        self.requests.append(marker)
+        await asyncio.sleep(0)
+        if marker in self.pages:
+            return self.pages[marker]
+        return self.error
+
+
+PAGES = {
+    None: make_page(['acc1', 'acc2'], 'm1'),
+    'm1': make_page(['acc3'], 'm2'),
+    'm2': make_page(['acc4']),
+}
+
+
+@async_test
+async def test_iter_pages(args):
+    client = MockIamClient(PAGES)
+    names = []
+    async for account in client.iter_accounts():
+        names.append(account.account_name)
+        if len(names) == 1:
+            await asyncio.sleep(0.01)
+            # The second page is fetched while the first one is consumed
+            assert_equal(client.requests, [None, 'm1'])
+    assert_equal(names, ['acc1', 'acc2', 'acc3', 'acc4'])
+
+    error = IamError()
+    client = MockIamClient({None: PAGES[None]}, error)
+    items = [item async for item in client.iter_accounts()]
+    assert_equal([len(items), items[-1] is error], [3, True])
+    assert_equal((await client.get_account('acc2')).account_name, 'acc2')
+
+
+@async_test
+async def test_account_listing_cache(args):
+    client = MockIamClient(PAGES)
+    service = S3AccountService.__new__(S3AccountService)
+    service._s3_root_client = client
+    service._listing_cache = TtlCache(10)
+    session = LocalCredentials('admin')
+    resp = await service.list_accounts(session)
+    assert_equal([acc['account_name'] for acc in resp['s3_accounts']],
+                 ['acc1', 'acc2', 'acc3', 'acc4'])
+    resp = await service.list_accounts(session, page_limit=2)
+    assert_equal(resp['continue'], 'm1')
+    await service.list_accounts(session)
+    await service.list_accounts(session, page_limit=2)
+    assert_equal(len(client.requests), 4)
+    service._listing_cache.invalidate()
+    await service.list_accounts(session, page_limit=2)
+    assert_equal(len(client.requests), 5)
+
+
+@async_test
+async def test_stream_json_list(args):
+    async def items():
+        for i in range(1000):
+            yield {'name': f'item{i}'}
+
+    async def handler(request):
+        return await CsmView(request).stream_json_list('items', items(),
+                                                       {'is_truncated': False}, 1024)
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    try:
+        async with ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{runner.addresses[0][1]}/') as resp:
+                chunked = resp.headers.get('Transfer-Encoding')
+                body = json.loads(await resp.read())
+    finally:
+        await runner.cleanup()
+    assert_equal(chunked, 'chunked')
+    assert_equal(body, {'items': [{'name': f'item{i}'} for i in range(1000)],
+                        'is_truncated': False})
+
+
+@async_test
+async def test_stream_failure_detectable(args):
+    async def items():
+        for i in range(1000):
+            yield {'name': f'item{i}'}
+        raise CsmInternalError('Listing failed')
+
+    async def chunks():
+        for i in range(100):
+            yield os.urandom(1024)
+        raise CsmInternalError('Download failed')
+
+    async def handler(request):
+        view = CsmView(request)
+        if request.query.get('bare'):
+            return await view.stream_json_list(None, items(), None, 1024)
+        if request.query.get('download'):
+            return await view.stream_attachment('file.bin', chunks())
+        return await view.stream_json_list('items', items(), {'is_truncated': False}, 1024)
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = f'http://127.0.0.1:{runner.addresses[0][1]}/'
+    try:
+        async with ClientSession() as session:
+            async with session.get(url) as resp:
+                body = json.loads(await resp.read())
+            async with session.get(url, params={'bare': '1'}) as resp:
+                bare = json.loads(await resp.read())
+            try:
+                async with session.get(url, params={'download': '1'}) as resp:
+                    await resp.read()
+                assert_equal(True, False)
+            except ClientPayloadError:
+                pass
+    finally:
+        await runner.cleanup()
+    assert_equal(len(body['items']), 1000)
+    assert_equal('is_truncated' in body, False)
+    assert_equal('Listing failed' in body['error']['message'], True)
+    assert_equal(len(bare), 1001)
+    assert_equal('Listing failed' in bare[-1]['error']['message'], True)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_iter_pages,
+    test_account_listing_cache,
+    test_stream_json_list,
+    test_stream_failure_detectable,
+]
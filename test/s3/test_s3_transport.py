@@ -0,0 +1,135 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+from aiohttp import web
+from botocore.exceptions import ClientError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.data.models.s3 import S3ConnectionConfig
+from csm.plugins.cortx.s3 import BaseClient
+from csm.plugins.cortx.s3_transport import AioS3Transport
+
+LIST_ACCOUNTS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ListAccountsResponse xmlns="https://iam.seagate.com/doc/2010-05-08/">
+<ListAccountsResult><Accounts>
+<member><AccountName>s3acc1</AccountName><AccountId>111</AccountId></member>
+<member><AccountName>s3acc2</AccountName><AccountId>222</AccountId></member>
+</Accounts><IsTruncated>false</IsTruncated></ListAccountsResult>
+<ResponseMetadata><RequestId>0000</RequestId></ResponseMetadata>
+</ListAccountsResponse>"""
+
+LIST_BUCKETS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ListAllMyBucketsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+<Owner><ID>1</ID><DisplayName>s3acc1</DisplayName></Owner><Buckets>
+<Bucket><Name>bucket1</Name><CreationDate>2020-10-01T10:00:00.000Z</CreationDate></Bucket>
+<Bucket><Name>bucket2</Name><CreationDate>2020-10-02T10:00:00.000Z</CreationDate></Bucket>
+</Buckets></ListAllMyBucketsResult>"""
+
+NO_TAG_SET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Error><Code>NoSuchTagSet</Code><Message>The TagSet does not exist</Message></Error>"""
+
+
+class MockEndpoint:
+    def __init__(self):
+        self.requests = []
+        self.app = web.Application()
+        self.app.router.add_route('*', '/{tail:.*}', self.handle)
+        self.runner = None
+
+    async def handle(self, request):
+        self.requests.append((request.method, request.path_qs,
+                              request.headers.get('Authorization', ''),
+                              await request.read()))
+        if request.path == '/' and request.method == 'POST':
+            return web.Response(body=LIST_ACCOUNTS, content_type='text/xml')
+        if request.path == '/' and request.method == 'GET':
+            return web.Response(body=LIST_BUCKETS, content_type='application/xml')
+        if request.method == 'HEAD':
+            return web.Response(status=404)
+        return web.Response(status=404, body=NO_TAG_SET, content_type='application/xml')
+
+    async def start(self):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        return self.runner.addresses[0][1]
+
+    async def stop(self):
+        await AioS3Transport.close_sessions()
+        await self.runner.cleanup()
+
+
+def make_transport(port):
+    config = S3ConnectionConfig()
+    config.host = '127.0.0.1'
+    config.port = port
+    config.use_ssl = False
+    return AioS3Transport('AKIDEXAMPLE', 'secret', config, 'token')
+
+
+@async_test
+async def test_iam_query(args):
+    endpoint = MockEndpoint()
+    transport = make_transport(await endpoint.start())
+    try:
+        status, body = await transport.query('ListAccounts', {'MaxItems': 10}, '/', 'POST')
+    finally:
+        await endpoint.stop()
+    method, _, authorization, form = endpoint.requests[0]
+    assert_equal(method, 'POST')
+    assert_equal(authorization.startswith(
+        'AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/'), True)
+    assert_equal(form, b'MaxItems=10&Action=ListAccounts&Version=2010-05-08')
+    assert_equal(status, 200)
+    assert_equal(body, BaseClient._parse_body(None, LIST_ACCOUNTS))
+
+
+@async_test
+async def test_bucket_requests(args):
+    endpoint = MockEndpoint()
+    transport = make_transport(await endpoint.start())
+    try:
+        buckets = await transport.list_buckets()
+        try:
+            await transport.head_bucket('missing')
+            head_error = None
+        except ClientError as e:
+            head_error = e.response['Error']['Code']
+        try:
+            await transport.get_bucket_tagging('bucket1')
+            tagging_error = None
+        except ClientError as e:
+            tagging_error = e.response['Error']['Code']
+    finally:
+        await endpoint.stop()
+    assert_equal([(b.name, b.creation_date) for b in buckets],
+                 [('bucket1', '2020-10-01T10:00:00.000Z'),
+                  ('bucket2', '2020-10-02T10:00:00.000Z')])
+    assert_equal((head_error, tagging_error), ('404', 'NoSuchTagSet'))
+    assert_equal(all(r[2].startswith('AWS4-HMAC-SHA256') for r in endpoint.requests), True)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_iam_query,
+    test_bucket_requests,
+]
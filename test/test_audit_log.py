@@ -14,13 +14,17 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import asyncio
+import gzip
+import random
 import sys
 import os
 import unittest
+from datetime import datetime, timedelta
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from csm.common.payload import Yaml
 from csm.core.blogic import const
 from csm.core.services.audit_log import AuditService, AuditLogManager
+from csm.core.blogic.models.audit_log import CsmAuditLogModel
 from csm.common.errors import CsmPermissionDenied
 from cortx.utils.data.db.db_provider import DataBaseProvider, GeneralConfig
 from csm.common.queries import DateTimeRange
@@ -34,20 +38,95 @@ class MockAuditManager():
     async def count_by_range(self, *args, **kwargs):
         return 0
 
+class MockPagedAuditManager():
+    """
+    Applies the range, order and limits of the queries to a list.
+    Like the database, every query returns the records sharing a timestamp
+    in a different order.
+    """
+
+    def __init__(self, logs):
+        self.logs = sorted(logs, key=lambda log: log.timestamp, reverse=True)
+        self.queries = 0
+        self._random = random.Random(0)
+
+    def _select(self, time_range, end_exclusive=False):
+        start, end = time_range.start, time_range.end
+        if not isinstance(start, datetime):
+            start = datetime.min
+        if not isinstance(end, datetime):
+            end = datetime.max
+        logs = [log for log in self.logs if start <= log.timestamp and
+                (log.timestamp < end if end_exclusive else log.timestamp <= end)]
+        return sorted(logs, key=lambda log: (log.timestamp, self._random.random()),
+                      reverse=True)
+
+    async def retrieve_by_range(self, component, limits, time_range, end_exclusive=False):
+        self.queries += 1
+        logs = self._select(time_range, end_exclusive)
+        return logs[limits.offset:limits.offset + limits.limit]
+
+    async def count_by_range(self, component, time_range):
+        return len(self._select(time_range))
+
+def make_logs(count):
+    start = datetime(2020, 2, 12)
+    # Three records share every timestamp, so pages end inside a timestamp
+    return [CsmAuditLogModel({"message": f"message {i}",
+                              "timestamp": start + timedelta(seconds=i // 3)})
+            for i in range(count)]
+
 def init(args):
     pass
 
+async def test_paged_audit_log_service():
+    logs = make_logs(50)
+    mock_mngr = MockPagedAuditManager(logs)
+    audit_service = AuditService(mock_mngr, page_size=4)
+    actual_value = [line async for line in
+                    audit_service.iter_by_range("csm", 1581490848, 1581922908)]
+    t.assertEqual(sorted(actual_value), sorted(log.message for log in logs))
+    timestamps = [int(message.split()[1]) // 3 for message in actual_value]
+    t.assertEqual(timestamps, sorted(timestamps, reverse=True))
+    # Every full page reads all the records of its last timestamp as well
+    t.assertEqual(mock_mngr.queries, 17)
+
+    actual_value = [line async for line in
+                    audit_service.iter_by_range("csm", 1581490848, 1581922908, 10)]
+    t.assertEqual(len(set(actual_value)), 10)
+    t.assertEqual([int(message.split()[1]) // 3 for message in actual_value],
+                  timestamps[:10])
+
+async def test_gzip_audit_log_service():
+    mock_mngr = MockPagedAuditManager(make_logs(1000))
+    audit_service = AuditService(mock_mngr, page_size=64)
+    chunks = [chunk async for chunk in audit_service.iter_audit_log_gzip(
+        "csm", 1581490848, 1581922908, chunk_size=1024)]
+    t.assertGreater(len(chunks), 1)
+    actual_value = gzip.decompress(b''.join(chunks)).decode('utf-8').splitlines()
+    expected_value = sorted(log.message for log in mock_mngr.logs)
+    t.assertEqual(sorted(actual_value), expected_value)
+
+    chunks = [chunk async for chunk in audit_service.iter_audit_log_gzip(
+        "csm", 1581490848, 1581922908)]
+    actual_value = gzip.decompress(b''.join(chunks)).decode('utf-8').splitlines()
+    t.assertEqual(sorted(actual_value), expected_value)
+
 async def test_show_audit_log_service():
     mock_mngr = MockAuditManager()
     audit_service = AuditService(mock_mngr)
-    actual_value = await audit_service.get_by_range("csm", 1581490848, 1581922908)
+    actual_value = [line async for line in
+                    audit_service.iter_by_range("csm", 1581490848, 1581922908)]
     expected_value = []
     t.assertEqual(actual_value, expected_value)
 
 async def test_download_audit_log_service():
     mock_mngr = MockAuditManager()
     audit_service = AuditService(mock_mngr)
-    actual_value = await audit_service.get_audit_log_zip("csm", 1581490848, 1581922908)
+    chunks = [chunk async for chunk in audit_service.iter_audit_log_gzip(
+        "csm", 1581490848, 1581922908)]
+    t.assertEqual(gzip.decompress(b''.join(chunks)), b'')
+    actual_value = audit_service.get_audit_log_gzip_name("csm", 1581490848, 1581922908)
     expected_value = "csm.12-02-2020.17-02-2020"
     t.assertIn(expected_value, actual_value)
 
@@ -62,6 +141,8 @@ def run_tests(args = {}):
     loop = asyncio.get_event_loop()
     loop.run_until_complete(test_show_audit_log_service())
     loop.run_until_complete(test_download_audit_log_service())
+    loop.run_until_complete(test_paged_audit_log_service())
+    loop.run_until_complete(test_gzip_audit_log_service())
     test_filename_service()
 
 test_list = [run_tests]
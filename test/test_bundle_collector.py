@@ -0,0 +1,89 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import time
+import shutil
+import tarfile
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.cli.support_bundle.bundle_generate import BundleCollector, ComponentsBundle
+
+BUNDLE_ID = "SB123"
+work_dir = None
+
+
+def make_command(name, script):
+    """ Bundle commands get the bundle id and the path as $1 and $2 """
+    path = os.path.join(work_dir, f"{name}.sh")
+    with open(path, "w") as script_file:
+        script_file.write(script)
+    return f"sh {path}"
+
+
+@async_test
+async def test_collect_in_parallel(args):
+    bundle_path = os.path.join(work_dir, "bundle")
+    os.makedirs(bundle_path)
+    components = {
+        "slow": [make_command("slow1", 'sleep 0.5; echo slow > "$2/slow.txt"\n'),
+                 make_command("slow2", 'mkdir -p "$2/slow" && echo $1 > "$2/slow/id"\n')],
+        "fast": [make_command("fast", 'echo fast > "$2/fast.txt"\n')],
+        "stuck": [make_command("stuck", 'sleep 5\n')],
+        "broken": [make_command("broken", 'exit 3\n')],
+    }
+    collector = BundleCollector(BUNDLE_ID, "node1", "", bundle_path, 4, 1)
+    tar_path = os.path.join(work_dir, "bundle.tar.gz")
+    start = time.monotonic()
+    with mock.patch.object(ComponentsBundle, "publish_log") as publish_log:
+        with tarfile.open(tar_path, "w:gz") as tar:
+            summary = await collector.collect(components, tar)
+    collector.close()
+    # Components run concurrently, the stuck command is killed after 1s
+    assert_equal(time.monotonic() - start < 2.5, True)
+    assert_equal(publish_log.call_count, 2)
+
+    assert_equal(sorted(summary), ["broken", "fast", "slow", "stuck"])
+    assert_equal(summary["slow"]["Status"], "Success")
+    assert_equal(len(summary["slow"]["Commands"]), 2)
+    assert_equal(summary["slow"]["Duration"] >= 0.5, True)
+    assert_equal(summary["stuck"]["Status"], "Error")
+    assert_equal(summary["stuck"]["Commands"][0]["Timed Out"], True)
+    assert_equal(summary["broken"]["Commands"][0]["Return Code"], 3)
+    assert_equal(summary["broken"]["Commands"][0]["Timed Out"], False)
+
+    with tarfile.open(tar_path, "r:gz") as tar:
+        names = sorted(tar.getnames())
+        assert_equal(names, [f"{BUNDLE_ID}/fast.txt", f"{BUNDLE_ID}/slow",
+                             f"{BUNDLE_ID}/slow.txt", f"{BUNDLE_ID}/slow/id"])
+        assert_equal(tar.extractfile(f"{BUNDLE_ID}/slow/id").read(), b"SB123\n")
+    # Collected files are removed once they are in the tar
+    assert_equal(os.listdir(bundle_path), [])
+
+
+def init(args):
+    global work_dir
+    if work_dir is not None:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir = tempfile.mkdtemp()
+
+
+test_list = [
+    test_collect_in_parallel,
+]
@@ -158,6 +158,43 @@ async def test_local_email_queue():
         server_thread.abort()
         server_thread.join()
 
+async def test_local_bulk_email_queue():
+    """
+    Check if EmailSenderQueue delivers a bulk email over pooled connections
+    without modifying the message
+    """
+    queue_plugin = EmailSenderQueue(workers=2)
+    await queue_plugin.start_worker()
+
+    queue = Queue()
+    server_thread = TestSMTPThread(queue)
+    server_thread.start()
+
+    config = SmtpServerConfiguration()
+    config.smtp_host = "localhost"
+    config.smtp_login = None
+    config.smtp_use_ssl = False
+    try:
+        config.smtp_port = server_thread.get_port()
+        message = EmailSender.make_multipart(TEST_SENDER, None,
+            TEST_SUBJECT, TEST_HTML_BODY, TEST_PLAIN_BODY)
+        recipients = [f"to{i}@mail.com" for i in range(120)]
+        await queue_plugin.enqueue_bulk_email(message, recipients, config)
+        await queue_plugin.enqueue_bulk_email(message, recipients[:1], config)
+        await queue_plugin.join_worker()
+
+        for _ in range(4):
+            queue.get(True, 0.5)  # half second timeout
+        t.assertIsNone(message['To'])
+        t.assertIsNone(message['Bcc'])
+        t.assertLessEqual(len(queue_plugin._get_pool(config)), 2)
+    except Empty:
+        t.fail('Email messages were not delivered')
+    finally:
+        await queue_plugin.stop_worker()
+        server_thread.abort()
+        server_thread.join()
+
 async def test_local_email_wo_server():
     config = SmtpServerConfiguration()
     config.smtp_host = "localhost"
@@ -180,6 +217,7 @@ def run_tests(args = {}):
     loop = asyncio.get_event_loop()
     loop.run_until_complete(test_local_multipart_email())
     loop.run_until_complete(test_local_email_queue())
+    loop.run_until_complete(test_local_bulk_email_queue())
     loop.run_until_complete(test_local_email_wo_server())
 
 test_list = [run_tests]
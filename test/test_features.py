@@ -0,0 +1,103 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import re
+import sys
+import time
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.features import FeatureEndpointMap, FeatureSupportCache
+from csm.common.payload import Json
+
+FEATURE_ENDPOINT_MAPPING_SCHEMA = os.path.join(os.path.dirname(__file__), '..',
+                                               'schema', 'feature_endpoint_mapping.json')
+
+
+class MockFeaturesDB:
+    def __init__(self, unsupported):
+        self.unsupported = unsupported
+        self.queries = 0
+
+    async def is_feature_supported(self, component, feature):
+        self.queries += 1
+        return (component, feature) not in self.unsupported
+
+
+def scan_feature_endpoints(feature_endpoint_map, path):
+    for key, value in feature_endpoint_map.items():
+        if re.search(f'^{key}$'.replace("*", r"[\w\d]*"), path):
+            return value
+
+
+def test_feature_endpoint_map(args):
+    feature_endpoint_map = Json(FEATURE_ENDPOINT_MAPPING_SCHEMA).load()
+    endpoints = FeatureEndpointMap(feature_endpoint_map)
+    assert_equal(len(endpoints), len(feature_endpoint_map))
+    paths = ['/api/v1/unknown', '/api/v1/alerts/', '/api/v1/alerts/a/b']
+    for key in feature_endpoint_map:
+        paths.append(key)
+        paths.append(key.replace('*', 'id_1'))
+        paths.append(key + '/extra')
+    for path in paths:
+        assert_equal(endpoints.get(path), scan_feature_endpoints(feature_endpoint_map, path))
+
+
+def test_feature_endpoint_map_order(args):
+    feature_endpoint_map = {
+        "/api/v1/items/*": {"feature_name": "wildcard"},
+        "/api/v1/items/all": {"feature_name": "exact"},
+        "/api/v1/other/all": {"feature_name": "exact"},
+        "/api/v1/other/*": {"feature_name": "wildcard"},
+    }
+    endpoints = FeatureEndpointMap(feature_endpoint_map)
+    assert_equal(endpoints.get("/api/v1/items/all")["feature_name"], "wildcard")
+    assert_equal(endpoints.get("/api/v1/other/all")["feature_name"], "exact")
+    assert_equal(endpoints.get("/api/v1/other/1")["feature_name"], "wildcard")
+
+
+@async_test
+async def test_feature_support_cache(args):
+    features_db = MockFeaturesDB({("sspl", "alerts")})
+    cache = FeatureSupportCache(300, features_db)
+    for _ in range(3):
+        assert_equal(await cache.is_feature_supported("sspl", "alerts"), False)
+        assert_equal(await cache.is_feature_supported("csm", "alerts"), True)
+    assert_equal(features_db.queries, 2)
+
+    features_db.unsupported.clear()
+    expired = time.monotonic() + 301
+    with mock.patch('csm.common.features.time.monotonic', return_value=expired):
+        assert_equal(await cache.is_feature_supported("sspl", "alerts"), True)
+        assert_equal(await cache.is_feature_supported("csm", "alerts"), True)
+    assert_equal(features_db.queries, 4)
+
+    cache = FeatureSupportCache(0, features_db)
+    await cache.is_feature_supported("sspl", "alerts")
+    await cache.is_feature_supported("sspl", "alerts")
+    assert_equal(features_db.queries, 6)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_feature_endpoint_map,
+    test_feature_endpoint_map_order,
+    test_feature_support_cache,
+]
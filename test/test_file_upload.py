@@ -0,0 +1,195 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import time
+import errno
+import asyncio
+import hashlib
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.errors import CsmNotFoundError, InvalidRequest
+from csm.core.blogic import const
+from csm.core.controllers.view import CsmView
+from csm.core.controllers.hotfix_update import HotFixUploadSchema
+from csm.core.services.file_transfer import FileCache, FileRef, UploadSessionManager
+from marshmallow import ValidationError
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+
+
+async def chunks(data, size=64 * 1024, fail_after=None):
+    for offset in range(0, len(data), size):
+        if fail_after is not None and offset >= fail_after:
+            raise ConnectionResetError()
+        yield data[offset:offset + size]
+
+
+@async_test
+async def test_cache_and_save_file(args):
+    with tempfile.TemporaryDirectory() as tmp, FileCache() as cache:
+        cache.cache_dir = tmp
+        file_uuid = cache.cache_new_file('iso')
+        async for chunk in chunks(CONTENT, 100000):
+            await cache.write_chunk_async(file_uuid, chunk)
+        await cache.write_chunk_async(file_uuid, b'')
+        assert_equal(cache.get_sha256(file_uuid), hashlib.sha256(CONTENT).hexdigest())
+
+        ref = FileRef(file_uuid, tmp, cache.get_sha256(file_uuid))
+        path = ref.save_file(os.path.join(tmp, 'store'), 'package.iso')
+        path = ref.save_file(os.path.join(tmp, 'store'), 'package.iso', True)
+        with open(path, 'rb') as saved:
+            assert_equal(saved.read() == CONTENT, True)
+        # Hard linked rather than copied, no temporary file is left over
+        assert_equal(os.stat(path).st_ino, os.stat(ref.get_file_path()).st_ino)
+        assert_equal(os.listdir(os.path.join(tmp, 'store')), ['package.iso'])
+
+
+@async_test
+async def test_resumable_upload(args):
+    with tempfile.TemporaryDirectory() as tmp, FileCache() as cache:
+        cache.cache_dir = tmp
+        uploads = UploadSessionManager(os.path.join(tmp, 'uploads'))
+        upload_id = uploads.create('package.iso', len(CONTENT))['upload_id']
+
+        try:
+            await uploads.append(upload_id, 0, chunks(CONTENT, fail_after=1024 * 1024))
+        except ConnectionResetError:
+            pass
+        offset = uploads.get(upload_id)['offset']
+        assert_equal(offset, 1024 * 1024)
+        try:
+            await uploads.append(upload_id, 0, chunks(CONTENT))
+            assert_equal(True, False)
+        except InvalidRequest:
+            pass
+        try:
+            await uploads.take(upload_id, cache)
+            assert_equal(True, False)
+        except InvalidRequest:
+            pass
+
+        upload = await uploads.append(upload_id, offset, chunks(CONTENT[offset:]))
+        assert_equal(upload['offset'], len(CONTENT))
+        assert_equal(upload['sha256'], hashlib.sha256(CONTENT).hexdigest())
+        ref = await uploads.take(upload_id, cache)
+        assert_equal(ref.sha256, upload['sha256'])
+        with open(ref.get_file_path(), 'rb') as uploaded:
+            assert_equal(uploaded.read() == CONTENT, True)
+
+
+@async_test
+async def test_upload_kept_until_adopted(args):
+    with tempfile.TemporaryDirectory() as tmp, FileCache() as cache:
+        cache.cache_dir = tmp
+        uploads = UploadSessionManager(os.path.join(tmp, 'uploads'))
+        upload_id = uploads.create('package.iso', len(CONTENT))['upload_id']
+        await uploads.append(upload_id, 0, chunks(CONTENT))
+
+        with mock.patch('csm.core.services.file_transfer.os.replace',
+                        side_effect=PermissionError()):
+            try:
+                await uploads.take(upload_id, cache)
+                assert_equal(True, False)
+            except PermissionError:
+                pass
+        assert_equal(uploads.get(upload_id)['offset'], len(CONTENT))
+
+        # The upload directory is on another file system than the cache
+        with mock.patch('csm.core.services.file_transfer.os.replace',
+                        side_effect=OSError(errno.EXDEV, 'Invalid cross-device link')):
+            ref = await uploads.take(upload_id, cache)
+        with open(ref.get_file_path(), 'rb') as uploaded:
+            assert_equal(uploaded.read() == CONTENT, True)
+        assert_equal(os.listdir(os.path.join(tmp, 'uploads')), [])
+        assert_equal(len(uploads._sessions), 0)
+
+
+@async_test
+async def test_upload_filename_validated_first(args):
+    with tempfile.TemporaryDirectory() as tmp, FileCache() as cache:
+        cache.cache_dir = tmp
+        uploads = UploadSessionManager(os.path.join(tmp, 'uploads'))
+        upload_id = uploads.create('package.txt', len(CONTENT))['upload_id']
+        await uploads.append(upload_id, 0, chunks(CONTENT))
+
+        async def _json():
+            return {'upload_id': upload_id}
+
+        request = mock.MagicMock(content_type='application/json', json=_json,
+                                 app={const.UPLOAD_SERVICE: uploads})
+        try:
+            await CsmView.parse_upload_request(None, request, cache, 'package',
+                                               HotFixUploadSchema())
+            assert_equal(True, False)
+        except ValidationError:
+            pass
+        assert_equal((uploads.get(upload_id)['offset'], cache.files_uuids),
+                     (len(CONTENT), []))
+
+
+@async_test
+async def test_upload_sweep(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        upload_dir = os.path.join(tmp, 'uploads')
+        uploads = UploadSessionManager(upload_dir, session_timeout=60)
+        expired_id = uploads.create('old.iso', len(CONTENT))['upload_id']
+        upload_id = uploads.create('package.iso', len(CONTENT))['upload_id']
+        uploads._sessions[expired_id].updated = time.monotonic() - 120
+        # Left over by a restart
+        open(os.path.join(upload_dir, 'stale'), 'wb').close()
+
+        uploads.sweep()
+        assert_equal(os.listdir(upload_dir), [upload_id])
+        assert_equal(list(uploads._sessions), [upload_id])
+
+
+@async_test
+async def test_concurrent_take(args):
+    with tempfile.TemporaryDirectory() as tmp, FileCache() as cache:
+        cache.cache_dir = tmp
+        uploads = UploadSessionManager(os.path.join(tmp, 'uploads'))
+        upload_id = uploads.create('package.iso', len(CONTENT))['upload_id']
+        await uploads.append(upload_id, 0, chunks(CONTENT))
+
+        results = await asyncio.gather(uploads.take(upload_id, cache),
+                                       uploads.take(upload_id, cache),
+                                       return_exceptions=True)
+        assert_equal(sorted(type(result).__name__ for result in results),
+                     ['CsmNotFoundError', 'FileRef'])
+        assert_equal(len(cache.files_uuids), 1)
+        try:
+            await uploads.append(upload_id, len(CONTENT), chunks(b''))
+            assert_equal(True, False)
+        except CsmNotFoundError:
+            pass
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_cache_and_save_file,
+    test_resumable_upload,
+    test_upload_kept_until_adopted,
+    test_upload_filename_validated_first,
+    test_upload_sweep,
+    test_concurrent_take,
+]
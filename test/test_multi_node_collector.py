@@ -0,0 +1,157 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import io
+import os
+import sys
+import time
+import socket
+import shutil
+import tarfile
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal
+from unittest import mock
+from csm.common.comm import LoopbackChannel, SSHChannel
+from csm.common.errors import CsmError
+from csm.common.file_collector import MultiNodeFileCollector
+
+work_dir = None
+
+
+class UnreachableChannel(LoopbackChannel):
+    def connect(self):
+        raise CsmError(-1, 'can not connect to host %s' % self._node)
+
+
+def channel_factory(node, user):
+    if node == "unreachable":
+        return UnreachableChannel(node, user)
+    return LoopbackChannel(node, user)
+
+
+class WindowedSession:
+    """
+    Paramiko channel whose output is held back while the error output is
+    not read, like a remote command blocked on a full channel window.
+    """
+    def __init__(self, output, errors):
+        self.output = list(output)
+        self.errors = list(errors)
+
+    def settimeout(self, timeout):
+        pass
+
+    def exec_command(self, command):
+        pass
+
+    def recv(self, size):
+        if len(self.errors) > 1:
+            raise socket.timeout()
+        return self.output.pop(0) if self.output else b''
+
+    def recv_stderr_ready(self):
+        return bool(self.errors)
+
+    def recv_stderr(self, size):
+        return self.errors.pop(0) if self.errors else b''
+
+    def recv_exit_status(self):
+        return 2
+
+    def close(self):
+        pass
+
+
+def make_rules():
+    logs = os.path.join(work_dir, "logs")
+    os.makedirs(logs)
+    for name in ("a.log", "b.log", "c.txt"):
+        with open(os.path.join(logs, name), "w") as log:
+            log.write(name * 1000)
+    return {
+        "s3server": {
+            "commands": ["sleep 0.3", "echo collected"],
+            "files": [os.path.join(logs, "*.log"), os.path.join(logs, "missing")]
+        },
+        "motr": {
+            "commands": None,
+            "files": [os.path.join(logs, "c.txt")]
+        }
+    }
+
+
+def test_multi_node_collect(args):
+    rules = make_rules()
+    target = os.path.join(work_dir, "bundle")
+    updates = []
+    collector = MultiNodeFileCollector(rules, target, max_nodes=2,
+        channel_factory=channel_factory,
+        progress=lambda node, state: updates.append((node, state["status"])))
+    nodes = ["node1", "node2", "node3", "node4", "unreachable"]
+    start = time.monotonic()
+    progress = collector.collect(nodes, ["s3server", "motr"])
+    duration = time.monotonic() - start
+    # Two nodes at a time, every node sleeps 0.3s, one by one would take 1.2s
+    assert_equal(0.6 <= duration < 1.1, True)
+
+    assert_equal(progress["unreachable"]["status"], MultiNodeFileCollector.FAILED)
+    assert_equal("can not connect" in progress["unreachable"]["error"], True)
+    for node in nodes[:-1]:
+        assert_equal(progress[node]["status"], MultiNodeFileCollector.DONE)
+        assert_equal(progress[node]["bytes"] > 0, True)
+        assert_equal((node, MultiNodeFileCollector.COLLECTING) in updates, True)
+        with tarfile.open(os.path.join(target, node, "s3server", "files.tgz")) as tar:
+            names = sorted(os.path.basename(name) for name in tar.getnames())
+        assert_equal(names, ["a.log", "b.log"])
+        with tarfile.open(os.path.join(target, node, "motr", "files.tgz")) as tar:
+            assert_equal([os.path.basename(name) for name in tar.getnames()], ["c.txt"])
+        with open(os.path.join(target, node, "s3server", "summary.txt")) as summary:
+            assert_equal("collected" in summary.read(), True)
+    assert_equal(os.path.exists(os.path.join(target, "unreachable", "s3server")), False)
+
+
+def test_invalid_rules(args):
+    try:
+        MultiNodeFileCollector(None, work_dir, max_nodes=1)
+        raise AssertionError("MultiNodeFileCollector accepts None collection rules")
+    except CsmError:
+        pass
+
+
+def test_ssh_stream_drains_errors(args):
+    session = WindowedSession([b'out1', b'out2'], [b'err%d ' % i for i in range(5)])
+    channel = SSHChannel('node1', 'root')
+    channel._ssh = mock.Mock()
+    channel._ssh.get_transport.return_value.open_session.return_value = session
+    stream = io.BytesIO()
+    rc, error = channel.recv_stream('tar czf - /var/log', stream)
+    assert_equal((rc, stream.getvalue(), error),
+                 (2, b'out1out2', 'err0 err1 err2 err3 err4 '))
+
+
+def init(args):
+    global work_dir
+    if work_dir is not None:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir = tempfile.mkdtemp()
+
+
+test_list = [
+    test_multi_node_collect,
+    test_invalid_rules,
+    test_ssh_stream_drains_errors,
+]
@@ -16,6 +16,8 @@
 from csm.test.common import assert_equal
 from csm.common.permission_names import Resource, Action
 from csm.core.services.permissions import PermissionSet
+from csm.core.services.roles import RoleManager
+from csm.test.common import async_test
 
 
 def test_permissions_union(*args):
@@ -64,6 +66,44 @@ def test_permissions_intersection(*args):
     assert_equal(calculated, expected)
 
 
+def test_permissions_subset(*args):
+    granted = PermissionSet({
+        Resource.ALERTS: {Action.LIST, Action.UPDATE},
+        Resource.USERS: {Action.LIST}
+    })
+
+    assert_equal(PermissionSet({Resource.ALERTS: {Action.LIST}}).issubset(granted), True)
+    assert_equal(PermissionSet().issubset(granted), True)
+    assert_equal(PermissionSet({Resource.ALERTS: {Action.DELETE}}).issubset(granted), False)
+    assert_equal(PermissionSet({Resource.STATS: {Action.LIST}}).issubset(granted), False)
+    assert_equal(granted.as_dict(), {
+        Resource.ALERTS: {Action.LIST, Action.UPDATE},
+        Resource.USERS: {Action.LIST}
+    })
+
+
+@async_test
+async def test_effective_permissions(*args):
+    role_manager = RoleManager({
+        'monitor': {'permissions': {Resource.ALERTS: [Action.LIST]}},
+        'manage': {'permissions': {Resource.USERS: [Action.LIST, Action.CREATE]}}
+    })
+    expected = PermissionSet({
+        Resource.ALERTS: {Action.LIST},
+        Resource.USERS: {Action.LIST, Action.CREATE}
+    })
+
+    permissions = await role_manager.calc_effective_permissions('monitor', 'manage')
+    assert_equal(permissions, expected)
+    permissions |= PermissionSet({Resource.STATS: {Action.LIST}})
+    permissions = await role_manager.calc_effective_permissions('manage', 'monitor')
+    assert_equal(permissions, expected)
+
+    await role_manager.delete_role('manage')
+    permissions = await role_manager.calc_effective_permissions('monitor', 'manage')
+    assert_equal(permissions, PermissionSet({Resource.ALERTS: {Action.LIST}}))
+
+
 def init(args):
     pass
 
@@ -71,4 +111,6 @@ def init(args):
 test_list = [
     test_permissions_union,
     test_permissions_intersection,
+    test_permissions_subset,
+    test_effective_permissions,
 ]
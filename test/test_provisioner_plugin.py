@@ -0,0 +1,89 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import asyncio
+import time
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.plugins.cortx.provisioner import ProvisionerPlugin
+
+
+class MockProvisioner:
+    class errors:
+        class ProvisionerError(Exception):
+            pass
+
+        class PrvsnrCmdNotFinishedError(ProvisionerError):
+            pass
+
+        class PrvsnrCmdNotFoundError(ProvisionerError):
+            pass
+
+        class SaltCmdResultError(ProvisionerError):
+            pass
+
+    def __init__(self):
+        self.calls = []
+
+    def get_cluster_id(self):
+        self.calls.append('get_cluster_id')
+        time.sleep(0.05)
+        return 'cluster-1'
+
+    def get_result(self, query_id):
+        self.calls.append(query_id)
+        time.sleep(0.05)
+        raise self.errors.PrvsnrCmdNotFinishedError('in progress')
+
+
+def make_plugin():
+    with mock.patch('csm.plugins.cortx.provisioner.provisioner', MockProvisioner()), \
+            mock.patch('csm.plugins.cortx.provisioner.Conf') as conf:
+        conf.get.side_effect = lambda index, key, default=None: default
+        return ProvisionerPlugin()
+
+
+@async_test
+async def test_cluster_id_cached(args):
+    plugin = make_plugin()
+    ids = await asyncio.gather(*(plugin.get_cluster_id() for _ in range(5)))
+    assert_equal(ids, ['cluster-1'] * 5)
+    assert_equal(await plugin.get_cluster_id(), 'cluster-1')
+    assert_equal(plugin.provisioner.calls, ['get_cluster_id'])
+
+
+@async_test
+async def test_job_status_deduplicated(args):
+    plugin = make_plugin()
+    await asyncio.gather(*(plugin.get_provisioner_job_status(query_id)
+                           for query_id in ('1', '1', '2', '1')))
+    assert_equal(sorted(plugin.provisioner.calls), ['1', '2'])
+    # Statuses are not cached
+    await plugin.get_provisioner_job_status('1')
+    assert_equal(sorted(plugin.provisioner.calls), ['1', '1', '2'])
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_cluster_id_cached,
+    test_job_status_deduplicated,
+]
@@ -0,0 +1,96 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+from unittest import mock
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.permission_names import Resource, Action
+from csm.core.agent.api import CsmRestApi
+from csm.core.controllers.view import CsmView, CsmAuth
+from csm.core.services.permissions import PermissionSet
+
+LIST_ALERTS = PermissionSet({Resource.ALERTS: {Action.LIST}})
+
+
+class AlertsView(CsmView):
+    @CsmAuth.permissions({Resource.ALERTS: {Action.LIST}})
+    async def get(self):
+        return {}
+
+    @CsmAuth.public
+    async def post(self):
+        return {}
+
+
+@CsmAuth.public
+async def version_handler(request):
+    return {}
+
+
+def make_app():
+    app = web.Application()
+    app.router.add_view('/api/v1/alerts', AlertsView)
+    app.router.add_get('/api/v1/version', version_handler)
+    return app
+
+
+async def make_request(app, method, path):
+    request = make_mocked_request(method, path, app=app)
+    request._match_info = await app.router.resolve(request)
+    return request
+
+
+@async_test
+async def test_route_auth(args):
+    app = make_app()
+    CsmRestApi._set_routes_auth(app)
+    request = await make_request(app, 'GET', '/api/v1/alerts')
+    assert_equal(CsmRestApi._is_public(request), False)
+    assert_equal(CsmRestApi._get_permissions(request), LIST_ALERTS)
+    request = await make_request(app, 'POST', '/api/v1/alerts')
+    assert_equal(CsmRestApi._is_public(request), True)
+    request = await make_request(app, 'GET', '/api/v1/version')
+    assert_equal(CsmRestApi._is_public(request), True)
+    assert_equal(CsmRestApi._get_permissions(request), PermissionSet())
+
+    # Handlers are not introspected any more once the routes are prepared
+    with mock.patch.object(CsmView, 'is_public') as is_public:
+        request = await make_request(app, 'GET', '/api/v1/alerts')
+        assert_equal(CsmRestApi._is_public(request), False)
+        assert_equal(is_public.called, False)
+
+
+@async_test
+async def test_route_auth_unknown_route(args):
+    app = make_app()
+    CsmRestApi._set_routes_auth(app)
+    request = await make_request(app, 'GET', '/api/v1/unknown')
+    assert_equal(CsmRestApi._is_public(request), False)
+    assert_equal(CsmRestApi._get_permissions(request), PermissionSet())
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_route_auth,
+    test_route_auth_unknown_route,
+]
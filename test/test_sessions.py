@@ -0,0 +1,126 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+from datetime import timedelta
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.permission_names import Resource, Action
+from csm.core.services.permissions import PermissionSet
+from csm.core.services.sessions import (SessionManager, LoginService, LocalCredentials,
+                                        S3Credentials, DbSessionStorage)
+
+PERMISSIONS = PermissionSet({Resource.ALERTS: {Action.LIST}})
+
+
+def make_login_service(session_manager):
+    return LoginService(None, None, None, session_manager)
+
+
+@async_test
+async def test_sessions_by_user(args):
+    session_manager = SessionManager()
+    admin = await session_manager.create(LocalCredentials('Admin'), PERMISSIONS)
+    await session_manager.create(LocalCredentials('monitor'), PERMISSIONS)
+    s3_session = await session_manager.create(
+        S3Credentials('s3user', 'access', 'secret', 'token'), PERMISSIONS)
+    await session_manager.create(LocalCredentials('s3USER'), PERMISSIONS)
+
+    login_service = make_login_service(session_manager)
+    assert_equal(await login_service.get_temp_access_keys('S3User'), ['access'])
+    sessions = await session_manager.get_by_user('admin')
+    assert_equal([s.session_id for s in sessions], [admin.session_id])
+
+    await login_service.delete_all_sessions(s3_session.session_id)
+    assert_equal(await session_manager.get_by_user('s3user'), [])
+    assert_equal(len(await session_manager.get_all()), 2)
+
+
+@async_test
+async def test_expired_sessions_sweep(args):
+    session_manager = SessionManager()
+    expiry_interval = session_manager.expiry_interval
+    session_manager._expiry_interval = timedelta(minutes=-1)
+    sessions = [await session_manager.create(LocalCredentials(f'user{i}'), PERMISSIONS)
+                for i in range(3)]
+    session_manager._expiry_interval = expiry_interval
+    sessions.append(await session_manager.create(LocalCredentials('user3'), PERMISSIONS))
+    # A session refreshed after it was put in the expiry heap is kept
+    await session_manager.refresh(sessions[0])
+    await session_manager.delete(sessions[1].session_id)
+
+    await session_manager.delete_expired()
+    remaining = await session_manager.get_all()
+    assert_equal({s.session_id for s in remaining},
+                 {sessions[0].session_id, sessions[3].session_id})
+    assert_equal(await session_manager.get_by_user('user2'), [])
+    assert_equal(len(session_manager._stg._expiry_heap), 2)
+
+
+class MockInvalidToken(Exception):
+    pass
+
+
+class MockCipher:
+    """ Reversible stand-in for cortx Cipher """
+
+    @staticmethod
+    def encrypt(key, data):
+        return key + bytes(reversed(data))
+
+    @staticmethod
+    def decrypt(key, data):
+        if not data.startswith(key):
+            raise MockInvalidToken('invalid key')
+        return bytes(reversed(data[len(key):]))
+
+
+def test_db_session_model(args):
+    session_manager = SessionManager()
+    storage = DbSessionStorage(None, b'key:')
+    with mock.patch('csm.core.services.sessions.Cipher', MockCipher), \
+            mock.patch('csm.core.services.sessions.CipherInvalidToken', MockInvalidToken):
+        for credentials in (LocalCredentials('Admin'),
+                            S3Credentials('s3user', 'access', 'secret', 'token')):
+            expiry_time = session_manager.calc_expiry_time()
+            model = storage._to_model(type('Session', (), {
+                'session_id': '1', 'credentials': credentials,
+                'permissions': PERMISSIONS, 'expiry_time': expiry_time}))
+            session = storage._from_model(model)
+            assert_equal(type(session.credentials), type(credentials))
+            assert_equal(session.credentials.user_id, credentials.user_id)
+            assert_equal(session.permissions, PERMISSIONS)
+            assert_equal(session.expiry_time, expiry_time)
+        assert_equal(session.credentials.secret_key, 'secret')
+        assert_equal(session.credentials.session_token, 'token')
+        # Secrets are not stored in plaintext
+        assert_equal('secret' in model.secret_key, False)
+        assert_equal('token' in model.session_token, False)
+        # A session that can not be decrypted any more is dropped
+        assert_equal(DbSessionStorage(None, b'other:')._from_models([model]), [])
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_sessions_by_user,
+    test_expired_sessions_sweep,
+    test_db_session_model,
+]
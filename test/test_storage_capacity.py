@@ -0,0 +1,70 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import json
+import asyncio
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from csm.test.common import assert_equal, async_test
+from csm.core.blogic import const
+from csm.core.services.storage_capacity import StorageCapacityService
+
+
+class MockSubprocess:
+    runs = 0
+    free = 400
+
+    def __init__(self, cmd):
+        pass
+
+    async def run(self):
+        MockSubprocess.runs += 1
+        await asyncio.sleep(0.01)
+        stats = {const.TOTAL_SPACE: 1000, const.FREE_SPACE: MockSubprocess.free}
+        return json.dumps({'filesystem': {'stats': stats}}).encode('utf-8'), b'', 0
+
+
+@async_test
+async def test_capacity_sampling(args):
+    MockSubprocess.runs = 0
+    service = StorageCapacityService(None, sample_period=60, history_size=3)
+    with mock.patch('csm.core.services.storage_capacity.AsyncioSubprocess', MockSubprocess):
+        results = await asyncio.gather(*(service.get_capacity_details() for _ in range(10)))
+        assert_equal(MockSubprocess.runs, 1)
+        assert_equal(results[0], {const.SIZE: 1000, const.USED: 600, const.AVAILABLE: 400,
+                                  const.USAGE_PERCENTAGE: 60.0,
+                                  const.UNIT: const.DEFAULT_CAPACITY_UNIT})
+        await service.get_capacity_details(unit='KB')
+        assert_equal(MockSubprocess.runs, 1)
+
+        for free in (300, 200, 100):
+            MockSubprocess.free = free
+            await service.refresh()
+        history = await service.get_capacity_history()
+        assert_equal([sample[const.USED] for sample in history], [700, 800, 900])
+        assert_equal((await service.get_capacity_details())[const.USED], 900)
+        assert_equal(MockSubprocess.runs, 4)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_capacity_sampling,
+]
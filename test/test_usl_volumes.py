@@ -0,0 +1,114 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import asyncio
+from unittest import mock
+from uuid import UUID
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.cache import TtlCache
+from csm.core.blogic import const
+from csm.core.services.usl import UslService
+from csm.plugins.cortx.s3_transport import S3Bucket
+
+DEVICE_UUID = UUID('2bf8a8c8-3b9a-4fd0-9c92-4b7e0a6cc2a4')
+
+
+class MockS3Client:
+    def __init__(self, tags):
+        self.tags = tags
+        self.running = 0
+        self.max_running = 0
+
+    async def get_all_buckets(self):
+        return [S3Bucket(name) for name in self.tags]
+
+    async def get_bucket_tagging(self, bucket_name):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return self.tags[bucket_name]
+
+
+class MockS3Plugin:
+    def __init__(self, client):
+        self.client = client
+
+    def get_s3_client(self, access_key, secret_key, config):
+        return self.client
+
+
+class MockCapacityService:
+    calls = 0
+
+    def __init__(self, provisioner):
+        pass
+
+    async def get_capacity_details(self):
+        MockCapacityService.calls += 1
+        return {const.SIZE: 100, const.USED: 10}
+
+
+def make_service(client):
+    service = UslService.__new__(UslService)
+    service._s3plugin = MockS3Plugin(client)
+    service._provisioner = None
+    service._storage_capacity_service = MockCapacityService(None)
+    service._device_uuid = DEVICE_UUID
+    service._volumes_cache = TtlCache(30)
+    service._volumes_generation = 0
+    service.friendly_name_calls = 0
+
+    async def get_system_friendly_name():
+        service.friendly_name_calls += 1
+        return 'cortx'
+    service._get_system_friendly_name = get_system_friendly_name
+    return service
+
+
+@async_test
+async def test_volume_list(args):
+    tags = {f'bucket{i}': {'udx': 'enabled'} if i % 2 else {} for i in range(40)}
+    client = MockS3Client(tags)
+    service = make_service(client)
+    MockCapacityService.calls = 0
+    with mock.patch('csm.core.services.usl.CsmS3ConfigurationFactory'):
+        volumes = await service._get_lyve_pilot_volume_list('key', 'secret')
+        assert_equal(sorted(v.bucketName for v in volumes.values()),
+                     sorted(name for name in tags if tags[name]))
+        assert_equal(next(iter(volumes.values())).name.startswith('cortx: bucket'), True)
+        assert_equal((service.friendly_name_calls, MockCapacityService.calls), (1, 1))
+        assert_equal(client.max_running > 1, True)
+
+        tags['bucket0'] = {'udx': 'enabled'}
+        volumes = await service._get_lyve_pilot_volume_list('key', 'secret')
+        assert_equal(len(volumes), 20)
+        service.invalidate_volumes('bucket0')
+        volumes = await service._get_lyve_pilot_volume_list('key', 'secret')
+        assert_equal(len(volumes), 21)
+        assert_equal(MockCapacityService.calls, 2)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_volume_list,
+]
@@ -0,0 +1,183 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import os
+import sys
+import asyncio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from csm.test.common import assert_equal, async_test
+from csm.common.broadcast import WebSocketBroadcaster
+
+
+class MockWebSocket:
+    def __init__(self, blocked=False, broken=False):
+        self.messages = []
+        self.blocked = asyncio.Event()
+        if not blocked:
+            self.blocked.set()
+        self.broken = broken
+        self.closed = False
+
+    async def send_str(self, data):
+        if self.broken:
+            raise ConnectionResetError()
+        await self.blocked.wait()
+        self.messages.append(data)
+
+    async def close(self, code=None, message=None):
+        self.closed = True
+
+
+class CountingSerializer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, msg):
+        self.calls += 1
+        return str(msg)
+
+
+@async_test
+async def test_serialized_once_per_message(args):
+    serializer = CountingSerializer()
+    broadcaster = WebSocketBroadcaster(serializer=serializer)
+    sockets = [MockWebSocket() for _ in range(3)]
+    for ws in sockets:
+        broadcaster.add_client(ws)
+    broadcaster.broadcast("alert", "alerts")
+    await asyncio.sleep(0)
+    assert_equal(serializer.calls, 1)
+    assert_equal([ws.messages for ws in sockets], [["alert"]] * 3)
+    await broadcaster.close()
+
+
+@async_test
+async def test_slow_and_broken_clients(args):
+    broadcaster = WebSocketBroadcaster(queue_size=2, serializer=str)
+    slow, broken, fast = MockWebSocket(blocked=True), MockWebSocket(broken=True), MockWebSocket()
+    slow_client = broadcaster.add_client(slow)
+    broadcaster.add_client(broken)
+    broadcaster.add_client(fast)
+    for i in range(5):
+        broadcaster.broadcast(i, "alerts")
+        await asyncio.sleep(0)
+    assert_equal(fast.messages, ["0", "1", "2", "3", "4"])
+    # The broken client is removed, the slow one keeps the latest messages
+    assert_equal(len(broadcaster), 2)
+    stats = broadcaster.stats()
+    assert_equal((stats["max_queue_depth"], stats["dropped"]), (2, 2))
+    slow.blocked.set()
+    await asyncio.sleep(0.01)
+    assert_equal(slow.messages, ["0", "3", "4"])
+    assert_equal(slow_client.dropped, 2)
+    await broadcaster.close()
+
+
+@async_test
+async def test_disconnect_policy_and_topics(args):
+    broadcaster = WebSocketBroadcaster(queue_size=1, policy='disconnect', serializer=str)
+    slow, health = MockWebSocket(blocked=True), MockWebSocket()
+    broadcaster.add_client(slow)
+    broadcaster.add_client(health, ["health"])
+    for i in range(3):
+        broadcaster.broadcast(i, "alerts")
+        await asyncio.sleep(0)
+    broadcaster.broadcast("ok", "health")
+    await asyncio.sleep(0.01)
+    assert_equal(slow.closed, True)
+    assert_equal(health.messages, ["ok"])
+    assert_equal(broadcaster.stats()["disconnected"], 1)
+    await broadcaster.close()
+
+
+def init(args):
+    pass
+
+
+@async_test
+async def test_plain_client_gets_alerts_only(args):
+    from aiohttp import web, ClientSession
+    from aiohttp.test_utils import TestServer
+    from csm.core.agent.api import CsmRestApi
+
+    CsmRestApi._broadcaster = WebSocketBroadcaster(serializer=str)
+    app = web.Application()
+    app.router.add_get("/ws", CsmRestApi.process_websocket)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with ClientSession() as session:
+            plain = await session.ws_connect(server.make_url("/ws"))
+            health = await session.ws_connect(server.make_url("/ws?topics=health,alerts"))
+            while len(CsmRestApi._broadcaster._clients) < 2:
+                await asyncio.sleep(0.01)
+            CsmRestApi._broadcaster.broadcast("delta", "health")
+            CsmRestApi._broadcaster.broadcast("alert", "alerts")
+            assert_equal((await plain.receive()).data, "alert")
+            assert_equal((await health.receive()).data, "delta")
+            assert_equal((await health.receive()).data, "alert")
+            await plain.close()
+            await health.close()
+    finally:
+        await CsmRestApi._broadcaster.close()
+        await server.close()
+
+
+@async_test
+async def test_push_from_any_thread(args):
+    from unittest import mock
+    from csm.core.agent.api import CsmRestApi
+    from csm.core.blogic import const
+
+    loop = asyncio.get_event_loop()
+    with mock.patch.object(CsmRestApi, "_app", mock.Mock(loop=loop), create=True), \
+            mock.patch.object(CsmRestApi, "_queue", asyncio.Queue(), create=True):
+        # On the loop the message is queued at once
+        CsmRestApi.push("alert")
+        assert_equal(CsmRestApi._queue.get_nowait(), ("alert", const.WEBSOCKET_TOPIC_ALERTS))
+        await loop.run_in_executor(None, CsmRestApi.push_health_delta, "delta")
+        assert_equal(await asyncio.wait_for(CsmRestApi._queue.get(), 1),
+                     ("delta", const.WEBSOCKET_TOPIC_HEALTH))
+
+
+@async_test
+async def test_stats_logged_when_changed(args):
+    from unittest import mock
+    from csm.core.agent.api import CsmRestApi
+
+    broadcaster = WebSocketBroadcaster(queue_size=1)
+    with mock.patch.object(CsmRestApi, "_broadcaster", broadcaster, create=True), \
+            mock.patch("csm.core.agent.api.Log") as log:
+        task = asyncio.ensure_future(CsmRestApi._websock_stats_bg(0.01))
+        await asyncio.sleep(0.05)
+        broadcaster.add_client(MockWebSocket(blocked=True))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.sleep(0)
+        logged = [call[0][0] for call in log.info.call_args_list]
+        assert_equal(len(logged), 2)
+        assert_equal("'clients': 1" in logged[1], True)
+        await broadcaster.close()
+
+
+test_list = [
+    test_serialized_once_per_message,
+    test_slow_and_broken_clients,
+    test_disconnect_policy_and_topics,
+    test_plain_client_gets_alerts_only,
+    test_push_from_any_thread,
+    test_stats_logged_when_changed,
+]